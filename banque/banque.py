@@ -1,208 +1,76 @@
-import json 
-import os 
-import datetime
-
 """
     Gestion de banque simple avec des comptes utilisateurs et des transactions basiques.
+
+    Ancien point d'entrée (python banque.py) : l'interface et les messages
+    d'origine, au-dessus du même moteur que le paquet (models.banque) :
+    comptes indexés par numéro, journal des mutations, soldes en centimes.
+    Les montants saisis ici sont en Fcfa.
 """
+from models.banque import Banque as MoteurBanque
+from models.compte_bancaire import CompteBancaire
+from models.montant import Montant
+from utils.validators import Validators
+from config.constants import SOLDE_MINIMUM
 
-# Recuperation du fichier JSON
+# Recuperation du fichier JSON (l'ancien format, soldes en Fcfa, est relu tel quel)
 BANQUE = "banque.json"
 
 # =================================================================
-# CLASSE COMPTE BANCAIRE
-# =================================================================
-
-class CompteBancaire :
-    """ Classe représentant le compte bancaire """
-
-    def __init__(self, titulaire, numero_compte, solde):
-        """
-            Constructeur de compte bancaire
-
-            Args :
-                titulaire : nom du proprietaire du compte
-                numero_compte : numéro unique du compte
-        """
-        self.__titulaire = titulaire
-        self.__numero_compte = numero_compte
-        self.__solde = solde # Solde initial du compte
-        self.historique = [] # Historique des transactions
-
-    # Convertit l'objet compte bancaire en fichier JSON
-    def to_dict(self):
-        return {
-            "titulaire" : self.__titulaire,
-            "numero_compte" : self.__numero_compte,
-            "solde" : self.__solde,
-        }
-
-    # Affichage standard
-    def __str__(self):
-        return f"\n Compte de : {self.__titulaire}, \n Numéro de compte : {self.__numero_compte}, \n Solde : {self.__solde} Fcfa."
-
-    # Déposer de l'argent sur le compte 
-    def deposer(self, montant, ) :
-        """
-            Déposer un montant sur le compte
-
-            Args :
-                montant : Montant à déposer
-        """
-        if montant > 0 :
-            self.__solde += montant
-            self.__enregistrer_transaction("Dépot", montant)
-            print(f" ✔ Dépot de {montant} Fcfa effectuée avec succès.")
-        else :
-            print(" ❗ Le montant du dépot ne doit pas etre négatif.")
-
-    # Rétirer de l'argent du compte 
-    def retirer(self, montant) :
-        """
-            Rétirer un montant sur le compte
-
-            Args :
-                Montant  : montant à retirer du compte
-        """
-        if montant > 0 :
-            if montant <= self.__solde :
-                self.__solde -= montant
-                self.__enregistrer_transaction("Retrait", montant)
-                print(f" ✔ Retrait de {montant} Fcfa effectuée avec succès.")
-            else :
-                print(" ❗ Fonds insuffisants pour effetuer un retrait")
-        else :
-            print(" ❗ Le montant doit etre positif.")
-
-    # Afficher le solde du compte 
-    def afficher_soldes(self) :
-        print(f"Le solde du compte No : {self.__numero_compte}, de Mme/M. {self.__titulaire}  est =  {self.__solde} Fcfa.")
-
-    # Avoir juste le solde
-    def get_solde(self):
-
-        return self.__solde
-
-    # Recuperer le numero de compte 
-    def get_numero_compte(self) :
-        return self.__numero_compte
-
-    # Recupere le titulaire du compte
-    def get_titulaire(self):
-        return self.__titulaire
-
-    # Avoir les informations du compte 
-    def get_infos(self) :
-        """
-            Avoir les informations sur un compte
-        """
-        print(" ======= INFORMATIONS DU COMPTE =========")
-        print(f"Titulaire : {self.__titulaire}")
-        print(f"Numero du compte : {self.__numero_compte}")
-        print(f"Solde du compte : {self.__solde}")
-
-    # Enregistrer une transaction dans l'historique
-    def __enregistrer_transaction(self, type_transaction, montant) :
-        """
-            Enregistrer une transaction du compte
-
-            Args :
-                Type_transaction : Renseigne sur le type de transaction ( Dépot / Rétrait )
-                Montant          : Montant de la transaction
-        """
-        transaction =  {
-            "type" : type_transaction,
-            "montant" : montant,
-            "date" : datetime.datetime.now().strftime("%d/%m/%Y %H:%M:%S"),
-            "solde_apres_transaction" : self.__solde
-        }
-
-        # Ajouter la transaction à l'historique
-        self.historique.append(transaction)
-
-    # Afficher l'historique des transactions
-    def afficher_historique(self) :
-        """ Avoir tout l'histotique des differentes transactions """
-
-        print(" ======= HISTORIQUE DES TRANSACTIONS =========")
-
-        # Vérifier si l'historique est vide
-        if not self.historique :
-            print(" ❌ Aucune transaction n'a été effectée.")
-
-        # Afficher les transactions
-        else :
-            print("\n" + "=" * 40)
-            print(f"\n Historique des transactions pour le compte No : {self.__numero_compte} ")
-            print("=" * 40)
-            for transaction in self.historique :
-                print(f"\n Date : {transaction['date']}, \n Type : {transaction['type']}, \n Montant: {transaction['montant']} Fcfa, \n Solde apres transaction : {transaction['solde_apres_transaction']} Fcfa.")
-                
-
-# =================================================================
-# CLASSE BANQUE 
+# CLASSE BANQUE
 # =================================================================
 
 class Banque :
     """ Classe qui représente la banque Banque """
 
-    def __init__(self, nom_banque):
+    def __init__(self, nom_banque, fichier=BANQUE):
         """
             Constructeur de la Banque
 
             Args :
                 nom_banque : représente le nom de la banque
+                fichier : fichier des comptes
         """
         self.nom_banque = nom_banque
-        self.__comptes = []
-        self.charger_compte()
+        self.moteur = MoteurBanque(nom_banque, fichier=fichier)
 
     def __str__(self):
         return f"Banque : {self.nom_banque}"
 
-    # Charger tous les comptes depuis le fichier JSON
-    def charger_compte(self):
-        """ Charger les comptes du fichier JSON """
-        try :
-            if os.path.exists(BANQUE) :
-                with open(BANQUE, 'r', encoding='utf-8' ) as compte:
-                    data = json.load(compte)
-                    for numero_compte, infos in data.items() :
-                        compte = CompteBancaire(
-                            infos['titulaire'],
-                            infos['numero_compte'],
-                            float(infos['solde'])
-                        )
-                        self.__comptes.append(compte)
-                print(f" le nombre de compte est : {len(self.__comptes)} chargé depuis {BANQUE}")
-            else :
-                print("Aucun compte trouvé")
-        except (json.JSONDecodeError, FileNotFoundError) as e :
-            print(f"Erreur de chargement {e}")
-
-    # Sauvegarder les cpmtes dans le fichier JSON
+    # Sauvegarder les comptes dans le fichier JSON
     def sauvegarder_comptes(self):
-        try :
-            data = {}
-            for compte in self.__comptes :
-                data[compte.get_numero_compte()] = compte.to_dict()
-
-            with open(BANQUE, 'w', encoding='utf-8') as fichier :
-                json.dump(data, fichier, indent=4, ensure_ascii=False)
-            print(f"{len(self.__comptes)} a bien été sauvegardé(s) dans {BANQUE}")
-            return True
-        except Exception as e :
-            print(f"Erreur de sauvegarde {e}")
-            return False
+        """ Réécrit l'instantané complet (chaque opération est déjà journalisée) """
+        return self.moteur.compacter()
+
+    # Fermer la banque
+    def fermer(self):
+        """ Compacte le journal et libère les fichiers """
+        self.moteur.fermer()
 
     # Ouvrir un compte
     def ouvrir_compte(self, compte : CompteBancaire):
         """ ouvrir un compte
                 Args:
-                    compte (CompteBancaire): ouvrir un compte dans la banque
+                    compte (CompteBancaire): ouvrir un compte dans la banque (solde en centimes)
         """
-        self.__comptes.append(compte)
-        print(f"Le commpte No : {compte.get_numero_compte()} a ete ouvert avec succes.")
+        succes, message = self.moteur.ouvrir_compte(
+            compte.get_titulaire(), compte.get_numero_compte(), compte.get_solde()
+        )
+        if succes :
+            print(f"Le commpte No : {compte.get_numero_compte()} a ete ouvert avec succes.")
+        else :
+            print(f" ❌ Erreur : {message}")
+        return succes
+
+    # Verifie si un titulaire a deja un compte (index des titulaires)
+    def __titulaire_existe(self, titulaire):
+        curseur = None
+        while True :
+            comptes, curseur = self.moteur.rechercher_titulaire(titulaire, curseur)
+            for compte in comptes :
+                if compte.get_titulaire() == titulaire :
+                    return compte
+            if curseur is None :
+                return None
 
     # Ouvrir un compte de façon interactif
     def ouvrir_compte_interactif(self) :
@@ -221,7 +89,7 @@ class Banque :
                     break
 
                 # Verifie si l'utilisateur n'entre rien
-                if not numero_compte :
+                if not Validators.valider_numero_compte(numero_compte) :
                     print("Erreur : le numero de compte ne peut pas etre vide.")
                     continue
 
@@ -229,36 +97,30 @@ class Banque :
                 titulaire = input("Entrez le nom du titulaire du compte : ").strip()
 
                 # verifie si l'utilisateur n'a rien entrer
-                if not titulaire :
+                if not Validators.valider_titulaire(titulaire) :
                     print("Il faut absolument le nom du titulaire du compte.")
                     continue
 
                 # Recuperer le solde
-                solde = float(input("Entrez le solde du compte : ").strip())
+                solde = Montant.depuis_fcfa(input("Entrez le solde du compte : ").strip())
 
-                # Verifie si l'utilisateur n'a rien entrer
-                if solde < 100 :
-                    print("Il faut au moins 100 Fcfa pour ouvrir votre compte ")
+                # Verifie le solde minimum
+                if not Validators.valider_solde(solde) :
+                    print(f"Il faut au moins {SOLDE_MINIMUM} Fcfa pour ouvrir votre compte ")
                     continue
 
-                #Vérification si le comte existe deja ou pas avant de creer
-                compte_existe = False
-                for compte in self.__comptes :
-                    if compte.get_numero_compte() == numero_compte or titulaire == compte.get_titulaire() :
-                        print(f" ❌ Erreur : le compte No {numero_compte} existe deja au nom de : {compte.get_titulaire()}")
-                        compte_existe = True
-                        break
-
-                if compte_existe :
+                #Vérification si le comte existe deja ou pas avant de creer (O(1) et index)
+                compte = self.moteur.chercher_compte(numero_compte) or self.__titulaire_existe(titulaire)
+                if compte :
+                    print(f" ❌ Erreur : le compte No {numero_compte} existe deja au nom de : {compte.get_titulaire()}")
                     continue # ✔ Retourne au début de la boucle while
 
-                # Creation de compte
-                nouveau_compte = CompteBancaire(titulaire, numero_compte, solde)
-
-                # Ajouter le compte a la banque
-                self.__comptes.append(nouveau_compte)
-                self.sauvegarder_comptes()
-                print(f" ✔ Le compte No : {numero_compte} pour {nouveau_compte.get_titulaire()} a été crée avec succès.")
+                # Creation du compte (sauvegardé par le journal)
+                succes, message = self.moteur.ouvrir_compte(titulaire, numero_compte, solde)
+                if not succes :
+                    print(f" ❌ Erreur : {message}")
+                    continue
+                print(f" ✔ Le compte No : {numero_compte} pour {titulaire} a été crée avec succès.")
 
                 # Conitinuer ou sortir
                 continuer = input("Voulez vous continuer ? (y/n) : ").strip()
@@ -270,10 +132,10 @@ class Banque :
 
     # Afficher tous les comptes
     def lister_tous_les_comptes(self):
-        """ Afficher tous les comptes """
+        """ Afficher tous les comptes, page par page """
 
         # Verifie si le compte existe ou pas
-        if not self.__comptes :
+        if not len(self.moteur) :
             print(f" ❌ Aucun compte disponible dans la banque : {self.nom_banque}")
             return
 
@@ -282,23 +144,28 @@ class Banque :
         print("=" * 50)
 
         # Recupere les informations des comptes
-        for compte in self.__comptes :
-            compte.get_infos()
-            print("-" * 50)
+        for page in self.moteur.parcourir_comptes() :
+            for compte in page :
+                compte.get_infos()
+                print("-" * 50)
 
-    # Chercher uun compte 
+    # Chercher un compte
     def chercher_compte(self, numero_compte) :
         """
-            Cherher un compte particulier
+            Cherher un compte particulier (O(1))
 
             Args :
                 numero_compte : numéro unique du compte à cherhcer
         """
+        return self.moteur.chercher_compte(numero_compte)
 
-        for compte in self.__comptes :
-            if compte.get_numero_compte() == numero_compte :
-                return compte 
-        return None
+    # Convertit un montant saisi en Fcfa
+    @staticmethod
+    def __centimes(montant):
+        try :
+            return Montant.depuis_fcfa(montant)
+        except ValueError :
+            return None
 
     #Effectuer un depot
     def effectuer_depot(self, numero_compte, montant) :
@@ -306,21 +173,27 @@ class Banque :
             Effectuer un depot sur un compte
 
             Args :
-                Montant : Montant à déposer sur le compte
+                Montant : Montant à déposer sur le compte (Fcfa)
                 numero_compte : numéro unique du compte
         """
 
-        # Recuperer le compte a travers son numero
-        compte = self.chercher_compte(numero_compte)
-
         # Si le compte n'existe pas
-        if not compte :
+        if not self.chercher_compte(numero_compte) :
             print(f" ❌ Erreur : le compte No {numero_compte} n'existe pas ")
-            return 
+            return False
 
-        # Si le compte existe, faire le depot
-        compte.deposer(montant)
-        self.sauvegarder_comptes() # ✔ Sauvegarder après modification
+        centimes = self.__centimes(montant)
+        if centimes is None or centimes <= 0 :
+            print(" ❗ Le montant du dépot ne doit pas etre négatif.")
+            return False
+
+        # Si le compte existe, faire le depot (✔ sauvegardé dans le journal)
+        succes, message = self.moteur.effectuer_depot(numero_compte, centimes)
+        if succes :
+            print(f" ✔ Dépot de {Montant.formater(centimes)} Fcfa effectuée avec succès.")
+        else :
+            print(f" ❗ {message}")
+        return succes
 
     #Effectuer un retrait
     def effectuer_retrait(self, numero_compte, montant) :
@@ -328,21 +201,27 @@ class Banque :
             Effectuer un retrait sur un compte
 
             Args :
-                montant : Montant à retirer sur le compte
+                montant : Montant à retirer sur le compte (Fcfa)
                 numero_compte : numéro unique du compte
                 """
-        # recuperer le compte par son numero
-        compte = self.chercher_compte(numero_compte)
-
         # si le compte n'existe pas
-        if compte == None :
+        if self.chercher_compte(numero_compte) is None :
             print(f"Le compte No {numero_compte} n'existe pas.")
-            return 
+            return False
+
+        centimes = self.__centimes(montant)
+        if centimes is None or centimes <= 0 :
+            print(" ❗ Le montant doit etre positif.")
+            return False
+
+        # Si le compte existe, faire le retrait (✔ sauvegardé dans le journal)
+        succes, _ = self.moteur.effectuer_retrait(numero_compte, centimes)
+        if succes :
+            print(f" ✔ Retrait de {Montant.formater(centimes)} Fcfa effectuée avec succès.")
+        else :
+            print(" ❗ Fonds insuffisants pour effetuer un retrait")
+        return succes
 
-        # Si le compte existe, faire le retrait
-        compte.retirer(montant)
-        self.sauvegarder_comptes() # ✔ Sauvegarder après modification
-        
     # Afficher les information d'un compte
     def afficher_infos_compte(self, numero_compte) :
         """
@@ -356,7 +235,7 @@ class Banque :
         compte = self.chercher_compte(numero_compte)
 
         # Si le compte n'existe pas
-        if compte == None :
+        if compte is None :
             print(f" ❌ Le compte au numero {numero_compte} n'existe pas.")
             return
 
@@ -365,17 +244,14 @@ class Banque :
 
     # Calcul total actif de la banque
     def calcul_total_actif(self):
-
-        total = 0
-        for compte in self.__comptes :
-            total += compte.get_solde()
-        return total
+        """ Total des soldes en Fcfa (tenu à jour à chaque opération, O(1)) """
+        return Montant.vers_fcfa(self.moteur.statistiques()["total_actifs"])
 
     # Obtenir les statistique de la banque
     def obtenir_statistique(self):
         print(f"Statistique de la banque : {self.nom_banque}")
         print("=" * 50)
-        print(f"Le Nombre de compte dans la banque : {len(self.__comptes)}")
+        print(f"Le Nombre de compte dans la banque : {len(self.moteur)}")
         print(f"Total des actifs : {self.calcul_total_actif()}")
         print("=" * 50)
 
@@ -385,41 +261,38 @@ class Banque :
            Faire le transfert d'un compte vers un autre
 
             Args :
-                Montant : Montant à déposer sur le compte
+                Montant : Montant à transférer (Fcfa)
                 numero_compte_source : numéro unique du compte qui doit faire le transfert
                 numero_compte_destinataire : numero unique du compte qui doit recevoir
         """
 
-        compte_source = self.chercher_compte(numero_compte_source)
-        compte_destinataire = self.chercher_compte(numero_compte_destinataire)
-
         # si le compte source n'existe pas
-        if compte_source is None :
+        if self.chercher_compte(numero_compte_source) is None :
             print(f" ❌ Le compte No {numero_compte_source} n'existe pas.")
-            return
+            return False
 
-        # Si le code source du destinataire n'existe pas
-        if compte_destinataire is None :
+        # Si le compte du destinataire n'existe pas
+        if self.chercher_compte(numero_compte_destinataire) is None :
             print(f" ❌ Le compte No {numero_compte_destinataire} n'existe pas.")
-            return
+            return False
 
         # Si le compte source est pareil que le compte du destinataire
         if numero_compte_source == numero_compte_destinataire :
             print(" ❌ Erreur : Impossible de faire le transfert au meme numero")
-            return
-
-        # Sauverader solde avant retrait
-        solde_avant = compte_source.get_solde()
+            return False
 
-        # tenter le retrait sur le compte source
-        compte_source.retirer(montant)
+        centimes = self.__centimes(montant)
+        if centimes is None or centimes <= 0 :
+            print(" ❗ Le montant doit etre positif.")
+            return False
 
-        # Verifie si le retrait a resussi ( si le solde a changer )
-        if compte_source.get_solde() < solde_avant :
-            # Le retrait a reussi, effectuer le depot
-            compte_destinataire.deposer(montant)
-            print(f" Transfert de {montant} Fcfa effectué de {numero_compte_source} vers {numero_compte_destinataire}")
-            self.sauvegarder_comptes()
+        # Retrait et dépot sous les verrous des deux comptes, une seule sauvegarde
+        succes, _ = self.moteur.transferer(numero_compte_source, numero_compte_destinataire, centimes)
+        if succes :
+            print(f" Transfert de {Montant.formater(centimes)} Fcfa effectué de {numero_compte_source} vers {numero_compte_destinataire}")
+        else :
+            print(" ❗ Fonds insuffisants pour effetuer un retrait")
+        return succes
 
     # Afficher l'historique des transactions
     def afficher_historique(self, numero_compte) :
@@ -429,17 +302,7 @@ class Banque :
             Args :
                 numero_compte : Numero unique du compte dont on veut avoir l'historique
         """
-
-        # recuperer le compte par son numero unique
-        compte = self.chercher_compte(numero_compte)
-
-        # si le compte n'existe pas
-        if compte == None :
-            print(f"Le compte No {numero_compte} n'existe pas.")
-            return
-
-        # si le compte existe alors afficher l'historique
-        compte.afficher_historique()
+        self.moteur.afficher_historique(numero_compte)
 
 # =================================================================
 # MAIN
@@ -450,18 +313,18 @@ if __name__ == "__main__":
         la partie execution
     """
 
-    # Creer une banque 
+    # Creer une banque
     ma_banque = Banque("Banque Nationale")
     print(ma_banque)
     print()
-        
-        
+
+
     while True :
-        
+
         print()
         print(" =======   GESTION DE COMPTE BANCAIRE =========")
         print()
-        
+
         print(" 1. 👉 Afficher tous les comptes ")
         print(" 2. ✔ Ouvrir un compte")
         print(" 3. 👍 Faire un dépot ")
@@ -471,7 +334,7 @@ if __name__ == "__main__":
         print(" 7. Afficher statistique de la banque ")
         print(" 8. Faire les transfers ")
         print(" 0  Quitter le programmme ")
-        
+
         print()
         # choix des differentes options du menu
         choice = input("Quel est votre besoin ? ")
@@ -481,7 +344,6 @@ if __name__ == "__main__":
         # Affiche tous les compte
         if choice == '1' :
             ma_banque.lister_tous_les_comptes()
-            #ma_banque.charger_compte()
 
         # Ouvrir un compte bancaire
         elif choice == '2' :
@@ -490,13 +352,13 @@ if __name__ == "__main__":
         # Faire un depot
         elif choice == '3' :
             numero_compte = input("Entrez le numero du compte que vous voulez utiliser : ").strip()
-            montant = int(input("Quel est le montant que vous souhaitez déposer : ").strip())
+            montant = input("Quel est le montant que vous souhaitez déposer : ").strip()
             ma_banque.effectuer_depot(numero_compte, montant)
 
         # Faire un retrait
         elif choice == '4' :
             numero_compte = input("Entrez le numero du compte que vous voulez utiliser : ").strip()
-            montant = int(input("Entrez le montant a retirer : ").strip())
+            montant = input("Entrez le montant a retirer : ").strip()
             ma_banque.effectuer_retrait(numero_compte, montant)
 
         # Afficher les information d'un compte
@@ -517,12 +379,11 @@ if __name__ == "__main__":
         elif choice == '8' :
             numero_compte_source = input("Entrez le numero du compte source :").strip()
             numero_compte_destinataire = input("Entrez le numero du compte du destintaire :").strip()
-            montant = int(input("Entrez le montant a transferer : ").strip())
+            montant = input("Entrez le montant a transferer : ").strip()
             ma_banque.transferer(numero_compte_source, numero_compte_destinataire, montant)
 
         # Quitter le programme
         elif choice == '0' :
+            ma_banque.fermer()
             print("Vous avez quiteer le programme.")
             break
-
-    
\ No newline at end of file
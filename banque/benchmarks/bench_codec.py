@@ -0,0 +1,81 @@
+"""
+    Benchmark : débit (Mo/s) de sauvegarde et de chargement d'un instantané
+    de la banque pour chaque codec JSON disponible, comparé à l'ancien
+    json.dump(indent=4), et pour le décodeur en flux.
+
+    Lancer depuis le dossier banque :
+        python -m benchmarks.bench_codec [nombre_comptes]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.generateur import numero
+from utils.codec_json import CODEC, CODECS, ecrire_objet, iterer_objet
+
+NOMBRE_COMPTES = 200_000
+
+
+def debit(taille, duree):
+    return taille / duree / 1e6
+
+
+def mesurer(nom, sauvegarder, charger, fichier):
+    """ Retourne (taille Mo, sauvegarde Mo/s, chargement Mo/s) """
+    debut = time.perf_counter()
+    sauvegarder(fichier)
+    duree_sauvegarde = time.perf_counter() - debut
+    taille = os.path.getsize(fichier)
+    debut = time.perf_counter()
+    charger(fichier)
+    duree_chargement = time.perf_counter() - debut
+    return nom, taille / 1e6, debit(taille, duree_sauvegarde), debit(taille, duree_chargement)
+
+
+def main():
+    nombre = int(sys.argv[1]) if len(sys.argv) > 1 else NOMBRE_COMPTES
+    data = {
+        numero(i): {"titulaire": f"Client {i}", "numero_compte": numero(i), "solde_centimes": i * 137}
+        for i in range(nombre)
+    }
+
+    def ancien_sauvegarder(fichier):
+        with open(fichier, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=4, ensure_ascii=False)
+
+    def ancien_charger(fichier):
+        with open(fichier, 'r', encoding='utf-8') as f:
+            json.load(f)
+
+    def flux_charger(fichier):
+        with open(fichier, 'rb') as f:
+            for _ in iterer_objet(f):
+                pass
+
+    mesures = []
+    with tempfile.TemporaryDirectory() as dossier:
+        fichier = os.path.join(dossier, "banque.json")
+        mesures.append(mesurer("json indent=4", ancien_sauvegarder, ancien_charger, fichier))
+        for nom, codec in CODECS.items():
+            def sauvegarder(chemin, codec=codec):
+                with open(chemin, 'wb') as f:
+                    ecrire_objet(f, data.items(), codec)
+
+            def charger(chemin, codec=codec):
+                with open(chemin, 'rb') as f:
+                    codec.decoder(f.read())
+
+            mesures.append(mesurer(nom, sauvegarder, charger, fichier))
+        mesures.append(mesurer("flux", lambda chemin: sauvegarder(chemin, CODEC), flux_charger, fichier))
+
+    print(f"{nombre} comptes")
+    print(f"{'Codec':>14} | {'Taille (Mo)':>11} | {'Sauvegarde (Mo/s)':>17} | {'Chargement (Mo/s)':>17}")
+    print("-" * 70)
+    for nom, taille, sauvegarde, chargement in mesures:
+        print(f"{nom:>14} | {taille:>11.1f} | {sauvegarde:>17.1f} | {chargement:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+    Benchmark : temps de démarrage de la Banque, chargement complet
+    ou paresseux (shards), puis latence de la première recherche.
+
+    Lancer depuis le dossier banque :
+        python -m benchmarks.bench_demarrage [tailles...]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.generateur import generer_fichier_banque
+from models.banque import Banque
+
+TAILLES = [10_000, 100_000, 1_000_000]
+
+
+def mesurer(fichier, numero, paresseux):
+    """ Retourne (démarrage, première recherche) en ms """
+    debut = time.perf_counter()
+    banque = Banque("Bench", fichier=fichier, paresseux=paresseux)
+    demarrage = time.perf_counter() - debut
+    debut = time.perf_counter()
+    banque.chercher_compte(numero)
+    recherche = time.perf_counter() - debut
+    banque.fermer()
+    return demarrage * 1e3, recherche * 1e3
+
+
+def main():
+    tailles = [int(t) for t in sys.argv[1:]] or TAILLES
+    with tempfile.TemporaryDirectory() as dossier:
+        print(f"{'Comptes':>10} | {'Mode':>9} | {'Démarrage (ms)':>15} | {'1re recherche (ms)':>18}")
+        print("-" * 62)
+        for taille in tailles:
+            fichier = os.path.join(dossier, f"banque_{taille}.json")
+            numeros = generer_fichier_banque(fichier, taille)
+            # Premier démarrage paresseux : répartition dans les shards
+            Banque("Bench", fichier=fichier, paresseux=True).fermer()
+            for paresseux in (False, True):
+                demarrage, recherche = mesurer(fichier, numeros[-1], paresseux)
+                mode = "paresseux" if paresseux else "complet"
+                print(f"{taille:>10} | {mode:>9} | {demarrage:>15.1f} | {recherche:>18.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+    Benchmark : détection de vélocité des retraits en flux.
+
+    1. Surcoût de l'écouteur sur CompteBancaire.deposer / retirer (µs par appel).
+    2. Débit du moteur de règles sur un flux simulé à 100k transactions / s
+       (horodatages espacés de 10 µs), réparties sur de nombreux comptes.
+
+    Lancer depuis le dossier banque :
+        python -m benchmarks.bench_detection_fraude [nombre_transactions]
+"""
+import random
+import sys
+import time
+
+from benchmarks.generateur import numero
+from models.compte_bancaire import CompteBancaire
+from models.detection_fraude import DetecteurVelocite
+from models.transaction import Transaction
+
+NOMBRE_COMPTES = 10_000
+DEBIT_CIBLE = 100_000
+
+
+def cout_operations(comptes, nombre):
+    """ µs par dépôt + retrait sur des comptes tirés au hasard """
+    cibles = random.Random(1).choices(comptes, k=nombre)
+    debut = time.perf_counter()
+    for compte in cibles:
+        compte.deposer(100)
+        compte.retirer(100)
+    return (time.perf_counter() - debut) / (2 * nombre) * 1e6
+
+
+def main():
+    nombre = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    comptes = [CompteBancaire(f"Client {i}", numero(i), 10**12) for i in range(NOMBRE_COMPTES)]
+
+    sans = cout_operations(comptes, nombre // 10)
+    detecteur = DetecteurVelocite().brancher()
+    avec = cout_operations(comptes, nombre // 10)
+    detecteur.debrancher()
+    print(f"deposer/retirer : {sans:.2f} µs sans détecteur, {avec:.2f} µs avec (+{avec - sans:.2f} µs)")
+
+    aleatoire = random.Random(0)
+    codes = (Transaction.RETRAIT, Transaction.RETRAIT, Transaction.DEPOT)
+    flux = [
+        (numero(aleatoire.randrange(NOMBRE_COMPTES)),
+         Transaction(aleatoire.choice(codes), aleatoire.randint(100, 50_000_000), i / DEBIT_CIBLE, 0))
+        for i in range(nombre)
+    ]
+    detecteur = DetecteurVelocite()
+    debut = time.perf_counter()
+    for numero_compte, transaction in flux:
+        detecteur.recevoir(numero_compte, transaction)
+    debit = nombre / (time.perf_counter() - debut)
+    print(f"Moteur de règles : {debit:,.0f} transactions / s "
+          f"({'≥' if debit >= DEBIT_CIBLE else '<'} {DEBIT_CIBLE:,} visé), "
+          f"{len(detecteur.alertes)} alerte(s) récente(s), {len(detecteur)} compte(s) suivi(s)")
+
+
+if __name__ == "__main__":
+    main()
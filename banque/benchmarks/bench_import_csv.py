@@ -0,0 +1,60 @@
+"""
+    Benchmark : import et export CSV en masse.
+
+    Génère un fichier CSV de N comptes (1 % de lignes invalides ou en
+    double), l'importe dans une banque vide, l'exporte, puis ferme la
+    banque (compaction). Objectif : 1 million de lignes en moins d'une minute.
+
+    Lancer depuis le dossier banque :
+        python -m benchmarks.bench_import_csv [nombre_lignes]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.generateur import numero
+from models.banque import Banque
+
+OBJECTIF_S = 60
+
+
+def generer_csv(fichier, nombre):
+    """ Écrit nombre lignes numero_compte, titulaire, solde ; une sur cent est rejetée """
+    with open(fichier, 'w', encoding='utf-8') as f:
+        f.write("numero_compte,titulaire,solde\n")
+        for i in range(nombre):
+            if i % 200 == 199:
+                f.write(f"{numero(i - 1)},Doublon {i},1000\n")
+            elif i % 200 == 99:
+                f.write(f"{numero(i)},Solde bas {i},1\n")
+            else:
+                f.write(f"{numero(i)},Client {i},{1000 + i % 50_000}.{i % 100:02d}\n")
+
+
+def main():
+    nombre = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as dossier:
+        source = os.path.join(dossier, "clients.csv")
+        generer_csv(source, nombre)
+        banque = Banque("Bench", fichier=os.path.join(dossier, "banque.json"))
+
+        debut = time.perf_counter()
+        _, message = banque.importer_csv(source)
+        duree_import = time.perf_counter() - debut
+        print(f"Import : {duree_import:.1f} s ({nombre / duree_import:,.0f} lignes / s) - {message}")
+
+        debut = time.perf_counter()
+        _, message = banque.exporter_csv(os.path.join(dossier, "export.csv"))
+        duree = time.perf_counter() - debut
+        print(f"Export : {duree:.1f} s ({len(banque) / duree:,.0f} comptes / s) - {message}")
+
+        debut = time.perf_counter()
+        banque.fermer()
+        print(f"Fermeture (compaction) : {time.perf_counter() - debut:.1f} s")
+    verdict = "≤" if duree_import <= OBJECTIF_S * nombre / 1_000_000 else ">"
+    print(f"Import {verdict} {OBJECTIF_S} s par million de lignes")
+
+
+if __name__ == "__main__":
+    main()
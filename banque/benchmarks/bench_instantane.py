@@ -0,0 +1,61 @@
+"""
+    Benchmark : rapport de fin de journée (total, min, max, histogramme)
+    depuis le fichier JSON ou depuis l'instantané binaire en colonnes.
+
+    Lancer depuis le dossier banque :
+        python -m benchmarks.bench_instantane [tailles...]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.generateur import generer_fichier_banque
+from models.statistiques import StatistiquesBanque
+from utils.file_manager import FileManager
+from utils.instantane_colonnes import InstantaneColonnes
+
+TAILLES = [10_000, 100_000, 1_000_000]
+
+
+def rapport_json(fichier):
+    comptes = FileManager.lire_instantane(fichier)
+    statistiques = StatistiquesBanque(lambda numero: comptes[numero].get_solde())
+    statistiques.reconstruire(comptes.values())
+    return statistiques.resume()["total_actifs"]
+
+
+def rapport_colonnes(fichier):
+    with InstantaneColonnes(fichier) as instantane:
+        instantane.minimum()
+        instantane.maximum()
+        instantane.histogramme()
+        return instantane.total()
+
+
+def chronometrer(fonction, fichier):
+    debut = time.perf_counter()
+    resultat = fonction(fichier)
+    return resultat, (time.perf_counter() - debut) * 1e3
+
+
+def main():
+    tailles = [int(t) for t in sys.argv[1:]] or TAILLES
+    with tempfile.TemporaryDirectory() as dossier:
+        print(f"{'Comptes':>10} | {'JSON (ms)':>10} | {'Colonnes (ms)':>13} | {'Taille JSON / colonnes (Mo)':>28}")
+        print("-" * 72)
+        for taille in tailles:
+            fichier = os.path.join(dossier, f"banque_{taille}.json")
+            colonnes = os.path.join(dossier, f"banque_{taille}.colonnes")
+            generer_fichier_banque(fichier, taille)
+            InstantaneColonnes.ecrire(colonnes, FileManager.lire_instantane(fichier).values())
+
+            total_json, duree_json = chronometrer(rapport_json, fichier)
+            total_colonnes, duree_colonnes = chronometrer(rapport_colonnes, colonnes)
+            assert total_json == total_colonnes
+            tailles_mo = f"{os.path.getsize(fichier) / 1e6:.1f} / {os.path.getsize(colonnes) / 1e6:.1f}"
+            print(f"{taille:>10} | {duree_json:>10.1f} | {duree_colonnes:>13.1f} | {tailles_mo:>28}")
+
+
+if __name__ == "__main__":
+    main()
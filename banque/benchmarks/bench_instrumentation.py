@@ -0,0 +1,61 @@
+"""
+    Benchmark : coût des mesures de performance sur les opérations de la banque.
+
+    Coût par appel de chercher_compte (lecture en mémoire) et de
+    effectuer_depot (écriture disque) sans mesures, avec mesures actives,
+    puis après désactivation (doit revenir au coût initial).
+
+    Lancer depuis le dossier banque :
+        python -m benchmarks.bench_instrumentation [nombre_comptes]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from benchmarks.generateur import generer_fichier_banque
+from models.banque import Banque
+from utils.instrumentation import INSTRUMENTATION
+
+LECTURES = 200_000
+DEPOTS = 2_000
+
+
+def cout(appel, cibles):
+    """ µs par appel """
+    debut = time.perf_counter()
+    for cible in cibles:
+        appel(cible)
+    return (time.perf_counter() - debut) / len(cibles) * 1e6
+
+
+def mesurer(banque, numeros):
+    aleatoire = random.Random(0)
+    lecture = cout(banque.chercher_compte, aleatoire.choices(numeros, k=LECTURES))
+    depot = cout(lambda n: banque.effectuer_depot(n, 100), aleatoire.choices(numeros, k=DEPOTS))
+    return lecture, depot
+
+
+def main():
+    nombre = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    with tempfile.TemporaryDirectory() as dossier:
+        fichier = os.path.join(dossier, "banque.json")
+        numeros = generer_fichier_banque(fichier, nombre)
+        banque = Banque("Bench", fichier=fichier)
+
+        resultats = [("inactives", mesurer(banque, numeros))]
+        INSTRUMENTATION.activer()
+        resultats.append(("actives", mesurer(banque, numeros)))
+        INSTRUMENTATION.desactiver()
+        resultats.append(("désactivées", mesurer(banque, numeros)))
+        banque.fermer()
+
+    print(f"{'Mesures':<12} | {'chercher_compte µs':>18} | {'effectuer_depot µs':>18}")
+    for nom, (lecture, depot) in resultats:
+        print(f"{nom:<12} | {lecture:>18.2f} | {depot:>18.1f}")
+    INSTRUMENTATION.afficher()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+    Benchmark : coût d'un dépôt persisté, réécriture complète vs journal.
+
+    Lancer depuis le dossier banque :
+        python -m benchmarks.bench_journal
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from benchmarks.generateur import generer_fichier_banque
+from models.banque import Banque
+from utils.file_manager import FileManager
+
+TAILLES = [1_000, 10_000, 100_000]
+NOMBRE_DEPOTS = 200
+
+
+def mesurer(taille, dossier):
+    """ Retourne (µs / dépôt journalisé, µs / réécriture complète) """
+    fichier = os.path.join(dossier, f"banque_{taille}.json")
+    numeros = generer_fichier_banque(fichier, taille)
+    banque = Banque("Bench", fichier=fichier)
+    cibles = random.Random(0).choices(numeros, k=NOMBRE_DEPOTS)
+
+    debut = time.perf_counter()
+    for numero in cibles:
+        banque.effectuer_depot(numero, 100)
+    journal = (time.perf_counter() - debut) / NOMBRE_DEPOTS * 1e6
+
+    comptes = [banque.chercher_compte(numero) for numero in numeros]
+    repetitions = max(1, NOMBRE_DEPOTS * 1_000 // taille)
+    debut = time.perf_counter()
+    for _ in range(repetitions):
+        FileManager.sauvegarder_comptes(fichier, comptes)
+    complet = (time.perf_counter() - debut) / repetitions * 1e6
+
+    banque.fermer()
+    return journal, complet
+
+
+def main():
+    tailles = [int(t) for t in sys.argv[1:]] or TAILLES
+    with tempfile.TemporaryDirectory() as dossier:
+        print(f"{'Comptes':>10} | {'journal µs/op':>14} | {'réécriture µs/op':>17}")
+        print("-" * 48)
+        for taille in tailles:
+            journal, complet = mesurer(taille, dossier)
+            print(f"{taille:>10} | {journal:>14.1f} | {complet:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
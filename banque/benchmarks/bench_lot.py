@@ -0,0 +1,43 @@
+"""
+    Benchmark : débit des dépôts appel par appel vs Banque.appliquer_lot.
+
+    Lancer depuis le dossier banque :
+        python -m benchmarks.bench_lot [nombre_comptes] [nombre_operations]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from benchmarks.generateur import generer_fichier_banque
+from models.banque import Banque
+
+
+def main():
+    nombre_comptes = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    nombre_operations = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+
+    with tempfile.TemporaryDirectory() as dossier:
+        fichier = os.path.join(dossier, "banque.json")
+        numeros = generer_fichier_banque(fichier, nombre_comptes)
+        banque = Banque("Bench", fichier=fichier)
+        operations = [("depot", numero, 100)
+                      for numero in random.Random(0).choices(numeros, k=nombre_operations)]
+
+        debut = time.perf_counter()
+        for _, numero, montant in operations:
+            banque.effectuer_depot(numero, montant)
+        unitaire = nombre_operations / (time.perf_counter() - debut)
+
+        debut = time.perf_counter()
+        banque.appliquer_lot(operations)
+        lot = nombre_operations / (time.perf_counter() - debut)
+        banque.fermer()
+
+    print(f"Appel par appel : {unitaire:>12,.0f} op/s")
+    print(f"appliquer_lot   : {lot:>12,.0f} op/s  (x{lot / unitaire:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+    Benchmark mémoire : octets par compte et par transaction, avant/après
+    le passage aux __slots__ et aux enregistrements Transaction compacts.
+
+    Lancer depuis le dossier banque :
+        python -m benchmarks.bench_memoire [nombre_comptes] [transactions_par_compte]
+"""
+import datetime
+import sys
+import threading
+import time
+import tracemalloc
+from collections import deque
+
+from config.constants import FORMAT_DATE, HISTORIQUE_EN_MEMOIRE
+from models.compte_bancaire import CompteBancaire
+
+
+class AncienCompte:
+    """ Disposition d'origine : __dict__ par instance, transactions en dict """
+
+    def __init__(self, titulaire, numero_compte, solde):
+        self.titulaire = titulaire
+        self.numero_compte = numero_compte
+        self.solde = solde
+        self.historique = deque(maxlen=HISTORIQUE_EN_MEMOIRE)
+        self.verrou = threading.Lock()
+
+    def deposer(self, montant):
+        self.solde += montant
+        self.historique.append({
+            "type": "Dépôt",
+            "montant_centimes": montant,
+            "date": datetime.datetime.now().strftime(FORMAT_DATE),
+            "horodatage": time.time(),
+            "solde_centimes": self.solde,
+        })
+
+
+def mesurer(classe, nombre_comptes, transactions_par_compte):
+    """ Retourne (octets par compte, octets par transaction) """
+    numeros = [f"CM{i:08d}" for i in range(nombre_comptes)]
+    titulaires = [f"Client {i}" for i in range(nombre_comptes)]
+
+    tracemalloc.start()
+    avant = tracemalloc.get_traced_memory()[0]
+    comptes = [classe(titulaires[i], numeros[i], 10_000_00) for i in range(nombre_comptes)]
+    apres_comptes = tracemalloc.get_traced_memory()[0]
+    for compte in comptes:
+        for _ in range(transactions_par_compte):
+            compte.deposer(100)
+    apres_transactions = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    par_compte = (apres_comptes - avant) / nombre_comptes
+    par_transaction = (apres_transactions - apres_comptes) / (nombre_comptes * transactions_par_compte)
+    return par_compte, par_transaction
+
+
+def main():
+    nombre_comptes = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    transactions = int(sys.argv[2]) if len(sys.argv) > 2 else HISTORIQUE_EN_MEMOIRE
+
+    print(f"{nombre_comptes} comptes, {transactions} transactions par compte")
+    print(f"{'Disposition':<12} | {'octets / compte':>16} | {'octets / transaction':>21}")
+    print("-" * 56)
+    for nom, classe in (("avant", AncienCompte), ("après", CompteBancaire)):
+        par_compte, par_transaction = mesurer(classe, nombre_comptes, transactions)
+        print(f"{nom:<12} | {par_compte:>16.0f} | {par_transaction:>21.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+    Benchmark : arithmétique des soldes en centimes (int) vs Decimal vs float.
+
+    Lancer depuis le dossier banque :
+        python -m benchmarks.bench_montant [nombre_operations]
+"""
+import random
+import sys
+import time
+from decimal import Decimal
+
+
+def mesurer(soldes_initiaux, montants):
+    """ Applique dépôts/retraits alternés ; retourne (op/s, solde final) """
+    solde = soldes_initiaux
+    debut = time.perf_counter()
+    for i, montant in enumerate(montants):
+        if i & 1:
+            if montant <= solde:
+                solde -= montant
+        else:
+            solde += montant
+    return len(montants) / (time.perf_counter() - debut), solde
+
+
+def main():
+    nombre = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    aleatoire = random.Random(0)
+    centimes = [aleatoire.randint(1, 10_000_000) for _ in range(nombre)]
+
+    resultats = {
+        "int (centimes)": mesurer(0, centimes),
+        "Decimal": mesurer(Decimal(0), [Decimal(c).scaleb(-2) for c in centimes]),
+        "float": mesurer(0.0, [c / 100 for c in centimes]),
+    }
+    reference = Decimal(resultats["int (centimes)"][1]).scaleb(-2)
+    print(f"{'Type':<15} | {'op/s':>14} | {'écart au résultat exact':>24}")
+    print("-" * 60)
+    for nom, (debit, solde) in resultats.items():
+        fcfa = Decimal(solde).scaleb(-2) if isinstance(solde, int) else Decimal(solde)
+        ecart = abs(fcfa - reference)
+        print(f"{nom:<15} | {debit:>14,.0f} | {ecart:>24}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+    Benchmark : latence de Banque.chercher_compte de 1k à 1M comptes.
+
+    Lancer depuis le dossier banque :
+        python -m benchmarks.bench_recherche
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from benchmarks.generateur import generer_fichier_banque
+from models.banque import Banque
+
+TAILLES = [1_000, 10_000, 100_000, 1_000_000]
+NOMBRE_RECHERCHES = 100_000
+
+
+def mesurer(taille, dossier):
+    """ Retourne la latence moyenne d'une recherche (en ns) """
+    fichier = os.path.join(dossier, f"banque_{taille}.json")
+    numeros = generer_fichier_banque(fichier, taille)
+    banque = Banque("Bench", fichier=fichier)
+
+    cibles = random.Random(0).choices(numeros, k=NOMBRE_RECHERCHES)
+    debut = time.perf_counter()
+    for numero in cibles:
+        banque.chercher_compte(numero)
+    duree = time.perf_counter() - debut
+    return duree / NOMBRE_RECHERCHES * 1e9
+
+
+def main():
+    tailles = [int(t) for t in sys.argv[1:]] or TAILLES
+    with tempfile.TemporaryDirectory() as dossier:
+        print(f"{'Comptes':>10} | {'ns / recherche':>15}")
+        print("-" * 28)
+        for taille in tailles:
+            print(f"{taille:>10} | {mesurer(taille, dossier):>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
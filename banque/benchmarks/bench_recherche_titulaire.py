@@ -0,0 +1,65 @@
+"""
+    Benchmark : recherche par préfixe du titulaire (index trié) de 10k à 1M comptes.
+
+    Mesure la construction de l'index (première recherche), la latence d'une
+    page de résultats et celle d'un changement de titulaire.
+
+    Lancer depuis le dossier banque :
+        python -m benchmarks.bench_recherche_titulaire [tailles...]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from benchmarks.generateur import generer_fichier_banque
+from models.banque import Banque
+
+TAILLES = [10_000, 100_000, 1_000_000]
+NOMBRE_RECHERCHES = 10_000
+NOMBRE_MODIFICATIONS = 1_000
+
+
+def mesurer(taille, dossier):
+    """ Retourne (construction en ms, µs / recherche, µs / modification) """
+    fichier = os.path.join(dossier, f"banque_{taille}.json")
+    numeros = generer_fichier_banque(fichier, taille)
+    banque = Banque("Bench", fichier=fichier)
+    aleatoire = random.Random(0)
+
+    debut = time.perf_counter()
+    banque.rechercher_titulaire("client")
+    construction = (time.perf_counter() - debut) * 1e3
+
+    # Préfixes du nom complet ("CLIENT 4242") ou du second mot ("4242")
+    prefixes = [
+        aleatoire.choice(["CLIENT ", "client ", ""]) + str(aleatoire.randrange(taille))[:aleatoire.randint(1, 4)]
+        for _ in range(NOMBRE_RECHERCHES)
+    ]
+    debut = time.perf_counter()
+    for prefixe in prefixes:
+        banque.rechercher_titulaire(prefixe)
+    recherche = (time.perf_counter() - debut) / NOMBRE_RECHERCHES * 1e6
+
+    cibles = aleatoire.sample(numeros, NOMBRE_MODIFICATIONS)
+    debut = time.perf_counter()
+    for i, numero in enumerate(cibles):
+        banque.modifier_compte(numero, f"Élodie Numéro {i}")
+    modification = (time.perf_counter() - debut) / NOMBRE_MODIFICATIONS * 1e6
+    banque.fermer()
+    return construction, recherche, modification
+
+
+def main():
+    tailles = [int(t) for t in sys.argv[1:]] or TAILLES
+    with tempfile.TemporaryDirectory() as dossier:
+        print(f"{'Comptes':>10} | {'Index (ms)':>10} | {'µs / recherche':>14} | {'µs / modification':>17}")
+        print("-" * 62)
+        for taille in tailles:
+            construction, recherche, modification = mesurer(taille, dossier)
+            print(f"{taille:>10} | {construction:>10.0f} | {recherche:>14.1f} | {modification:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+    Benchmark : débit d'opérations de la banque répartie selon le nombre de processus.
+
+    Les opérations (dépôts et retraits) sont envoyées par lots : chaque
+    processus applique sa part du lot en parallèle des autres. Le temps d'un
+    transfert entre deux shards (validation en deux phases) est mesuré à part.
+    Le gain attendu est proche du nombre de cœurs disponibles.
+
+    Lancer depuis le dossier banque :
+        python -m benchmarks.bench_repartition [processus...]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from benchmarks.generateur import numero
+from models.banque_repartie import BanqueRepartie
+
+NOMBRE_COMPTES = 10_000
+NOMBRE_OPERATIONS = 200_000
+TAILLE_LOT = 20_000
+NOMBRE_TRANSFERTS = 500
+
+
+def mesurer(nombre_processus, dossier):
+    """ Retourne (opérations / s, ms / transfert entre shards) """
+    banque = BanqueRepartie("Bench", dossier=os.path.join(dossier, str(nombre_processus)),
+                            nombre_processus=nombre_processus)
+    numeros = [numero(i) for i in range(NOMBRE_COMPTES)]
+    for n in numeros:
+        banque.ouvrir_compte(f"Client {n}", n, 1_000_000_00)
+
+    aleatoire = random.Random(0)
+    operations = [
+        (aleatoire.choice(("depot", "retrait")), aleatoire.choice(numeros), aleatoire.randint(1, 10_000))
+        for _ in range(NOMBRE_OPERATIONS)
+    ]
+    debut = time.perf_counter()
+    for i in range(0, NOMBRE_OPERATIONS, TAILLE_LOT):
+        banque.appliquer_lot(operations[i:i + TAILLE_LOT])
+    debit = NOMBRE_OPERATIONS / (time.perf_counter() - debut)
+
+    paires = [
+        (source, dest) for source, dest in (aleatoire.sample(numeros, 2) for _ in range(NOMBRE_TRANSFERTS * 2))
+        if banque.shard(source) != banque.shard(dest)
+    ][:NOMBRE_TRANSFERTS]
+    transfert = None
+    if paires:
+        debut = time.perf_counter()
+        for source, dest in paires:
+            banque.transferer(source, dest, 100)
+        transfert = (time.perf_counter() - debut) / len(paires) * 1e3
+    banque.fermer()
+    return debit, transfert
+
+
+def main():
+    processus = [int(n) for n in sys.argv[1:]] or sorted({1, 2, 4, os.cpu_count() or 1})
+    print(f"Cœurs disponibles : {os.cpu_count()}")
+    with tempfile.TemporaryDirectory() as dossier:
+        print(f"{'Processus':>10} | {'opérations / s':>15} | {'accélération':>12} | {'ms / transfert 2PC':>18}")
+        print("-" * 66)
+        reference = None
+        for nombre in processus:
+            debit, transfert = mesurer(nombre, dossier)
+            reference = reference or debit
+            texte_transfert = f"{transfert:>18.2f}" if transfert is not None else f"{'-':>18}"
+            print(f"{nombre:>10} | {debit:>15.0f} | {debit / reference:>11.2f}x | {texte_transfert}")
+
+
+if __name__ == "__main__":
+    main()
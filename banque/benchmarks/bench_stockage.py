@@ -0,0 +1,63 @@
+"""
+    Benchmark : moteurs de stockage JSON et SQLite.
+    Mesure le chargement, le débit de dépôts et de transferts persistés
+    un par un, et la fermeture, de 10k à 1M comptes.
+
+    Lancer depuis le dossier banque :
+        python -m benchmarks.bench_stockage [tailles...]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from benchmarks.generateur import generer_fichier_banque
+from models.banque import Banque
+
+TAILLES = [10_000, 100_000, 1_000_000]
+NOMBRE_OPERATIONS = 2_000
+
+
+def mesurer(fichier, numeros, moteur):
+    """ Retourne (chargement ms, dépôts/s, transferts/s, fermeture ms) """
+    debut = time.perf_counter()
+    banque = Banque("Bench", fichier=fichier, moteur=moteur)
+    chargement = time.perf_counter() - debut
+
+    aleatoire = random.Random(0)
+    debut = time.perf_counter()
+    for _ in range(NOMBRE_OPERATIONS):
+        banque.effectuer_depot(aleatoire.choice(numeros), 100)
+    depots = NOMBRE_OPERATIONS / (time.perf_counter() - debut)
+
+    debut = time.perf_counter()
+    for _ in range(NOMBRE_OPERATIONS):
+        banque.transferer(aleatoire.choice(numeros), aleatoire.choice(numeros), 100)
+    transferts = NOMBRE_OPERATIONS / (time.perf_counter() - debut)
+
+    debut = time.perf_counter()
+    banque.fermer()
+    fermeture = time.perf_counter() - debut
+    return chargement * 1e3, depots, transferts, fermeture * 1e3
+
+
+def main():
+    tailles = [int(t) for t in sys.argv[1:]] or TAILLES
+    with tempfile.TemporaryDirectory() as dossier:
+        print(f"{'Comptes':>10} | {'Moteur':>6} | {'Chargement (ms)':>15} | "
+              f"{'Dépôts/s':>9} | {'Transferts/s':>12} | {'Fermeture (ms)':>14}")
+        print("-" * 83)
+        for taille in tailles:
+            fichier = os.path.join(dossier, f"banque_{taille}.json")
+            numeros = generer_fichier_banque(fichier, taille)
+            # Premier démarrage SQLite : import du fichier JSON dans la base
+            Banque("Bench", fichier=fichier, moteur="sqlite").fermer()
+            for moteur in ("json", "sqlite"):
+                chargement, depots, transferts, fermeture = mesurer(fichier, numeros, moteur)
+                print(f"{taille:>10} | {moteur:>6} | {chargement:>15.1f} | "
+                      f"{depots:>9.0f} | {transferts:>12.0f} | {fermeture:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+    Benchmark : traitement mensuel (intérêts et frais) de toute la banque.
+    Mesure le calcul seul sur la colonne des soldes, puis le traitement
+    complet (écriture des soldes et de l'historique) pour chaque moteur.
+
+    Lancer depuis le dossier banque :
+        python -m benchmarks.bench_traitement_mensuel [tailles...]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from array import array
+
+from benchmarks.generateur import generer_fichier_banque
+from models.banque import Banque
+from models.traitement_mensuel import ReglesMensuelles, calculer_mouvements, numpy
+
+TAILLES = [100_000, 1_000_000]
+
+
+def main():
+    tailles = [int(t) for t in sys.argv[1:]] or TAILLES
+    regles = ReglesMensuelles()
+    print(f"Calcul : {'numpy' if numpy is not None else 'array'}")
+    with tempfile.TemporaryDirectory() as dossier:
+        print(f"{'Comptes':>10} | {'Calcul (s)':>10} | {'Moteur':>6} | {'Traitement complet (s)':>22}")
+        print("-" * 60)
+        for taille in tailles:
+            aleatoire = random.Random(0)
+            soldes = array('q', (aleatoire.randint(0, 1_000_000_00) for _ in range(taille)))
+            debut = time.perf_counter()
+            calculer_mouvements(soldes, regles)
+            calcul = time.perf_counter() - debut
+
+            for moteur in ("json", "sqlite"):
+                fichier = os.path.join(dossier, f"banque_{moteur}_{taille}.json")
+                generer_fichier_banque(fichier, taille)
+                banque = Banque("Bench", fichier=fichier, moteur=moteur)
+                debut = time.perf_counter()
+                banque.appliquer_traitement_mensuel(regles)
+                complet = time.perf_counter() - debut
+                banque.fermer()
+                print(f"{taille:>10} | {calcul:>10.2f} | {moteur:>6} | {complet:>22.2f}")
+
+
+if __name__ == "__main__":
+    main()
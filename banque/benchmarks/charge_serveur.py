@@ -0,0 +1,105 @@
+"""
+    Générateur de charge pour le serveur asyncio de la banque.
+    Mesure le débit (op/s) et les latences p50 / p99.
+
+    Lancer depuis le dossier banque :
+        python -m benchmarks.charge_serveur                 # serveur local temporaire
+        python -m benchmarks.charge_serveur --port 8765     # serveur déjà lancé
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import tempfile
+import time
+
+from config.constants import SERVEUR_HOTE
+from models.banque import Banque
+from ui.serveur import ServeurBanque
+
+
+def percentile(valeurs, p):
+    """ Percentile p (0-100) d'une liste triée """
+    return valeurs[min(len(valeurs) - 1, int(len(valeurs) * p / 100))]
+
+
+async def client(hote, port, indice, nombre_requetes, numeros, latences):
+    """ Un client : envoie ses requêtes une par une et note chaque latence """
+    lecteur, ecrivain = await asyncio.open_connection(hote, port)
+    aleatoire = random.Random(indice)
+    for i in range(nombre_requetes):
+        tirage = aleatoire.random()
+        if tirage < 0.4:
+            requete = {"op": "depot", "numero_compte": aleatoire.choice(numeros), "montant": 100}
+        elif tirage < 0.7:
+            requete = {"op": "retrait", "numero_compte": aleatoire.choice(numeros), "montant": 50}
+        elif tirage < 0.95:
+            source, destination = aleatoire.sample(numeros, 2)
+            requete = {"op": "transfert", "source": source, "destination": destination, "montant": 10}
+        else:
+            requete = {"op": "statistiques"}
+        requete["id"] = i
+
+        debut = time.perf_counter()
+        ecrivain.write(json.dumps(requete).encode() + b"\n")
+        await ecrivain.drain()
+        await lecteur.readline()
+        latences.append(time.perf_counter() - debut)
+    ecrivain.close()
+    await ecrivain.wait_closed()
+
+
+async def lancer(hote, port, nombre_clients, nombre_requetes, nombre_comptes):
+    numeros = [f"CH{i:06d}" for i in range(nombre_comptes)]
+    lecteur, ecrivain = await asyncio.open_connection(hote, port)
+    for numero in numeros:
+        ecrivain.write(json.dumps({"op": "ouvrir", "titulaire": "Client", "numero_compte": numero,
+                                   "solde": 100_000}).encode() + b"\n")
+        await lecteur.readline()
+    ecrivain.close()
+
+    latences = []
+    debut = time.perf_counter()
+    await asyncio.gather(*(client(hote, port, i, nombre_requetes, numeros, latences)
+                           for i in range(nombre_clients)))
+    duree = time.perf_counter() - debut
+
+    latences.sort()
+    print(f"Clients          : {nombre_clients}")
+    print(f"Requêtes         : {len(latences)}")
+    print(f"Débit            : {len(latences) / duree:,.0f} op/s")
+    print(f"Latence p50      : {percentile(latences, 50) * 1e3:.3f} ms")
+    print(f"Latence p99      : {percentile(latences, 99) * 1e3:.3f} ms")
+
+
+async def principal(arguments):
+    if arguments.port:
+        await lancer(arguments.hote, arguments.port, arguments.clients,
+                     arguments.requetes, arguments.comptes)
+        return
+
+    with tempfile.TemporaryDirectory() as dossier:
+        banque = Banque("Bench", fichier=os.path.join(dossier, "banque.json"), asynchrone=True)
+        serveur = await ServeurBanque(banque).demarrer(SERVEUR_HOTE, 0)
+        port = serveur.sockets[0].getsockname()[1]
+        try:
+            await lancer(SERVEUR_HOTE, port, arguments.clients, arguments.requetes, arguments.comptes)
+        finally:
+            serveur.close()
+            await serveur.wait_closed()
+            banque.fermer()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1].strip())
+    parser.add_argument("--hote", default=SERVEUR_HOTE)
+    parser.add_argument("--port", type=int, default=0, help="0 = serveur local temporaire")
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--requetes", type=int, default=1000, help="requêtes par client")
+    parser.add_argument("--comptes", type=int, default=1000)
+    asyncio.run(principal(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""
+    Génération de banques synthétiques pour les benchmarks.
+"""
+import json
+import os
+import random
+
+
+def numero(i):
+    """ Numéro de compte synthétique pour l'indice i """
+    return f"CM{i:08d}"
+
+
+def generer_fichier_banque(fichier, nombre_comptes, graine=42):
+    """ Écrit un fichier banque.json contenant nombre_comptes comptes """
+    aleatoire = random.Random(graine)
+    data = {}
+    for i in range(nombre_comptes):
+        data[numero(i)] = {
+            "titulaire": f"Client {i}",
+            "numero_compte": numero(i),
+            "solde_centimes": aleatoire.randint(100_00, 1_000_000_00),
+        }
+    dossier = os.path.dirname(fichier)
+    if dossier:
+        os.makedirs(dossier, exist_ok=True)
+    with open(fichier, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+    return [numero(i) for i in range(nombre_comptes)]
@@ -0,0 +1,233 @@
+"""
+    Suite de benchmarks de la banque : chargement, sauvegarde, recherche,
+    dépôts, transferts et statistiques sur des banques synthétiques.
+
+    Pour chaque mesure : opérations par seconde, percentiles de latence et
+    pic de mémoire (RSS) du processus. Chaque taille de banque est mesurée
+    dans un processus neuf, pour que le pic de mémoire lui soit propre.
+    Les résultats sont écrits en JSON pour comparer deux commits :
+
+    Lancer depuis le dossier banque :
+        python -m benchmarks.suite --tailles 1000 100000 --sortie avant.json
+        python -m benchmarks.suite --tailles 1000 100000 --comparer avant.json
+
+    Bibliothèque standard uniquement, sans accès réseau.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.generateur import generer_fichier_banque
+from models.banque import Banque
+from utils.file_manager import FileManager
+
+try:
+    import resource
+except ImportError:  # Windows : pas de pic de mémoire
+    resource = None
+
+TAILLES = [1_000, 10_000, 100_000]
+# Nombre d'appels par mesure : les lectures sont bon marché, les écritures touchent le disque
+OPERATIONS = {
+    "charger_comptes": 3,
+    "sauvegarder_comptes": 3,
+    "chercher_compte": 100_000,
+    "effectuer_depot": 2_000,
+    "transferer": 2_000,
+    "statistiques": 100_000,
+    "reconstruire_statistiques": 3,
+}
+DOSSIER_RESULTATS = os.path.join(os.path.dirname(__file__), "resultats")
+
+
+def pic_memoire_ko():
+    """ Pic de mémoire résidente du processus (Ko), ou None """
+    if resource is None:
+        return None
+    pic = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux : Ko ; macOS : octets
+    return pic // 1024 if sys.platform == "darwin" else pic
+
+
+def percentile(triees, p):
+    """ Percentile p (0-100) d'une liste triée, par rang le plus proche """
+    rang = max(0, min(len(triees) - 1, round(p / 100 * len(triees)) - 1))
+    return triees[rang]
+
+
+def chronometrer(nom, appels):
+    """ Exécute chaque appel et résume les latences (ns) """
+    latences = []
+    debut_total = time.perf_counter_ns()
+    for appel in appels:
+        debut = time.perf_counter_ns()
+        appel()
+        latences.append(time.perf_counter_ns() - debut)
+    duree = time.perf_counter_ns() - debut_total
+    latences.sort()
+    return {
+        "mesure": nom,
+        "operations": len(latences),
+        "ops_par_s": len(latences) / duree * 1e9 if duree else None,
+        "latence_ns": {
+            "p50": percentile(latences, 50),
+            "p90": percentile(latences, 90),
+            "p99": percentile(latences, 99),
+            "max": latences[-1],
+        },
+        "rss_max_ko": pic_memoire_ko(),
+    }
+
+
+def mesurer_taille(taille, operations, graine=0):
+    """ Toutes les mesures pour une banque de taille comptes """
+    aleatoire = random.Random(graine)
+    resultats = []
+    with tempfile.TemporaryDirectory() as dossier:
+        fichier = os.path.join(dossier, "banque.json")
+        numeros = generer_fichier_banque(fichier, taille)
+
+        resultats.append(chronometrer("charger_comptes", [
+            lambda: FileManager.charger_comptes(fichier)
+        ] * operations["charger_comptes"]))
+
+        comptes = list(FileManager.charger_comptes(fichier).values())
+        copie = os.path.join(dossier, "copie.json")
+        resultats.append(chronometrer("sauvegarder_comptes", [
+            lambda: FileManager.sauvegarder_comptes(copie, comptes)
+        ] * operations["sauvegarder_comptes"]))
+        del comptes
+
+        banque = Banque("Bench", fichier=fichier)
+        cibles = aleatoire.choices(numeros, k=operations["chercher_compte"])
+        resultats.append(chronometrer("chercher_compte", [
+            lambda n=n: banque.chercher_compte(n) for n in cibles
+        ]))
+
+        cibles = aleatoire.choices(numeros, k=operations["effectuer_depot"])
+        resultats.append(chronometrer("effectuer_depot", [
+            lambda n=n: banque.effectuer_depot(n, 100) for n in cibles
+        ]))
+
+        paires = [aleatoire.sample(numeros, 2) for _ in range(operations["transferer"])]
+        resultats.append(chronometrer("transferer", [
+            lambda s=s, d=d: banque.transferer(s, d, 100) for s, d in paires
+        ]))
+
+        resultats.append(chronometrer("statistiques", [banque.statistiques] * operations["statistiques"]))
+        resultats.append(chronometrer(
+            "reconstruire_statistiques",
+            [banque.reconstruire_statistiques] * operations["reconstruire_statistiques"],
+        ))
+        banque.fermer()
+
+    for resultat in resultats:
+        resultat["taille"] = taille
+    return resultats
+
+
+def version_code():
+    """ Commit git courant, si disponible """
+    try:
+        sortie = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return sortie.stdout.strip() or None
+
+
+def nombres_operations(facteur):
+    """ Nombre d'appels de chaque mesure, multiplié par facteur """
+    return {nom: max(1, int(nombre * facteur)) for nom, nombre in OPERATIONS.items()}
+
+
+def executer(tailles, facteur):
+    """ Mesure chaque taille dans un processus neuf ; retourne le rapport complet """
+    operations = nombres_operations(facteur)
+    resultats = []
+    for taille in tailles:
+        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
+            fichier_resultat = f.name
+        try:
+            subprocess.run(
+                [sys.executable, "-m", "benchmarks.suite", "--interne", str(taille), fichier_resultat,
+                 "--facteur", str(facteur)],
+                check=True, stdout=subprocess.DEVNULL,
+            )
+            with open(fichier_resultat, 'r', encoding='utf-8') as f:
+                resultats.extend(json.load(f))
+        finally:
+            os.remove(fichier_resultat)
+    return {
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "commit": version_code(),
+        "python": platform.python_version(),
+        "plateforme": platform.platform(),
+        "operations": operations,
+        "resultats": resultats,
+    }
+
+
+def afficher(rapport, reference=None):
+    """ Tableau des résultats ; avec une référence, le rapport des débits """
+    anciens = {}
+    if reference:
+        anciens = {(r["taille"], r["mesure"]): r for r in reference["resultats"]}
+    entete = f"{'Comptes':>8} | {'Mesure':<26} | {'op/s':>12} | {'p50 µs':>9} | {'p99 µs':>9} | {'RSS Mo':>7}"
+    if reference:
+        entete += f" | {'vs ' + str(reference.get('commit')):>12}"
+    print(entete)
+    print("-" * len(entete))
+    for r in rapport["resultats"]:
+        rss = f"{r['rss_max_ko'] / 1024:>7.0f}" if r["rss_max_ko"] is not None else f"{'-':>7}"
+        ligne = (
+            f"{r['taille']:>8} | {r['mesure']:<26} | {r['ops_par_s']:>12,.1f} | "
+            f"{r['latence_ns']['p50'] / 1e3:>9.1f} | {r['latence_ns']['p99'] / 1e3:>9.1f} | {rss}"
+        )
+        ancien = anciens.get((r["taille"], r["mesure"]))
+        if ancien:
+            ligne += f" | {r['ops_par_s'] / ancien['ops_par_s']:>11.2f}x"
+        print(ligne)
+
+
+def main():
+    parseur = argparse.ArgumentParser(description="Suite de benchmarks de la banque")
+    parseur.add_argument("--tailles", type=int, nargs="+", default=TAILLES, help="nombres de comptes")
+    parseur.add_argument("--facteur", type=float, default=1.0, help="multiplie le nombre d'opérations")
+    parseur.add_argument("--sortie", help="fichier JSON des résultats (défaut : benchmarks/resultats/)")
+    parseur.add_argument("--comparer", help="fichier JSON d'une exécution précédente")
+    parseur.add_argument("--interne", nargs=2, metavar=("TAILLE", "FICHIER"), help=argparse.SUPPRESS)
+    arguments = parseur.parse_args()
+
+    if arguments.interne:
+        taille, fichier = arguments.interne
+        operations = nombres_operations(arguments.facteur)
+        with open(fichier, 'w', encoding='utf-8') as f:
+            json.dump(mesurer_taille(int(taille), operations), f)
+        return
+
+    rapport = executer(arguments.tailles, arguments.facteur)
+    sortie = arguments.sortie
+    if sortie is None:
+        os.makedirs(DOSSIER_RESULTATS, exist_ok=True)
+        horodatage = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        sortie = os.path.join(DOSSIER_RESULTATS, f"{horodatage}-{rapport['commit'] or 'local'}.json")
+    with open(sortie, 'w', encoding='utf-8') as f:
+        json.dump(rapport, f, ensure_ascii=False, indent=2)
+
+    reference = None
+    if arguments.comparer:
+        with open(arguments.comparer, 'r', encoding='utf-8') as f:
+            reference = json.load(f)
+    afficher(rapport, reference)
+    print(f"\n✔ Résultats écrits dans {sortie}")
+
+
+if __name__ == "__main__":
+    main()
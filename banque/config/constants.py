@@ -1,3 +1,50 @@
 FICHIER_BANQUE = "data/banque.json"
 SOLDE_MINIMUM = 100
 FORMAT_DATE = "%d/%m/%Y %H:%M:%S"
+EXTENSION_JOURNAL = ".journal"
+SEUIL_COMPACTION = 1000
+DOSSIER_HISTORIQUE = "historique"
+HISTORIQUE_EN_MEMOIRE = 20
+TAILLE_PAGE_HISTORIQUE = 10
+SERVEUR_HOTE = "127.0.0.1"
+SERVEUR_PORT = 8765
+TRANCHES_HISTOGRAMME = [0, 1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+CHARGEMENT_PARESSEUX = False
+SUFFIXE_SHARDS = "_shards"
+NOMBRE_SHARDS = 64
+TAILLE_CACHE_SHARDS = 8
+TAILLE_EXTREMES_STATISTIQUES = 64
+MOTEUR_STOCKAGE = "json"
+EXTENSION_SQLITE = ".sqlite3"
+SYNCHRONISATION_DISQUE = True
+FENETRE_GROUPE_COMMIT = 0.0
+CODEC_JSON = "auto"
+SEUIL_LECTURE_EN_FLUX = 64 * 1024 * 1024
+EXTENSION_INSTANTANE = ".colonnes"
+TAUX_INTERET_MENSUEL_PB = 10
+FRAIS_TENUE_COMPTE = 500
+FRAIS_SOLDE_BAS = 1_000
+TAILLE_PAGE_RECHERCHE = 20
+TAILLE_PAGE_COMPTES = 20
+EXTENSION_OPERATIONS = ".operations"
+CAPACITE_CACHE_OPERATIONS = 100_000
+DUREE_CACHE_OPERATIONS = 24 * 3600
+DOSSIER_REPARTI = "data/reparti"
+FENETRE_NOMBRE_RETRAITS = 60
+NOMBRE_MAX_RETRAITS = 5
+FENETRE_MONTANT_RETRAITS = 3600
+MONTANT_MAX_RETRAITS = 1_000_000
+TAILLE_FENETRE_VELOCITE = 60  # Seaux de temps : une minute sur l'heure de FENETRE_MONTANT_RETRAITS
+COMPTES_SURVEILLES_MAX = 100_000
+ALERTES_EN_MEMOIRE = 1000
+INTERVALLE_POINTS_CONTROLE = 4096
+INSTRUMENTATION_ACTIVE = False
+PRECISION_HISTOGRAMME_LATENCES = 7
+CIBLES_INSTRUMENTATION = {
+    "models.banque:Banque": None, "utils.file_manager:FileManager": None, "utils.validators:Validators": None,
+}
+FICHIER_INSTRUMENTATION = "data/instrumentation.json"
+ENTETE_CSV = ("numero_compte", "titulaire", "solde")
+SEPARATEUR_CSV = ","
+TAILLE_BLOC_CSV = 10_000
+EXTENSION_REJETS = ".rejets.csv"
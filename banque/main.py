@@ -1,7 +1,14 @@
+import sys
 from ui.menu import Menu
+from utils.instrumentation import INSTRUMENTATION
 """
     Main : La partie qui exécute tout le programme.
+
+    python main.py --instrumentation : mesure les opérations dès le démarrage
+    (consultables avec l'option 13 du menu).
 """
 if __name__ == "__main__":
+    if "--instrumentation" in sys.argv[1:]:
+        INSTRUMENTATION.activer()
     menu = Menu()
-    menu.executer()
\ No newline at end of file
+    menu.executer()
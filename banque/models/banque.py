@@ -1,25 +1,428 @@
+import csv
+import functools
+import gc
+import heapq
+import os
+import sys
+import threading
+import time
+from array import array
+from contextlib import contextmanager
 from models.compte_bancaire import CompteBancaire
-from utils.file_manager import FileManager
+from models.index_titulaires import IndexTitulaires, normaliser
+from models.montant import Montant
+from models.statistiques import StatistiquesBanque
+from models.traitement_mensuel import ReglesMensuelles, calculer_mouvements
+from models.transaction import Transaction
+from utils.cache_operations import CacheOperations
+from utils.csv_comptes import CsvComptes, FichierRejets
+from utils.ecrivain import EcrivainAsynchrone
+from utils.instantane_colonnes import InstantaneColonnes
+from utils.instrumentation import INSTRUMENTATION
+from utils.stockage import StockageJson
+from utils.stockage_shards import StockageShards
+from utils.stockage_sqlite import StockageSqlite
 from utils.validators import Validators
-from config.constants import FICHIER_BANQUE, SOLDE_MINIMUM
+from config.constants import (
+    FICHIER_BANQUE, SOLDE_MINIMUM, TAILLE_PAGE_HISTORIQUE, CHARGEMENT_PARESSEUX,
+    MOTEUR_STOCKAGE, FENETRE_GROUPE_COMMIT, TAILLE_PAGE_RECHERCHE,
+    TAILLE_PAGE_COMPTES, EXTENSION_OPERATIONS, INSTRUMENTATION_ACTIVE, SEPARATEUR_CSV,
+    EXTENSION_REJETS
+)
+
+
+# Clés de tri des listes de comptes ; le numéro final rend chaque clé unique
+CLES_TRI = {
+    "numero": lambda compte: (compte.get_numero_compte(),),
+    "solde": lambda compte: (compte.get_solde(), compte.get_numero_compte()),
+    "titulaire": lambda compte: (normaliser(compte.get_titulaire()), compte.get_numero_compte()),
+}
+
+
+class _LotAnnule(Exception):
+    """ Interrompt un lot atomique après un échec """
+
+
+class _EtatLot(threading.local):
+    """ Lot ouvert par le thread courant : chaque thread voit le sien """
+
+    def __init__(self):
+        # État des comptes avant leur première modification (None : pas de lot)
+        self.etats = None
+        # Lots imbriqués ouverts : état des comptes avant leur première modification dans chacun
+        self.points = []
+        self.transactions = []
+        # Résultats des opérations identifiées, enregistrés si le lot est validé
+        self.operations = {}
+
+
+class _Barriere:
+    """ Les opérations ordinaires passent en parallèle ; un lot attend qu'elles
+        soient terminées puis les tient à l'écart jusqu'à sa fin. Sinon un dépôt
+        d'un autre thread, déjà annoncé comme réussi, serait annulé avec le lot.
+        Les opérations du thread qui a ouvert le lot passent. """
+
+    def __init__(self):
+        self.__condition = threading.Condition()
+        self.__en_cours = 0
+        self.__proprietaire = None
+
+    @contextmanager
+    def operation(self):
+        if self.__proprietaire == threading.get_ident():
+            yield
+            return
+        with self.__condition:
+            self.__condition.wait_for(lambda: self.__proprietaire is None)
+            self.__en_cours += 1
+        try:
+            yield
+        finally:
+            with self.__condition:
+                self.__en_cours -= 1
+                if not self.__en_cours:
+                    self.__condition.notify_all()
+
+    @contextmanager
+    def lot(self):
+        with self.__condition:
+            self.__condition.wait_for(lambda: self.__proprietaire is None and not self.__en_cours)
+            self.__proprietaire = threading.get_ident()
+        try:
+            yield
+        finally:
+            with self.__condition:
+                self.__proprietaire = None
+                self.__condition.notify_all()
+
+
+@contextmanager
+def _verrouiller(*comptes):
+    """ Verrouille des comptes toujours dans le même ordre (numéro croissant),
+        ce qui évite les interblocages entre transferts croisés """
+    verrous = [c.verrou for c in sorted(comptes, key=CompteBancaire.get_numero_compte)]
+    for verrou in verrous:
+        verrou.acquire()
+    try:
+        yield
+    finally:
+        for verrou in reversed(verrous):
+            verrou.release()
+
+
+def _idempotente(methode):
+    """ Ajoute à une opération le paramètre identifiant : renvoyée avec le même
+        identifiant, l'opération retourne son premier résultat sans être rejouée """
+    @functools.wraps(methode)
+    def operation(self, *args, identifiant=None, **kwargs):
+        if identifiant is None:
+            return methode(self, *args, **kwargs)
+        return self.executer_une_fois(identifiant, lambda: methode(self, *args, **kwargs))
+    return operation
+
+
+def _hors_lot(methode):
+    """ Opération qui modifie des comptes : attend la fin d'un lot ouvert par un autre thread """
+    @functools.wraps(methode)
+    def operation(self, *args, **kwargs):
+        with self._barriere.operation():
+            return methode(self, *args, **kwargs)
+    return operation
+
+
+@contextmanager
+def _sans_ramasse_miettes():
+    """ Suspend le ramasse-miettes cyclique pendant la création de millions d'objets
+        (sinon ses passages répétés sur tous les comptes dominent le temps) """
+    actif = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if actif:
+            gc.enable()
 
 
 class Banque:
-    """ Classe représentant la banque """
-
-    def __init__(self, nom_banque):
+    """ Classe représentant la banque (tous les montants sont en centimes, voir Montant)
+
+        Les opérations sont sûres entre threads : chaque compte a son verrou.
+        Avec asynchrone=True, les écritures sur disque sont confiées à un
+        thread d'écriture qui regroupe les sauvegardes en attente.
+        Avec paresseux=True, les comptes sont répartis en shards sur disque et
+        chargés à la demande : le démarrage ne dépend plus de la taille de la banque.
+        moteur choisit le stockage : "json" (instantané + journal) ou "sqlite".
+    """
+
+    def __init__(self, nom_banque, fichier=FICHIER_BANQUE, asynchrone=False,
+                 paresseux=CHARGEMENT_PARESSEUX, moteur=MOTEUR_STOCKAGE):
+        if asynchrone and paresseux:
+            raise ValueError("Le chargement paresseux ne fonctionne pas avec le thread d'écriture")
+        if moteur not in ("json", "sqlite"):
+            raise ValueError(f"Moteur de stockage inconnu : {moteur}")
+        if moteur == "sqlite" and paresseux:
+            raise ValueError("Le chargement paresseux n'existe que pour le moteur json")
         self.nom_banque = nom_banque
-        self.__comptes = []
+        self.fichier = fichier
+        if INSTRUMENTATION_ACTIVE:
+            INSTRUMENTATION.activer()
+        if moteur == "sqlite":
+            self.__stockage = StockageSqlite(fichier)
+        else:
+            self.__stockage = StockageShards(fichier) if paresseux else StockageJson(fichier)
+        # Comptes indexés par numéro (dict ordonné, ou shards chargés à la demande)
+        self.__comptes = {}
+        # Protège l'ajout/suppression de comptes et les écritures sur disque
+        self.__verrou = threading.RLock()
+        # Lot en cours du thread courant, et exclusion des autres threads pendant un lot
+        self.__courant = _EtatLot()
+        self._barriere = _Barriere()
+        # Avec le thread d'écriture, un résultat n'est journalisé qu'après l'écriture de l'opération
+        self.__operations = CacheOperations(
+            os.path.splitext(fichier)[0] + EXTENSION_OPERATIONS,
+            differer=self.__differer_resultat if asynchrone else None,
+        )
+        self.__statistiques = StatistiquesBanque(
+            self.__solde_actuel, self.__tous_les_comptes,
+            groupe=self.__shard_du_compte if paresseux else None
+        )
+        # Index des titulaires, construit à la première recherche
+        self.__index = None
         self.__charger_comptes()
+        self.__ecrivain = (
+            EcrivainAsynchrone(self.__ecrire_durable, FENETRE_GROUPE_COMMIT) if asynchrone else None
+        )
+
+    def __len__(self):
+        return len(self.__comptes)
 
     def __charger_comptes(self):
         """ Charge les comptes depuis le fichier """
-        self.__comptes = FileManager.charger_comptes(FICHIER_BANQUE)
+        self.__comptes = self.__stockage.charger()
+        sauvegardees = self.__stockage.statistiques_sauvegardees()
+        if not (sauvegardees and self.__statistiques.importer(sauvegardees)):
+            self.__statistiques.reconstruire(self.__comptes.values())
+
+    def __tous_les_comptes(self):
+        return list(self.__comptes.values())
+
+    def __solde_actuel(self, numero_compte):
+        compte = self.__comptes.get(numero_compte)
+        return compte.get_solde() if compte else None
+
+    def __shard_du_compte(self, numero_compte):
+        return self.__comptes.indice(numero_compte)
+
+    def __indexer(self, numero_compte, titulaire):
+        """ Reporte dans l'index un nouveau titulaire (None : compte supprimé) """
+        if self.__index is not None:
+            self.__index.modifier(numero_compte, titulaire)
+
+    def __memoriser(self, numero_compte):
+        """ Retient l'état d'un compte avant sa première modification dans un lot
+            (et dans chaque lot imbriqué ouvert) """
+        if self.__courant.etats is None:
+            return
+        for etats in (self.__courant.etats, *self.__courant.points):
+            if numero_compte not in etats:
+                compte = self.__comptes.get(numero_compte)
+                etats[numero_compte] = (compte, compte.sauvegarder_etat() if compte else None)
+
+    def __sauvegarder(self, *comptes, transactions=False):
+        """ Persiste les comptes modifiés et, si demandé, leur dernière transaction
+            (transactions=True) ou les paires (numéro, transaction) données """
+        if transactions is True:
+            transactions = [(c.get_numero_compte(), c.historique[-1]) for c in comptes]
+        if self.__courant.etats is not None:
+            # Écriture différée à la fin du lot
+            if transactions:
+                self.__courant.transactions.extend(transactions)
+            return
+        self.__persister([compte.to_dict() for compte in comptes], transactions=transactions or ())
+
+    def __sauvegarder_suppression(self, numero_compte):
+        """ Persiste la suppression d'un compte """
+        if self.__courant.etats is not None:
+            return
+        self.__persister(suppressions=[numero_compte])
 
-    def __sauvegarder(self):
-        """ Sauvegarde les comptes dans le fichier """
-        return FileManager.sauvegarder_comptes(FICHIER_BANQUE, self.__comptes)
+    def __persister(self, infos=(), suppressions=(), transactions=()):
+        """ Écrit tout de suite, ou confie l'écriture au thread d'écriture """
+        if self.__ecrivain is not None:
+            self.__ecrivain.soumettre(infos, suppressions, transactions)
+            return
+        with self.__verrou:
+            self.__ecrire(infos, suppressions, transactions)
+        # Hors du verrou : les threads qui écrivent en même temps partagent un fsync
+        self.__stockage.synchroniser()
+
+    def __ecrire_durable(self, infos, suppressions, transactions, operations):
+        """ Écriture du thread d'écriture : un fsync par écriture regroupée, puis
+            les résultats des opérations identifiées (durables après leurs effets) """
+        self.__ecrire(infos, suppressions, transactions)
+        self.__stockage.synchroniser()
+        if operations:
+            self.__operations.journaliser(operations)
+
+    def __differer_resultat(self, enregistrement):
+        """ Confie un résultat au thread d'écriture, derrière les sauvegardes déjà soumises """
+        self.__ecrivain.soumettre(operations=[enregistrement])
+
+    def __ecrire(self, infos, suppressions, transactions):
+        """ Écrit les comptes modifiés et leurs transactions """
+        with self.__verrou:
+            self.__stockage.ecrire(infos, suppressions, transactions)
+
+            if self.__stockage.doit_compacter(len(self.__comptes)):
+                # Les comptes en mémoire peuvent être en cours de transfert (débité,
+                # pas encore crédité) : on compacte à partir des seules données déjà persistées
+                self.__stockage.replier()
+
+    def compacter(self):
+        """ Réécrit l'instantané complet et vide le journal, à partir des données persistées """
+        if self.__ecrivain is not None:
+            self.__ecrivain.vider()
+        with self.__verrou:
+            return self.__stockage.replier()
+
+    def fermer(self):
+        """ Arrête le thread d'écriture, compacte le journal et libère le fichier """
+        if self.__ecrivain is not None:
+            self.__ecrivain.arreter()
+            self.__ecrivain = None
+        with self.__verrou:
+            self.__stockage.fermer(self.__comptes, self.__statistiques.exporter())
+        self.__operations.fermer()
+
+    def resultat_operation(self, identifiant):
+        """ Résultat enregistré pour cet identifiant client, ou None (rien n'est exécuté) """
+        if self.__courant.etats is not None and identifiant in self.__courant.operations:
+            return self.__courant.operations[identifiant]
+        return self.__operations.chercher(identifiant)
+
+    def executer_une_fois(self, identifiant, operation):
+        """ Exécute operation() une seule fois pour cet identifiant client :
+            les appels suivants retournent le résultat enregistré (O(1)) """
+        if self.__courant.etats is None:
+            return self.__operations.executer(identifiant, operation)
+        resultat = self.__courant.operations.get(identifiant) or self.__operations.chercher(identifiant)
+        if resultat is None:
+            resultat = operation()
+            self.__courant.operations[identifiant] = resultat
+        return resultat
+
+    @contextmanager
+    def lot(self):
+        """ Regroupe des opérations : une seule écriture à la fin du bloc,
+            et annulation de toutes les opérations si une exception survient.
+            Le lot appartient au thread qui l'ouvre ; les opérations des autres
+            threads attendent sa fin. """
+        if self.__courant.etats is not None:
+            # Lot imbriqué : écrit avec le lot englobant, mais annulé seul
+            # (point de sauvegarde) si une exception en sort
+            point = {}
+            nombre_transactions = len(self.__courant.transactions)
+            operations = dict(self.__courant.operations)
+            self.__courant.points.append(point)
+            try:
+                yield self
+            except BaseException:
+                self.__restaurer(point)
+                del self.__courant.transactions[nombre_transactions:]
+                self.__courant.operations = operations
+                raise
+            finally:
+                self.__courant.points.pop()
+            return
 
+        with self._barriere.lot():
+            self.__courant.etats = {}
+            self.__courant.transactions = []
+            self.__courant.operations = {}
+            # Les comptes touchés restent en mémoire jusqu'à l'écriture du lot
+            with self.__stockage.figer():
+                try:
+                    yield self
+                except BaseException:
+                    self.__annuler_lot()
+                    raise
+                else:
+                    self.__valider_lot()
+
+    def __valider_lot(self):
+        """ Persiste en une seule fois toutes les modifications du lot """
+        numeros, transactions = self.__courant.etats, self.__courant.transactions
+        self.__courant.etats, self.__courant.transactions = None, []
+        if numeros:
+            self.__persister(
+                [self.__comptes[n].to_dict() for n in numeros if n in self.__comptes],
+                [n for n in numeros if n not in self.__comptes],
+                [(n, transaction) for n, transaction in transactions if n in self.__comptes],
+            )
+        # Après l'écriture des comptes : un résultat enregistré est un résultat persisté
+        operations, self.__courant.operations = self.__courant.operations, {}
+        for identifiant, resultat in operations.items():
+            self.__operations.enregistrer(identifiant, resultat)
+
+    def __annuler_lot(self):
+        """ Remet les comptes touchés par le lot dans leur état initial """
+        etats = self.__courant.etats
+        self.__courant.etats, self.__courant.transactions, self.__courant.operations = None, [], {}
+        self.__restaurer(etats)
+
+    def __restaurer(self, etats):
+        """ Remet des comptes dans l'état mémorisé par __memoriser """
+        for numero, (compte, etat) in etats.items():
+            actuel = self.__comptes.get(numero)
+            if compte is None:
+                if actuel:
+                    del self.__comptes[numero]
+                    self.__statistiques.retirer(numero, actuel.get_solde())
+                    self.__indexer(numero, None)
+                continue
+            solde_lot = compte.get_solde()
+            titulaire_lot = compte.get_titulaire() if actuel is compte else None
+            compte.restaurer_etat(etat)
+            self.__comptes[numero] = compte
+            if compte.get_titulaire() != titulaire_lot:
+                self.__indexer(numero, compte.get_titulaire())
+            if actuel is compte:
+                self.__statistiques.modifier(numero, solde_lot, compte.get_solde())
+            else:
+                self.__statistiques.ajouter(numero, compte.get_solde())
+
+    @_idempotente
+    def appliquer_lot(self, operations, atomique=False):
+        """ Applique une liste d'opérations avec une seule sauvegarde.
+
+            Chaque opération est un tuple : ("depot", numero, montant),
+            ("retrait", numero, montant) ou ("transfert", source, dest, montant).
+            En mode atomique, le premier échec annule tout le lot.
+            Retourne (succès global, liste des (succès, message)).
+        """
+        actions = {
+            "depot": self.effectuer_depot,
+            "retrait": self.effectuer_retrait,
+            "transfert": self.transferer,
+        }
+        resultats = []
+        try:
+            with self.lot():
+                for operation in operations:
+                    action = actions.get(operation[0])
+                    if action is None:
+                        resultat = (False, f"Opération inconnue : {operation[0]}")
+                    else:
+                        resultat = action(*operation[1:])
+                    resultats.append(resultat)
+                    if atomique and not resultat[0]:
+                        raise _LotAnnule()
+        except _LotAnnule:
+            return False, resultats
+        return all(succes for succes, _ in resultats), resultats
+
+    @_idempotente
+    @_hors_lot
     def ouvrir_compte(self, titulaire, numero_compte, solde):
         """ Ouvre un nouveau compte """
         # Vérifications
@@ -32,23 +435,46 @@ class Banque:
         if not Validators.valider_solde(solde):
             return False, f"Solde minimum : {SOLDE_MINIMUM} Fcfa"
 
-        # Vérifier si le compte existe déjà
-        if self.chercher_compte(numero_compte):
-            return False, f"Le compte No {numero_compte} existe déjà"
-
-        # Créer le compte
-        nouveau_compte = CompteBancaire(titulaire, numero_compte, solde)
-        self.__comptes.append(nouveau_compte)
-        self.__sauvegarder()
+        with self.__verrou:
+            # Vérifier si le compte existe déjà
+            if numero_compte in self.__comptes:
+                return False, f"Le compte No {numero_compte} existe déjà"
+
+            # Créer le compte
+            self.__memoriser(numero_compte)
+            nouveau_compte = CompteBancaire(titulaire, numero_compte, solde)
+            self.__comptes[numero_compte] = nouveau_compte
+            self.__statistiques.ajouter(numero_compte, nouveau_compte.get_solde())
+            self.__indexer(numero_compte, titulaire)
+            # L'ouverture date le solde initial dans l'historique sur disque
+            ouverture = Transaction(Transaction.OUVERTURE, solde, time.time(), solde)
+            self.__sauvegarder(nouveau_compte, transactions=[(numero_compte, ouverture)])
         return True, f"Compte No {numero_compte} créé avec succès"
 
+    def rechercher_titulaire(self, texte, curseur=None, taille_page=TAILLE_PAGE_RECHERCHE):
+        """ Comptes dont un mot du titulaire commence par texte, sans tenir
+            compte de la casse ni des accents, par pages de taille_page.
+            Retourne (comptes, curseur de la page suivante ou None). """
+        if self.__index is None:
+            with self.__verrou:
+                if self.__index is None:
+                    index = IndexTitulaires()
+                    index.reconstruire(self.__comptes.values())
+                    self.__index = index
+        numeros, suivant = self.__index.rechercher(texte, curseur, taille_page)
+        comptes = [self.__comptes.get(numero) for numero in numeros]
+        return [compte for compte in comptes if compte is not None], suivant
+
     def chercher_compte(self, numero_compte):
-        """ Recherche un compte par son numéro """
-        for compte in self.__comptes:
-            if compte.get_numero_compte() == numero_compte:
-                return compte
-        return None
+        """ Recherche un compte par son numéro (O(1)) """
+        return self.__comptes.get(numero_compte)
 
+    def __est_ouvert(self, *comptes):
+        """ Vérifie, sous verrou, que les comptes n'ont pas été supprimés entre-temps """
+        return all(self.__comptes.get(c.get_numero_compte()) is c for c in comptes)
+
+    @_idempotente
+    @_hors_lot
     def modifier_compte(self, numero_compte, nouveau_titulaire):
         """ Modifier les comptes dans le fichier """
 
@@ -60,29 +486,39 @@ class Banque:
 
         # si le compte existe
         if compte:
-            compte.set_titulaire(nouveau_titulaire)
-            self.__sauvegarder()
-            return True, f"Le compte No {numero_compte} a été modifié avec succès."
+            # self.__verrou : l'index ne doit pas être construit pendant le changement
+            with _verrouiller(compte), self.__verrou:
+                if self.__est_ouvert(compte):
+                    self.__memoriser(numero_compte)
+                    compte.set_titulaire(nouveau_titulaire)
+                    self.__indexer(numero_compte, nouveau_titulaire)
+                    self.__sauvegarder(compte)
+                    return True, f"Le compte No {numero_compte} a été modifié avec succès."
 
         # Si le compte n'existe pas
-        else :
-            return False, f"Le compte No {numero_compte} n'existe pas."
+        return False, f"Le compte No {numero_compte} n'existe pas."
 
 
+    @_idempotente
+    @_hors_lot
     def supprimer_compte(self, numero_compte):
         """ Supprimer un compte dans le fichier """
 
-        # Chercher le compte
         compte = self.chercher_compte(numero_compte)
-
         if compte:
-            self.__comptes.remove(compte)
-            self.__sauvegarder()
-            return True, f"Le compte No {numero_compte} a été supprimé avec succès."
-        else:
-            return False, f"Le compte No {numero_compte} n'existe pas."
-
-
+            with _verrouiller(compte), self.__verrou:
+                if self.__est_ouvert(compte):
+                    self.__memoriser(numero_compte)
+                    del self.__comptes[numero_compte]
+                    self.__statistiques.retirer(numero_compte, compte.get_solde())
+                    self.__indexer(numero_compte, None)
+                    self.__sauvegarder_suppression(numero_compte)
+                    return True, f"Le compte No {numero_compte} a été supprimé avec succès."
+        return False, f"Le compte No {numero_compte} n'existe pas."
+
+
+    @_idempotente
+    @_hors_lot
     def effectuer_depot(self, numero_compte, montant):
         """ Effectue un dépôt sur un compte """
 
@@ -93,12 +529,20 @@ class Banque:
         if not Validators.valider_montant(montant):
             return False, "Montant invalide"
 
-        if compte.deposer(montant):
-            self.__sauvegarder()
-            return True, f"Dépôt de {montant} Fcfa effectué"
+        with _verrouiller(compte):
+            if not self.__est_ouvert(compte):
+                return False, f"Compte No {numero_compte} introuvable"
+            self.__memoriser(numero_compte)
+            solde_avant = compte.get_solde()
+            if compte.deposer(montant):
+                self.__statistiques.modifier(numero_compte, solde_avant, compte.get_solde())
+                self.__sauvegarder(compte, transactions=True)
+                return True, f"Dépôt de {Montant.formater(montant)} Fcfa effectué"
         return False, "Échec du dépôt"
 
 
+    @_idempotente
+    @_hors_lot
     def effectuer_retrait(self, numero_compte, montant):
         """ Effectue un retrait sur un compte """
 
@@ -109,11 +553,19 @@ class Banque:
         if not Validators.valider_montant(montant):
             return False, "Montant invalide"
 
-        if compte.retirer(montant):
-            self.__sauvegarder()
-            return True, f"Retrait de {montant} Fcfa effectué"
+        with _verrouiller(compte):
+            if not self.__est_ouvert(compte):
+                return False, f"Compte No {numero_compte} introuvable"
+            self.__memoriser(numero_compte)
+            solde_avant = compte.get_solde()
+            if compte.retirer(montant):
+                self.__statistiques.modifier(numero_compte, solde_avant, compte.get_solde())
+                self.__sauvegarder(compte, transactions=True)
+                return True, f"Retrait de {Montant.formater(montant)} Fcfa effectué"
         return False, "Fonds insuffisants"
 
+    @_idempotente
+    @_hors_lot
     def transferer(self, numero_source, numero_dest, montant):
         """ Transfère de l'argent entre deux comptes """
 
@@ -129,44 +581,271 @@ class Banque:
         if numero_source == numero_dest:
             return False, "Impossible de transférer vers le même compte"
 
-        solde_avant = compte_source.get_solde()
-        if compte_source.retirer(montant):
-            if compte_source.get_solde() < solde_avant:
+        if not Validators.valider_montant(montant):
+            return False, "Montant invalide"
+
+        # Le solde est lu, débité et crédité sous les deux verrous :
+        # aucune mise à jour ne peut se perdre
+        with _verrouiller(compte_source, compte_dest):
+            if not self.__est_ouvert(compte_source, compte_dest):
+                return False, "Échec du transfert"
+            self.__memoriser(numero_source)
+            self.__memoriser(numero_dest)
+            source_avant, dest_avant = compte_source.get_solde(), compte_dest.get_solde()
+            if compte_source.retirer(montant):
                 compte_dest.deposer(montant)
-                self.__sauvegarder()
-                return True, f"Transfert de {montant} Fcfa effectué"
+                self.__statistiques.modifier(numero_source, source_avant, compte_source.get_solde())
+                self.__statistiques.modifier(numero_dest, dest_avant, compte_dest.get_solde())
+                self.__sauvegarder(compte_source, compte_dest, transactions=True)
+                return True, f"Transfert de {Montant.formater(montant)} Fcfa effectué"
 
         return False, "Échec du transfert"
 
-    def lister_comptes(self):
-        """ Liste tous les comptes """
-
-        if not self.__comptes:
-            print(f"❌ Aucun compte dans {self.nom_banque}")
-            return
-
-        print(f"\\n{'='*50}")
-        print(f"COMPTES - {self.nom_banque}")
-        print('='*50)
-        for compte in self.__comptes:
-            compte.get_infos()
+    @_idempotente
+    @_hors_lot
+    def appliquer_traitement_mensuel(self, regles=None):
+        """ Applique intérêts et frais à tous les comptes en un seul traitement :
+            calcul d'un bloc sur la colonne des soldes, puis une seule écriture.
+            Tous les comptes sont verrouillés pendant le traitement. """
+        regles = regles or ReglesMensuelles()
+        if self.__courant.etats is not None:
+            return False, "Le traitement mensuel ne peut pas faire partie d'un lot"
+
+        comptes = list(self.__comptes.values())
+        with _verrouiller(*comptes), self.__verrou, _sans_ramasse_miettes():
+            comptes = [c for c in comptes if self.__comptes.get(c.get_numero_compte()) is c]
+            soldes = array('q', [c.get_solde() for c in comptes])
+            interets, frais = calculer_mouvements(soldes, regles)
+
+            horodatage = time.time()
+            modifies, transactions = [], []
+            for compte, interet, montant_frais in zip(comptes, interets, frais):
+                if not (interet or montant_frais):
+                    continue
+                numero = compte.get_numero_compte()
+                if interet:
+                    transactions.append((numero, compte.appliquer_mouvement(Transaction.INTERETS, interet, horodatage)))
+                if montant_frais:
+                    transactions.append((numero, compte.appliquer_mouvement(Transaction.FRAIS, -montant_frais, horodatage)))
+                modifies.append(compte.to_dict())
+
+            # Un recalcul complet coûte moins que n mises à jour des tas
+            self.__statistiques.reconstruire(self.__comptes.values())
+            self.__persister(modifies, transactions=transactions)
+        self.compacter()
+        return True, (
+            f"Traitement mensuel : {len(modifies)} compte(s), intérêts "
+            f"{Montant.formater(sum(interets))} Fcfa, frais {Montant.formater(sum(frais))} Fcfa"
+        )
+
+    def exporter_instantane(self, fichier):
+        """ Écrit un instantané binaire en colonnes (numéros, titulaires, soldes).
+            Tous les comptes sont verrouillés : aucun transfert n'est vu à moitié. """
+        comptes = list(self.__comptes.values())
+        with _verrouiller(*comptes), self.__verrou:
+            nombre = InstantaneColonnes.ecrire(fichier, self.__comptes.values())
+        return True, f"{nombre} compte(s) exporté(s) dans {fichier}"
+
+    def importer_instantane(self, fichier):
+        """ Restaure les comptes d'un instantané en colonnes dans une banque vide """
+        # Le lot d'abord : il attend la fin des opérations des autres threads
+        with self.lot(), self.__verrou:
+            if len(self.__comptes):
+                return False, "L'import d'un instantané demande une banque vide"
+            try:
+                instantane = InstantaneColonnes(fichier)
+            except (OSError, ValueError) as e:
+                return False, f"Instantané illisible : {e}"
+            with instantane:
+                for compte in instantane.comptes():
+                    numero_compte = compte.get_numero_compte()
+                    self.__memoriser(numero_compte)
+                    self.__comptes[numero_compte] = compte
+                    self.__statistiques.ajouter(numero_compte, compte.get_solde())
+                    self.__indexer(numero_compte, compte.get_titulaire())
+                    self.__sauvegarder(compte)
+        return True, f"{len(instantane)} compte(s) importé(s)"
+
+    def importer_csv(self, fichier, fichier_rejets=None, separateur=SEPARATEUR_CSV):
+        """ Ouvre les comptes d'un fichier CSV (numéro, titulaire, solde en Fcfa).
+
+            Le fichier est lu par blocs et chaque ligne est validée comme dans
+            ouvrir_compte ; les doublons (dans le fichier ou avec la banque) sont
+            repérés par ensemble. Les lignes refusées vont dans fichier_rejets
+            (par défaut : <fichier>.rejets.csv), les autres sont persistées en
+            une seule écriture à la fin. Une erreur de lecture annule tout l'import.
+        """
+        if fichier_rejets is None:
+            fichier_rejets = os.path.splitext(fichier)[0] + EXTENSION_REJETS
+        lignes_vues = {}
+        importes = 0
+        try:
+            with FichierRejets(fichier_rejets, separateur) as rejets, self.lot(), self.__verrou:
+                for bloc in CsvComptes.lire_blocs(fichier, separateur=separateur):
+                    for numero_ligne, champs in bloc:
+                        compte, motif = CsvComptes.analyser(champs)
+                        if compte is not None:
+                            numero_compte = compte.get_numero_compte()
+                            if numero_compte in lignes_vues:
+                                motif = f"Numéro déjà présent ligne {lignes_vues[numero_compte]}"
+                            elif numero_compte in self.__comptes:
+                                motif = f"Le compte No {numero_compte} existe déjà"
+                        if motif is not None:
+                            rejets.ajouter(numero_ligne, motif, champs)
+                            continue
+                        lignes_vues[numero_compte] = numero_ligne
+                        self.__memoriser(numero_compte)
+                        self.__comptes[numero_compte] = compte
+                        self.__statistiques.ajouter(numero_compte, compte.get_solde())
+                        self.__indexer(numero_compte, compte.get_titulaire())
+                        self.__sauvegarder(compte)
+                        importes += 1
+        except (OSError, UnicodeDecodeError, csv.Error) as e:
+            return False, f"Import impossible : {e}"
+        message = f"{importes} compte(s) importé(s)"
+        if rejets.nombre:
+            message += f", {rejets.nombre} ligne(s) rejetée(s) (voir {fichier_rejets})"
+        return True, message
+
+    def exporter_csv(self, fichier, separateur=SEPARATEUR_CSV):
+        """ Écrit tous les comptes dans un fichier CSV, au fil de l'eau.
+            Tous les comptes sont verrouillés : aucun transfert n'est vu à moitié. """
+        comptes = list(self.__comptes.values())
+        try:
+            with _verrouiller(*comptes), self.__verrou:
+                nombre = CsvComptes.ecrire(fichier, self.__comptes.values(), separateur)
+        except OSError as e:
+            return False, f"Export impossible : {e}"
+        return True, f"{nombre} compte(s) exporté(s) dans {fichier}"
+
+    def page_comptes(self, tri="numero", curseur=None, taille_page=TAILLE_PAGE_COMPTES,
+                     solde_min=None, solde_max=None, decroissant=False):
+        """ Une page de comptes triés par tri ("numero", "solde" ou "titulaire"),
+            éventuellement limités à un intervalle de soldes (centimes).
+
+            Pagination par clé : une page est la sélection des taille_page
+            premiers comptes après curseur (heapq), seuls ces comptes sont
+            retenus en mémoire. Retourne (comptes, curseur de la page suivante
+            ou None). """
+        if tri not in CLES_TRI:
+            raise ValueError(f"Tri inconnu : {tri}")
+        if taille_page <= 0:
+            raise ValueError(f"Taille de page invalide : {taille_page}")
+        cle = CLES_TRI[tri]
+        with self.__verrou:
+            candidats = (
+                (cle(compte), compte) for compte in self.__comptes.values()
+                if (solde_min is None or compte.get_solde() >= solde_min)
+                and (solde_max is None or compte.get_solde() <= solde_max)
+            )
+            if curseur is not None:
+                curseur = tuple(curseur)
+                candidats = (
+                    (c, compte) for c, compte in candidats
+                    if (c < curseur if decroissant else c > curseur)
+                )
+            selection = heapq.nlargest if decroissant else heapq.nsmallest
+            # taille_page + 1 : savoir s'il reste une page après celle-ci
+            page = selection(taille_page + 1, candidats, key=lambda paire: paire[0])
+        if len(page) <= taille_page:
+            return [compte for _, compte in page], None
+        page.pop()
+        return [compte for _, compte in page], page[-1][0]
+
+    def parcourir_comptes(self, tri="numero", taille_page=TAILLE_PAGE_COMPTES,
+                          solde_min=None, solde_max=None, decroissant=False):
+        """ Parcourt les comptes page par page (générateur de listes) """
+        curseur = None
+        while True:
+            page, curseur = self.page_comptes(tri, curseur, taille_page, solde_min, solde_max, decroissant)
+            if page:
+                yield page
+            if curseur is None:
+                return
+
+    def lister_comptes(self, tri="numero", curseur=None, taille_page=TAILLE_PAGE_COMPTES,
+                       solde_min=None, solde_max=None, decroissant=False):
+        """ Affiche une page de comptes et retourne le curseur de la suivante (ou None) """
+
+        page, suivant = self.page_comptes(tri, curseur, taille_page, solde_min, solde_max, decroissant)
+        if not page:
+            if curseur is None:
+                print(f"❌ Aucun compte dans {self.nom_banque}")
+            return None
+
+        # Une seule écriture par page plutôt que cinq print par compte
+        lignes = [compte.formater_infos() for compte in page]
+        if curseur is None:
+            lignes.insert(0, f"\\n{'='*50}\nCOMPTES - {self.nom_banque}\n{'='*50}")
+        sys.stdout.write("\n".join(lignes) + "\n")
+        return suivant
+
+    def statistiques(self):
+        """ Retourne les statistiques de la banque, tenues à jour à chaque opération """
+        return self.__statistiques.resume()
+
+    def verifier_statistiques(self):
+        """ Audit : compare les agrégats à un recalcul complet et retourne les écarts """
+        with self.__verrou:
+            return self.__statistiques.verifier(list(self.__comptes.values()))
+
+    def reconstruire_statistiques(self):
+        """ Recalcule entièrement les agrégats (O(n)) """
+        with self.__verrou:
+            self.__statistiques.reconstruire(list(self.__comptes.values()))
 
     def obtenir_statistiques(self):
         """ Affiche les statistiques de la banque """
 
-        total_actifs = sum(c.get_solde() for c in self.__comptes)
+        stats = self.statistiques()
         print(f"\\n{'='*50}")
         print(f"STATISTIQUES - {self.nom_banque}")
         print('='*50)
-        print(f"Nombre de comptes : {len(self.__comptes)}")
-        print(f"Total des actifs : {total_actifs} Fcfa")
+        print(f"Nombre de comptes : {stats['nombre_comptes']}")
+        print(f"Total des actifs : {Montant.formater(stats['total_actifs'])} Fcfa")
+        if stats['nombre_comptes']:
+            print(f"Solde minimum : {Montant.formater(stats['solde_min'])} Fcfa")
+            print(f"Solde maximum : {Montant.formater(stats['solde_max'])} Fcfa")
+            print("Répartition des soldes :")
+            for tranche, effectif in stats['histogramme'].items():
+                print(f"  {tranche:>20} Fcfa : {effectif}")
         print('='*50)
 
-    def afficher_historique(self, numero_compte):
-        """ Affiche l'historique d'un compte """
+    def historique(self, numero_compte, debut=None, fin=None, taille_page=TAILLE_PAGE_HISTORIQUE):
+        """ Parcourt l'historique d'un compte depuis le disque, page par page """
+        return self.__stockage.historique.pages(numero_compte, taille_page, debut, fin)
+
+    def solde_au(self, numero_compte, date):
+        """ Solde (centimes) d'un compte à une date (datetime) : 0 avant son ouverture,
+            None si le compte n'existe pas ou si son solde à cette date est inconnu.
+
+            Lu dans l'historique à partir du point de contrôle le plus proche :
+            O(log n + k) quelle que soit la longueur de l'historique.
+        """
+        compte = self.chercher_compte(numero_compte)
+        if not compte:
+            return None
+        solde = self.__stockage.historique.solde_au(numero_compte, date)
+        if solde is not None:
+            return solde
+        # Compte sans historique (importé en masse) : seul le solde actuel est connu
+        return compte.get_solde() if date.timestamp() >= time.time() else None
+
+    def afficher_historique(self, numero_compte, debut=None, fin=None):
+        """ Affiche l'historique d'un compte en le lisant au fil de l'eau """
 
         compte = self.chercher_compte(numero_compte)
         if not compte:
             print(f"❌ Compte No {numero_compte} introuvable")
             return
-        compte.afficher_historique()
\ No newline at end of file
+
+        print("\\n" + "=" * 50)
+        print(f"Historique - Compte No : {numero_compte}")
+        print("=" * 50)
+        vide = True
+        for page in self.historique(numero_compte, debut, fin):
+            vide = False
+            for transaction in page:
+                CompteBancaire.afficher_transaction(transaction)
+        if vide:
+            print(" ❌ Aucune transaction effectuée.")
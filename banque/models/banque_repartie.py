@@ -0,0 +1,367 @@
+import contextlib
+import json
+import multiprocessing
+import os
+import threading
+import uuid
+import zlib
+from models.banque import Banque
+from models.montant import Montant
+from utils.file_manager import FileManager
+from utils.journal import Journal
+from utils.validators import Validators
+from config.constants import (
+    DOSSIER_REPARTI, EXTENSION_JOURNAL, SEUIL_COMPACTION, SYNCHRONISATION_DISQUE
+)
+
+# Méthodes de Banque qu'un processus accepte d'exécuter pour le routeur
+METHODES_BANQUE = {
+    "ouvrir_compte", "modifier_compte", "effectuer_depot", "effectuer_retrait",
+    "transferer", "appliquer_lot", "appliquer_traitement_mensuel", "statistiques",
+}
+
+# Opérations d'un lot et leur nombre d'éléments (code compris)
+ARITES_OPERATIONS = {"depot": 3, "retrait": 3, "transfert": 4}
+
+
+class _Participant:
+    """ Côté processus : la banque d'un shard et sa part des transferts entre shards
+
+        Chaque étape porte un identifiant dérivé de celui du transfert : renvoyée
+        (reprise après un crash), elle n'est jamais appliquée deux fois.
+    """
+
+    def __init__(self, banque):
+        self.banque = banque
+        # Transfert en cours -> compte engagé, qui ne peut pas être supprimé
+        self.__engages = {}
+
+    def preparer_debit(self, transfert, numero_compte, montant):
+        """ Phase 1, compte source : les fonds sont retirés et donc réservés.
+            Un transfert déjà annulé n'est jamais repris : son débit a été remboursé,
+            le résultat enregistré du débit ne doit plus servir. """
+        if self.banque.resultat_operation(f"{transfert}:annulation") is not None:
+            return False, f"Transfert {transfert} déjà annulé"
+        resultat = self.banque.effectuer_retrait(numero_compte, montant, identifiant=f"{transfert}:debit")
+        if resultat[0]:
+            self.__engages[transfert] = numero_compte
+        return resultat
+
+    def preparer_credit(self, transfert, numero_compte):
+        """ Phase 1, compte destinataire : vérifie qu'il peut recevoir les fonds """
+        if self.banque.chercher_compte(numero_compte) is None:
+            return False, f"Compte destinataire {numero_compte} introuvable"
+        self.__engages[transfert] = numero_compte
+        return True, "Prêt"
+
+    def valider_credit(self, transfert, numero_compte, montant):
+        """ Phase 2, compte destinataire : dépose les fonds """
+        self.__engages.pop(transfert, None)
+        return self.banque.effectuer_depot(numero_compte, montant, identifiant=f"{transfert}:credit")
+
+    def annuler_debit(self, transfert, numero_compte, montant):
+        """ Phase 2, compte source : rembourse le débit s'il a eu lieu """
+        self.__engages.pop(transfert, None)
+        # Un débit jamais exécuté est enregistré comme échoué : il ne pourra plus l'être
+        debit = self.banque.executer_une_fois(f"{transfert}:debit", lambda: (False, "Transfert annulé"))
+        if not debit[0]:
+            return True, "Aucun débit à rembourser"
+        return self.banque.effectuer_depot(numero_compte, montant, identifiant=f"{transfert}:annulation")
+
+    def liberer(self, transfert):
+        """ Fin du transfert pour ce shard, sans mouvement de fonds """
+        self.__engages.pop(transfert, None)
+        return True, ""
+
+    def supprimer_compte(self, numero_compte, identifiant=None):
+        if numero_compte in self.__engages.values():
+            return False, f"Un transfert est en cours sur le compte No {numero_compte}"
+        return self.banque.supprimer_compte(numero_compte, identifiant=identifiant)
+
+    def infos_compte(self, numero_compte):
+        compte = self.banque.chercher_compte(numero_compte)
+        return compte.to_dict() if compte else None
+
+    def nombre_comptes(self):
+        return len(self.banque)
+
+
+def _servir(connexion, nom_banque, fichier):
+    """ Boucle d'un processus : exécute les requêtes du routeur sur sa propre banque """
+    banque = Banque(nom_banque, fichier=fichier)
+    participant = _Participant(banque)
+    try:
+        while True:
+            try:
+                methode, args, kwargs = connexion.recv()
+            except EOFError:
+                break  # Routeur disparu
+            if methode == "fermer":
+                break
+            try:
+                if methode in METHODES_BANQUE:
+                    cible = banque
+                elif not methode.startswith("_") and hasattr(_Participant, methode):
+                    cible = participant
+                else:
+                    raise AttributeError(f"Méthode inconnue : {methode}")
+                connexion.send((True, getattr(cible, methode)(*args, **kwargs)))
+            except Exception as e:
+                connexion.send((False, e))
+    finally:
+        banque.fermer()
+        with contextlib.suppress(OSError):
+            connexion.send((True, None))
+            connexion.close()
+
+
+class BanqueRepartie:
+    """ Banque répartie sur plusieurs processus, chacun avec sa Banque et son fichier
+
+        Les comptes sont partitionnés par hachage du numéro (crc32). Le routeur
+        envoie chaque opération au processus du compte ; les processus
+        travaillent en parallèle, sans GIL partagé.
+
+        Un transfert entre deux shards suit une validation en deux phases :
+        le compte source réserve les fonds (débit) et le destinataire vérifie
+        qu'il peut les recevoir ; si les deux acceptent, le crédit est fait,
+        sinon le débit est remboursé. Les décisions sont écrites dans le
+        journal du coordinateur : au redémarrage, les transferts interrompus
+        sont terminés (décision de valider) ou annulés (pas de décision).
+    """
+
+    def __init__(self, nom_banque, dossier=DOSSIER_REPARTI, nombre_processus=None):
+        self.nom_banque = nom_banque
+        self.dossier = dossier
+        os.makedirs(dossier, exist_ok=True)
+        self.nombre_processus = self.__verifier_repartition(nombre_processus or os.cpu_count() or 1)
+        self.fichiers = [os.path.join(dossier, f"banque_{i}.json") for i in range(self.nombre_processus)]
+
+        # spawn : pas de copie des verrous ni des threads du processus parent
+        contexte = multiprocessing.get_context("spawn")
+        self.__connexions, self.__processus = [], []
+        for i, fichier in enumerate(self.fichiers):
+            parent, enfant = contexte.Pipe()
+            processus = contexte.Process(
+                target=_servir, args=(enfant, f"{nom_banque} #{i}", fichier),
+                name=f"banque-shard-{i}", daemon=True,
+            )
+            processus.start()
+            enfant.close()
+            self.__connexions.append(parent)
+            self.__processus.append(processus)
+        # Une requête à la fois par processus ; des processus différents en parallèle
+        self.__verrous = [threading.Lock() for _ in self.fichiers]
+
+        self.__coordinateur = Journal(
+            os.path.join(dossier, "coordinateur" + EXTENSION_JOURNAL), durable=SYNCHRONISATION_DISQUE
+        )
+        self.__transferts_en_cours = 0
+        self.__verrou_transferts = threading.Lock()
+        self.__reprendre()
+
+    def __verifier_repartition(self, nombre_processus):
+        """ Le partitionnement dépend du nombre de processus : il ne peut plus changer """
+        fichier = os.path.join(self.dossier, "repartition.json")
+        if os.path.exists(fichier):
+            with open(fichier, 'r', encoding='utf-8') as f:
+                existant = json.load(f)["nombre_processus"]
+            if existant != nombre_processus:
+                raise ValueError(f"Cette banque est répartie sur {existant} processus, pas {nombre_processus}")
+        else:
+            with FileManager.ecriture_atomique(fichier) as f:
+                json.dump({"nombre_processus": nombre_processus}, f)
+        return nombre_processus
+
+    def shard(self, numero_compte):
+        """ Indice du processus qui détient le compte """
+        return zlib.crc32(numero_compte.encode('utf-8')) % self.nombre_processus
+
+    def __appeler(self, indice, methode, *args, **kwargs):
+        """ Exécute une méthode dans un processus et retourne son résultat """
+        return self.__diffuser({indice: (methode, args, kwargs)})[indice]
+
+    def __diffuser(self, appels):
+        """ Envoie {indice: (méthode, args, kwargs)} à plusieurs processus,
+            qui travaillent en parallèle, puis recueille {indice: résultat} """
+        with contextlib.ExitStack() as pile:
+            for indice in sorted(appels):
+                pile.enter_context(self.__verrous[indice])
+            for indice, appel in appels.items():
+                self.__connexions[indice].send(appel)
+            reponses = {indice: self.__connexions[indice].recv() for indice in appels}
+        for succes, valeur in reponses.values():
+            if not succes:
+                raise valeur
+        return {indice: valeur for indice, (_, valeur) in reponses.items()}
+
+    def __len__(self):
+        return sum(self.__diffuser(
+            {i: ("nombre_comptes", (), {}) for i in range(self.nombre_processus)}
+        ).values())
+
+    # Opérations sur un seul compte : routées vers son processus
+    def ouvrir_compte(self, titulaire, numero_compte, solde, identifiant=None):
+        if not Validators.valider_numero_compte(numero_compte):
+            return False, "Numéro de compte invalide"
+        return self.__appeler(self.shard(numero_compte), "ouvrir_compte",
+                              titulaire, numero_compte, solde, identifiant=identifiant)
+
+    def chercher_compte(self, numero_compte):
+        """ Informations du compte (dictionnaire to_dict), ou None """
+        return self.__appeler(self.shard(numero_compte), "infos_compte", numero_compte)
+
+    def modifier_compte(self, numero_compte, nouveau_titulaire, identifiant=None):
+        return self.__appeler(self.shard(numero_compte), "modifier_compte",
+                              numero_compte, nouveau_titulaire, identifiant=identifiant)
+
+    def supprimer_compte(self, numero_compte, identifiant=None):
+        return self.__appeler(self.shard(numero_compte), "supprimer_compte",
+                              numero_compte, identifiant=identifiant)
+
+    def effectuer_depot(self, numero_compte, montant, identifiant=None):
+        return self.__appeler(self.shard(numero_compte), "effectuer_depot",
+                              numero_compte, montant, identifiant=identifiant)
+
+    def effectuer_retrait(self, numero_compte, montant, identifiant=None):
+        return self.__appeler(self.shard(numero_compte), "effectuer_retrait",
+                              numero_compte, montant, identifiant=identifiant)
+
+    def transferer(self, numero_source, numero_dest, montant, identifiant=None):
+        """ Transfert ; entre deux shards, validation en deux phases """
+        source, dest = self.shard(numero_source), self.shard(numero_dest)
+        if source == dest:
+            return self.__appeler(source, "transferer", numero_source, numero_dest, montant,
+                                  identifiant=identifiant)
+        if not Validators.valider_montant(montant):
+            return False, "Montant invalide"
+
+        transfert = identifiant or uuid.uuid4().hex
+        with self.__verrou_transferts:
+            self.__transferts_en_cours += 1
+        try:
+            self.__journaliser("debut", transfert, source=numero_source, dest=numero_dest, montant=montant)
+            votes = self.__diffuser({
+                source: ("preparer_debit", (transfert, numero_source, montant), {}),
+                dest: ("preparer_credit", (transfert, numero_dest), {}),
+            })
+            if votes[source][0] and votes[dest][0]:
+                self.__journaliser("valider", transfert)
+                self.__diffuser({
+                    dest: ("valider_credit", (transfert, numero_dest, montant), {}),
+                    source: ("liberer", (transfert,), {}),
+                })
+                resultat = True, f"Transfert de {Montant.formater(montant)} Fcfa effectué"
+            else:
+                self.__diffuser({
+                    source: ("annuler_debit", (transfert, numero_source, montant), {}),
+                    dest: ("liberer", (transfert,), {}),
+                })
+                resultat = False, votes[source][1] if not votes[source][0] else votes[dest][1]
+            self.__journaliser("fin", transfert)
+        finally:
+            with self.__verrou_transferts:
+                self.__transferts_en_cours -= 1
+                if not self.__transferts_en_cours and self.__coordinateur.taille >= SEUIL_COMPACTION:
+                    self.__coordinateur.vider()
+        return resultat
+
+    def __journaliser(self, etape, transfert, **details):
+        """ Écrit une étape d'un transfert dans le journal du coordinateur (sur disque) """
+        self.__coordinateur.ajouter({"op": etape, "transfert": transfert, **details})
+        if etape != "fin":
+            self.__coordinateur.synchroniser()
+
+    def __reprendre(self):
+        """ Termine les transferts interrompus par un arrêt brutal du coordinateur """
+        debuts, valides = {}, set()
+        for enregistrement in self.__coordinateur.rejouer():
+            transfert = enregistrement["transfert"]
+            if enregistrement["op"] == "debut":
+                debuts[transfert] = enregistrement
+            elif enregistrement["op"] == "valider":
+                valides.add(transfert)
+            elif enregistrement["op"] == "fin":
+                debuts.pop(transfert, None)
+        for transfert, e in debuts.items():
+            if transfert in valides:
+                self.__appeler(self.shard(e["dest"]), "valider_credit", transfert, e["dest"], e["montant"])
+            else:
+                self.__appeler(self.shard(e["source"]), "annuler_debit", transfert, e["source"], e["montant"])
+        if debuts:
+            print(f"✔ {len(debuts)} transfert(s) interrompu(s) terminé(s)")
+        self.__coordinateur.vider()
+
+    def appliquer_lot(self, operations, atomique=False):
+        """ Applique des opérations ("depot", "retrait", "transfert") : les
+            opérations de chaque shard forment un lot exécuté en parallèle des
+            autres ; les transferts entre shards passent ensuite en deux phases.
+            Un lot atomique doit rester sur un seul shard. """
+        resultats = [None] * len(operations)
+        lots, entre_shards = {}, []
+        for position, operation in enumerate(operations):
+            # Vérifiée avant le routage : une opération mal formée n'atteint aucun shard
+            if not operation or operation[0] not in ARITES_OPERATIONS:
+                erreur = (False, f"Opération inconnue : {operation[0] if operation else None}")
+            elif len(operation) != ARITES_OPERATIONS[operation[0]]:
+                erreur = (False, f"Opération invalide : {operation}")
+            else:
+                erreur = None
+            if erreur is not None:
+                if atomique:
+                    return False, [erreur]
+                resultats[position] = erreur
+                continue
+            indices = {self.shard(numero) for numero in operation[1:-1]}
+            if len(indices) == 1:
+                lots.setdefault(indices.pop(), []).append((position, operation))
+            else:
+                entre_shards.append((position, operation))
+        if atomique and (entre_shards or len(lots) > 1):
+            raise ValueError("Un lot atomique doit porter sur les comptes d'un seul shard")
+
+        reponses = self.__diffuser({
+            indice: ("appliquer_lot", ([op for _, op in lot], atomique), {})
+            for indice, lot in lots.items()
+        })
+        for indice, (_, resultats_lot) in reponses.items():
+            for (position, _), resultat in zip(lots[indice], resultats_lot):
+                resultats[position] = resultat
+        for position, operation in entre_shards:
+            resultats[position] = self.transferer(*operation[1:])
+        if atomique and None in resultats:
+            # Lot annulé au premier échec : les opérations suivantes n'ont pas eu lieu
+            resultats = [r for r in resultats if r is not None]
+        return all(succes for succes, _ in resultats), resultats
+
+    def appliquer_traitement_mensuel(self, regles=None):
+        """ Traitement mensuel de tous les shards, en parallèle """
+        reponses = self.__diffuser({
+            i: ("appliquer_traitement_mensuel", (regles,), {}) for i in range(self.nombre_processus)
+        })
+        return all(succes for succes, _ in reponses.values()), [message for _, message in reponses.values()]
+
+    def statistiques(self):
+        """ Agrégats de tous les shards (même forme que Banque.statistiques) """
+        resumes = self.__diffuser({i: ("statistiques", (), {}) for i in range(self.nombre_processus)}).values()
+        non_vides = [r for r in resumes if r["nombre_comptes"]]
+        histogramme = {}
+        for resume in resumes:
+            for tranche, effectif in resume["histogramme"].items():
+                histogramme[tranche] = histogramme.get(tranche, 0) + effectif
+        return {
+            "nombre_comptes": sum(r["nombre_comptes"] for r in resumes),
+            "total_actifs": sum(r["total_actifs"] for r in resumes),
+            "solde_min": min((r["solde_min"] for r in non_vides), default=None),
+            "solde_max": max((r["solde_max"] for r in non_vides), default=None),
+            "histogramme": histogramme,
+        }
+
+    def fermer(self):
+        """ Ferme la banque de chaque processus et attend leur fin """
+        self.__diffuser({i: ("fermer", (), {}) for i in range(self.nombre_processus)})
+        for processus, connexion in zip(self.__processus, self.__connexions):
+            processus.join()
+            connexion.close()
+        self.__coordinateur.vider()
+        self.__coordinateur.fermer()
@@ -1,56 +1,105 @@
-import datetime
-from config.constants import FORMAT_DATE
+import threading
+import time
+from collections import deque
+from models.montant import Montant
+from models.transaction import Transaction
+from config.constants import HISTORIQUE_EN_MEMOIRE
 
 
 class CompteBancaire:
-    """ Classe représentant un compte bancaire"""
+    """ Classe représentant un compte bancaire (solde en centimes, voir Montant)"""
+
+    # Pas de __dict__ par instance : la banque garde des millions de comptes.
+    # __weakref__ permet au stockage par shards de retrouver un compte encore utilisé
+    __slots__ = ("__titulaire", "__numero_compte", "__solde", "__historique", "verrou", "__weakref__")
+
+    # Fonctions appelées avec (numéro, Transaction) à chaque transaction enregistrée.
+    # Tuple remplacé à chaque abonnement : le parcours ne prend aucun verrou.
+    ecouteurs = ()
+
+    @classmethod
+    def abonner(cls, ecouteur):
+        """ Ajoute un écouteur des transactions de tous les comptes """
+        cls.ecouteurs = cls.ecouteurs + (ecouteur,)
+
+    @classmethod
+    def desabonner(cls, ecouteur):
+        """ Retire un écouteur ajouté par abonner """
+        cls.ecouteurs = tuple(e for e in cls.ecouteurs if e != ecouteur)
 
     def __init__(self, titulaire, numero_compte, solde):
         self.__titulaire = titulaire
         self.__numero_compte = numero_compte
         self.__solde = solde
-        self.historique = []
+        # Fenêtre des dernières transactions, créée à la première transaction ;
+        # l'historique complet est sur disque
+        self.__historique = None
+        # Verrou pris par la Banque pendant toute opération sur le compte
+        self.verrou = threading.Lock()
+
+    @property
+    def historique(self):
+        """ Dernières transactions gardées en mémoire (au plus HISTORIQUE_EN_MEMOIRE) """
+        if self.__historique is None:
+            self.__historique = deque(maxlen=HISTORIQUE_EN_MEMOIRE)
+        return self.__historique
 
     def to_dict(self):
         """ Convertit le compte en dictionnaire pour JSON"""
         return {
             "titulaire": self.__titulaire,
             "numero_compte": self.__numero_compte,
-            "solde": self.__solde,
+            "solde_centimes": self.__solde,
         }
 
+    @classmethod
+    def from_dict(cls, data):
+        """ Crée un compte à partir d'un dictionnaire JSON"""
+        if 'solde_centimes' in data:
+            solde = data['solde_centimes']
+        else:
+            # Ancien format : solde en Fcfa (float)
+            solde = Montant.depuis_fcfa(data['solde'], arrondir=True)
+        return cls(data['titulaire'], data['numero_compte'], solde)
+
     def __str__(self):
-        return f"Compte de : {self.__titulaire}, Numéro : {self.__numero_compte}, Solde : {self.__solde} Fcfa"
+        return f"Compte de : {self.__titulaire}, Numéro : {self.__numero_compte}, Solde : {Montant.formater(self.__solde)} Fcfa"
 
     def deposer(self, montant):
-        """ Dépose un montant sur le compte"""
+        """ Dépose un montant (en centimes) sur le compte"""
         if montant > 0:
             self.__solde += montant
-            self.__enregistrer_transaction("Dépôt", montant)
+            self.__enregistrer_transaction(Transaction.DEPOT, montant)
             return True
         return False
 
     def retirer(self, montant):
-        """ Retire un montant du compte"""
+        """ Retire un montant (en centimes) du compte"""
         if montant > 0 and montant <= self.__solde:
             self.__solde -= montant
-            self.__enregistrer_transaction("Retrait", montant)
+            self.__enregistrer_transaction(Transaction.RETRAIT, montant)
             return True
         return False
 
-    def __enregistrer_transaction(self, type_transaction, montant):
-        """ Enregistre une transaction dans l'historique"""
-        transaction = {
-            "type": type_transaction,
-            "montant": montant,
-            "date": datetime.datetime.now().strftime(FORMAT_DATE),
-            "solde_apres_transaction": self.__solde
-        }
+    def __enregistrer_transaction(self, code, montant, horodatage=None):
+        """ Enregistre une transaction dans l'historique et la signale aux écouteurs"""
+        if horodatage is None:
+            horodatage = time.time()
+        transaction = Transaction(code, montant, horodatage, self.__solde)
         self.historique.append(transaction)
+        for ecouteur in CompteBancaire.ecouteurs:
+            ecouteur(self.__numero_compte, transaction)
+        return transaction
+
+    def appliquer_mouvement(self, code, variation, horodatage):
+        """ Applique une variation signée du solde calculée en masse (intérêts, frais).
+            Les contrôles sont faits par le traitement appelant. """
+        self.__solde += variation
+        return self.__enregistrer_transaction(code, abs(variation), horodatage)
 
     def afficher_historique(self):
-        """ Affiche l'historique des transactions"""
-        if not self.historique:
+        """ Affiche les dernières transactions gardées en mémoire"""
+        if not self.__historique:
             print(" ❌ Aucune transaction effectuée.")
             return
 
@@ -58,14 +107,20 @@ class CompteBancaire:
         print(f"Historique - Compte No : {self.__numero_compte}")
         print("=" * 50)
         for transaction in self.historique:
-            print(f"Date : {transaction['date']}")
-            print(f"Type : {transaction['type']}")
-            print(f"Montant : {transaction['montant']} Fcfa")
-            print(f"Solde après : {transaction['solde_apres_transaction']} Fcfa")
-            print("-" * 50)
+            self.afficher_transaction(transaction)
+
+    @staticmethod
+    def afficher_transaction(transaction):
+        """ Affiche une transaction"""
+        print(f"Date : {transaction.date}")
+        print(f"Type : {transaction.type}")
+        print(f"Montant : {Montant.formater(transaction.montant_centimes)} Fcfa")
+        print(f"Solde après : {Montant.formater(transaction.solde_centimes)} Fcfa")
+        print("-" * 50)
 
     # Getters
     def get_solde(self):
+        """ Solde en centimes """
         return self.__solde
 
     def get_numero_compte(self):
@@ -76,11 +131,28 @@ class CompteBancaire:
 
     def get_infos(self):
         """ Affiche les informations du compte """
-        print("=" * 50)
-        print(f"Titulaire : {self.__titulaire}")
-        print(f"Numéro : {self.__numero_compte}")
-        print(f"Solde : {self.__solde} Fcfa")
-        print("=" * 50)
+        print(self.formater_infos())
+
+    def formater_infos(self):
+        """ Informations du compte sous forme de texte (plusieurs lignes) """
+        return (
+            f"{'=' * 50}\n"
+            f"Titulaire : {self.__titulaire}\n"
+            f"Numéro : {self.__numero_compte}\n"
+            f"Solde : {Montant.formater(self.__solde)} Fcfa\n"
+            f"{'=' * 50}"
+        )
+
+    def sauvegarder_etat(self):
+        """ Capture le titulaire, le solde et l'historique récent (annulation d'un lot)"""
+        return self.__titulaire, self.__solde, list(self.__historique or ())
+
+    def restaurer_etat(self, etat):
+        """ Restaure un état capturé par sauvegarder_etat"""
+        self.__titulaire, self.__solde, historique = etat
+        if self.__historique is not None:
+            self.__historique.clear()
+            self.__historique.extend(historique)
 
     # Setters
     def set_titulaire(self, nouveau_titulaire):
@@ -0,0 +1,231 @@
+import threading
+from collections import OrderedDict, deque
+from models.compte_bancaire import CompteBancaire
+from models.montant import Montant
+from models.transaction import Transaction
+from config.constants import (
+    FENETRE_NOMBRE_RETRAITS, NOMBRE_MAX_RETRAITS, FENETRE_MONTANT_RETRAITS, MONTANT_MAX_RETRAITS,
+    TAILLE_FENETRE_VELOCITE, COMPTES_SURVEILLES_MAX, ALERTES_EN_MEMOIRE
+)
+
+
+class RegleVelocite:
+    """ Seuil sur les transactions d'un compte dans une fenêtre glissante
+
+        codes : types de transaction surveillés (Transaction.RETRAIT, ...)
+        duree : largeur de la fenêtre en secondes
+        nombre_max / somme_max (centimes) : seuils, None pour ne pas surveiller
+        capacite : nombre de seaux de temps de la fenêtre quand une somme est
+        surveillée (toutes les transactions comptent, en mémoire constante) ;
+        un simple comptage garde les nombre_max + 1 dernières transactions
+    """
+
+    __slots__ = ("nom", "codes", "duree", "nombre_max", "somme_max", "capacite")
+
+    def __init__(self, nom, codes, duree, nombre_max=None, somme_max=None, capacite=TAILLE_FENETRE_VELOCITE):
+        self.nom = nom
+        self.codes = frozenset(codes)
+        self.duree = duree
+        self.nombre_max = nombre_max
+        self.somme_max = somme_max
+        # Pour un simple comptage, nombre_max + 1 transactions suffisent
+        self.capacite = nombre_max + 1 if somme_max is None and nombre_max is not None else capacite
+
+    def nouvelle_fenetre(self):
+        """ Fenêtre d'un compte pour cette règle """
+        if self.somme_max is None:
+            return _Fenetre(self.capacite)
+        return _FenetreSeaux(self.capacite, self.duree)
+
+    def depasse(self, nombre, somme):
+        return ((self.nombre_max is not None and nombre > self.nombre_max)
+                or (self.somme_max is not None and somme > self.somme_max))
+
+
+def regles_par_defaut():
+    """ Trop de retraits en une minute, ou trop d'argent retiré en une heure """
+    return [
+        RegleVelocite("nombre_retraits", (Transaction.RETRAIT,), FENETRE_NOMBRE_RETRAITS,
+                      nombre_max=NOMBRE_MAX_RETRAITS),
+        RegleVelocite("montant_retraits", (Transaction.RETRAIT,), FENETRE_MONTANT_RETRAITS,
+                      somme_max=Montant.depuis_fcfa(MONTANT_MAX_RETRAITS)),
+    ]
+
+
+class _Fenetre:
+    """ Tampon circulaire de taille fixe : horodatages et montants d'un compte pour une règle """
+
+    __slots__ = ("horodatages", "montants", "debut", "taille", "somme")
+
+    def __init__(self, capacite):
+        self.horodatages = [0.0] * capacite
+        self.montants = [0] * capacite
+        self.debut = 0
+        self.taille = 0
+        self.somme = 0
+
+    def __retirer_plus_ancienne(self):
+        self.somme -= self.montants[self.debut]
+        self.debut = (self.debut + 1) % len(self.montants)
+        self.taille -= 1
+
+    def ajouter(self, horodatage, montant, duree):
+        """ Fait glisser la fenêtre jusqu'à horodatage puis ajoute la transaction.
+            Retourne (nombre, somme) avant l'ajout. """
+        limite = horodatage - duree
+        while self.taille and self.horodatages[self.debut] <= limite:
+            self.__retirer_plus_ancienne()
+        avant = self.taille, self.somme
+        if self.taille == len(self.montants):
+            self.__retirer_plus_ancienne()
+        fin = (self.debut + self.taille) % len(self.montants)
+        self.horodatages[fin] = horodatage
+        self.montants[fin] = montant
+        self.taille += 1
+        self.somme += montant
+        return avant
+
+
+class _FenetreSeaux:
+    """ Seaux de temps de duree / capacite secondes : nombre et somme des transactions de chacun.
+
+        Mémoire constante quel que soit le nombre de transactions, et somme
+        exacte : aucune transaction de la fenêtre n'est oubliée. La fenêtre est
+        arrondie aux seaux : elle couvre au moins duree secondes, au plus un seau de plus.
+    """
+
+    __slots__ = ("pas", "indices", "nombres", "montants", "dernier", "taille", "somme")
+
+    def __init__(self, capacite, duree):
+        self.pas = duree / capacite
+        # capacite + 1 seaux : le seau courant, entamé, plus capacite seaux complets
+        self.indices = [None] * (capacite + 1)
+        self.nombres = [0] * (capacite + 1)
+        self.montants = [0] * (capacite + 1)
+        self.dernier = None
+        self.taille = 0
+        self.somme = 0
+
+    def ajouter(self, horodatage, montant, duree):
+        """ Fait glisser la fenêtre jusqu'à horodatage puis ajoute la transaction.
+            Retourne (nombre, somme) avant l'ajout. """
+        indice = int(horodatage // self.pas)
+        seaux = len(self.indices)
+        if self.dernier is None or indice > self.dernier:
+            self.dernier = indice
+            for j, ancien in enumerate(self.indices):
+                if ancien is not None and ancien <= indice - seaux:
+                    self.taille -= self.nombres[j]
+                    self.somme -= self.montants[j]
+                    self.indices[j] = None
+        avant = self.taille, self.somme
+        if indice <= self.dernier - seaux:
+            return avant  # Transaction en retard, déjà sortie de la fenêtre
+        j = indice % seaux
+        if self.indices[j] != indice:
+            self.indices[j], self.nombres[j], self.montants[j] = indice, 0, 0
+        self.nombres[j] += 1
+        self.montants[j] += montant
+        self.taille += 1
+        self.somme += montant
+        return avant
+
+
+class Alerte:
+    """ Seuil d'une règle franchi par un compte """
+
+    __slots__ = ("numero_compte", "regle", "nombre", "somme", "horodatage")
+
+    def __init__(self, numero_compte, regle, nombre, somme, horodatage):
+        self.numero_compte = numero_compte
+        self.regle = regle
+        self.nombre = nombre
+        self.somme = somme
+        self.horodatage = horodatage
+
+    def __str__(self):
+        return (f"⚠ Compte {self.numero_compte} : {self.regle} "
+                f"({self.nombre} transaction(s), {Montant.formater(self.somme)} Fcfa)")
+
+
+class DetecteurVelocite:
+    """ Moteur de règles en flux sur les transactions des comptes
+
+        Branché sur CompteBancaire (abonner), il reçoit chaque transaction au
+        moment où elle est enregistrée. Pour chaque compte et chaque règle, un
+        tampon circulaire (comptage) ou des seaux de temps (somme) gardent le
+        nombre et la somme de la fenêtre glissante : mémoire constante par
+        compte, coût O(1) amorti par transaction.
+        Seuls les COMPTES_SURVEILLES_MAX comptes les plus récemment actifs
+        sont suivis. Une alerte est levée quand un seuil est franchi (pas à
+        chaque transaction tant qu'il reste dépassé).
+    """
+
+    def __init__(self, regles=None, alerter=None, comptes_max=COMPTES_SURVEILLES_MAX):
+        self.regles = regles if regles is not None else regles_par_defaut()
+        # alerter(Alerte), appelé hors verrou ; les alertes récentes restent dans self.alertes
+        self.alerter = alerter
+        self.alertes = deque(maxlen=ALERTES_EN_MEMOIRE)
+        self.comptes_max = comptes_max
+        # Code de transaction -> [(indice, règle)] : les autres codes sortent tout de suite
+        self.__par_code = {}
+        for indice, regle in enumerate(self.regles):
+            for code in regle.codes:
+                self.__par_code.setdefault(code, []).append((indice, regle))
+        # Numéro -> fenêtres du compte, du moins au plus récemment actif
+        self.__comptes = OrderedDict()
+        self.__verrou = threading.Lock()
+
+    def brancher(self):
+        """ Commence à recevoir les transactions de tous les comptes """
+        CompteBancaire.abonner(self.recevoir)
+        return self
+
+    def debrancher(self):
+        CompteBancaire.desabonner(self.recevoir)
+
+    def __enter__(self):
+        return self.brancher()
+
+    def __exit__(self, *exc):
+        self.debrancher()
+
+    def __len__(self):
+        return len(self.__comptes)
+
+    def recevoir(self, numero_compte, transaction):
+        """ Écouteur de CompteBancaire : applique les règles à une transaction """
+        regles = self.__par_code.get(transaction.code)
+        if not regles:
+            return
+        alertes = []
+        with self.__verrou:
+            fenetres = self.__comptes.get(numero_compte)
+            if fenetres is None:
+                fenetres = self.__comptes[numero_compte] = [None] * len(self.regles)
+                if len(self.__comptes) > self.comptes_max:
+                    self.__comptes.popitem(last=False)
+            else:
+                self.__comptes.move_to_end(numero_compte)
+            for indice, regle in regles:
+                fenetre = fenetres[indice]
+                if fenetre is None:
+                    fenetre = fenetres[indice] = regle.nouvelle_fenetre()
+                nombre, somme = fenetre.ajouter(transaction.horodatage, transaction.montant_centimes, regle.duree)
+                if regle.depasse(fenetre.taille, fenetre.somme) and not regle.depasse(nombre, somme):
+                    alertes.append(Alerte(numero_compte, regle.nom, fenetre.taille, fenetre.somme,
+                                          transaction.horodatage))
+        for alerte in alertes:
+            self.alertes.append(alerte)
+            if self.alerter is not None:
+                self.alerter(alerte)
+
+    def fenetre(self, numero_compte, nom_regle):
+        """ (nombre, somme) de la fenêtre d'un compte pour une règle à sa dernière transaction, ou None """
+        indice = next((i for i, regle in enumerate(self.regles) if regle.nom == nom_regle), None)
+        if indice is None:
+            return None
+        with self.__verrou:
+            fenetres = self.__comptes.get(numero_compte)
+            fenetre = fenetres[indice] if fenetres else None
+            return (fenetre.taille, fenetre.somme) if fenetre else None
@@ -0,0 +1,117 @@
+import bisect
+import threading
+import unicodedata
+from config.constants import TAILLE_PAGE_RECHERCHE
+
+# Sépare la clé du numéro dans une entrée : inférieur à tout caractère d'un nom
+SEPARATEUR = "\x00"
+
+
+def normaliser(texte):
+    """ Forme de recherche d'un nom : sans accents, sans casse, espaces simplifiés """
+    if texte.isascii() and texte.isprintable():
+        return " ".join(texte.casefold().split())
+    decompose = unicodedata.normalize("NFKD", texte)
+    sans_accents = "".join(c for c in decompose if not unicodedata.combining(c) and c.isprintable())
+    return " ".join(sans_accents.casefold().split())
+
+
+class IndexTitulaires:
+    """ Index trié des noms de titulaires, pour la recherche par préfixe
+
+        Chaque mot du nom normalisé ouvre une entrée « suite du nom à partir
+        de ce mot » + SEPARATEUR + numéro : "jean dupont" donne les entrées
+        "jean dupont" et "dupont". Une recherche est une dichotomie dans la
+        liste triée suivie d'un parcours des seules entrées qui correspondent.
+    """
+
+    def __init__(self):
+        self.__entrees = []
+        # Nom normalisé de chaque compte indexé
+        self.__noms = {}
+        self.__verrou = threading.Lock()
+
+    @staticmethod
+    def __cles(nom):
+        """ Suites du nom commençant à chaque mot """
+        mots = nom.split(" ")
+        return [" ".join(mots[i:]) for i in range(len(mots))] if nom else []
+
+    def reconstruire(self, comptes):
+        """ Indexe tous les comptes (O(n log n)) """
+        entrees, noms = [], {}
+        for compte in comptes:
+            numero, nom = compte.get_numero_compte(), normaliser(compte.get_titulaire())
+            noms[numero] = nom
+            entrees.extend(cle + SEPARATEUR + numero for cle in self.__cles(nom))
+        entrees.sort()
+        with self.__verrou:
+            self.__entrees, self.__noms = entrees, noms
+
+    def __len__(self):
+        return len(self.__noms)
+
+    def ajouter(self, numero, titulaire):
+        with self.__verrou:
+            self.__ajouter(numero, titulaire)
+
+    def retirer(self, numero):
+        with self.__verrou:
+            self.__retirer(numero)
+
+    def modifier(self, numero, titulaire):
+        """ Réindexe un compte ; titulaire None retire le compte """
+        with self.__verrou:
+            self.__retirer(numero)
+            if titulaire is not None:
+                self.__ajouter(numero, titulaire)
+
+    def __ajouter(self, numero, titulaire):
+        nom = normaliser(titulaire)
+        self.__noms[numero] = nom
+        for cle in self.__cles(nom):
+            bisect.insort(self.__entrees, cle + SEPARATEUR + numero)
+
+    def __retirer(self, numero):
+        nom = self.__noms.pop(numero, None)
+        if nom is None:
+            return
+        for cle in self.__cles(nom):
+            entree = cle + SEPARATEUR + numero
+            position = bisect.bisect_left(self.__entrees, entree)
+            if position < len(self.__entrees) and self.__entrees[position] == entree:
+                del self.__entrees[position]
+
+    def rechercher(self, texte, curseur=None, taille_page=TAILLE_PAGE_RECHERCHE):
+        """ Numéros des comptes dont un mot du nom commence par texte
+            (sans tenir compte de la casse ni des accents), triés par nom.
+
+            Retourne (numéros, curseur) ; le curseur, None sur la dernière page,
+            se repasse tel quel pour obtenir la page suivante. """
+        prefixe = normaliser(texte)
+        if not prefixe:
+            return [], None
+        numeros = []
+        with self.__verrou:
+            if curseur is None:
+                position = bisect.bisect_left(self.__entrees, prefixe)
+            else:
+                position = bisect.bisect_right(self.__entrees, curseur)
+            while position < len(self.__entrees):
+                entree = self.__entrees[position]
+                if not entree.startswith(prefixe):
+                    return numeros, None
+                cle, numero = entree.split(SEPARATEUR, 1)
+                # Un compte n'est renvoyé qu'une fois : pour le premier mot qui correspond
+                if self.__premiere_cle(self.__noms[numero], prefixe) == cle:
+                    if len(numeros) == taille_page:
+                        return numeros, self.__entrees[position - 1]
+                    numeros.append(numero)
+                position += 1
+        return numeros, None
+
+    def __premiere_cle(self, nom, prefixe):
+        for cle in self.__cles(nom):
+            if cle.startswith(prefixe):
+                return cle
+        return None
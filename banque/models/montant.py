@@ -0,0 +1,52 @@
+from decimal import Decimal, InvalidOperation, ROUND_HALF_EVEN
+
+
+class Montant:
+    """ Montants d'argent en centimes de Fcfa, stockés en entiers
+
+        Toute l'arithmétique de la banque se fait sur des int : elle est exacte
+        (pas de dérive d'arrondi) et bien plus rapide que Decimal. La conversion
+        depuis/vers des Fcfa n'a lieu qu'aux bords (saisie, affichage, ancien JSON).
+    """
+
+    CENTIMES_PAR_FCFA = 100
+
+    @staticmethod
+    def depuis_fcfa(valeur, arrondir=False):
+        """ Convertit un montant en Fcfa (int, str, float, Decimal) en centimes.
+            Lève ValueError si la valeur n'est pas un nombre ou, sauf si arrondir
+            est vrai (migration d'anciens soldes float), a plus de 2 décimales. """
+        if isinstance(valeur, bool):
+            raise ValueError(f"Montant invalide : {valeur!r}")
+        if isinstance(valeur, int):
+            return valeur * Montant.CENTIMES_PAR_FCFA
+        try:
+            # str() d'un float donne sa représentation décimale la plus courte (0.1 -> "0.1")
+            fcfa = Decimal(str(valeur).strip().replace(",", "."))
+        except InvalidOperation:
+            raise ValueError(f"Montant invalide : {valeur!r}") from None
+        if not fcfa.is_finite():
+            raise ValueError(f"Montant invalide : {valeur!r}")
+        centimes = fcfa * Montant.CENTIMES_PAR_FCFA
+        if arrondir:
+            centimes = centimes.to_integral_value(rounding=ROUND_HALF_EVEN)
+        elif centimes != centimes.to_integral_value():
+            raise ValueError(f"Montant trop précis (2 décimales au plus) : {valeur!r}")
+        return int(centimes)
+
+    @staticmethod
+    def vers_fcfa(centimes):
+        """ Convertit des centimes en Fcfa (Decimal exact) """
+        return Decimal(centimes) / Montant.CENTIMES_PAR_FCFA
+
+    @staticmethod
+    def est_valide(centimes):
+        """ Un montant en centimes est un entier (les booléens sont refusés) """
+        return isinstance(centimes, int) and not isinstance(centimes, bool)
+
+    @staticmethod
+    def formater(centimes):
+        """ Texte affichable : 123456 -> '1234.56' """
+        signe = "-" if centimes < 0 else ""
+        fcfa, reste = divmod(abs(centimes), Montant.CENTIMES_PAR_FCFA)
+        return f"{signe}{fcfa}.{reste:02d}"
@@ -0,0 +1,208 @@
+import bisect
+import heapq
+import threading
+from models.montant import Montant
+from config.constants import TRANCHES_HISTOGRAMME, TAILLE_EXTREMES_STATISTIQUES
+
+
+class StatistiquesBanque:
+    """ Agrégats de la banque tenus à jour à chaque mutation
+
+        Le total, le nombre de comptes et l'histogramme sont exacts en O(1).
+        Le minimum et le maximum utilisent deux tas à suppression paresseuse :
+        une entrée (solde, numéro) n'est valide que si le compte a toujours ce solde.
+        Après importer(), les tas ne contiennent que les extrêmes sauvegardés ;
+        ils sont reconstruits via tous_les_comptes() quand ils ne suffisent plus.
+        La purge des entrées mortes lit les soldes groupe par groupe (shard) :
+        chaque shard est chargé au plus une fois, quel que soit l'ordre du tas.
+    """
+
+    def __init__(self, solde_actuel, tous_les_comptes=None, tranches=TRANCHES_HISTOGRAMME, groupe=None):
+        # solde_actuel(numero) -> solde courant, ou None si le compte n'existe plus
+        self.__solde_actuel = solde_actuel
+        self.__tous_les_comptes = tous_les_comptes
+        # groupe(numero) -> shard du compte, pour ordonner les lectures de la purge
+        self.__groupe = groupe
+        # Bornes des tranches en Fcfa (libellés) et en centimes (calculs)
+        self.tranches = list(tranches)
+        self.__bornes = [Montant.depuis_fcfa(t) for t in self.tranches]
+        self.__verrou = threading.Lock()
+        self.reconstruire(())
+
+    def reconstruire(self, comptes):
+        """ Recalcule tous les agrégats à partir des comptes (O(n)) """
+        with self.__verrou:
+            self.nombre = 0
+            self.total = 0
+            self.histogramme = [0] * len(self.tranches)
+            self.__tas_min = []
+            self.__tas_max = []
+            # Clé (dans l'ordre du tas) au-delà de laquelle un compte peut manquer
+            # au tas ; None si le tas couvre tous les comptes
+            self.__limite_min = self.__limite_max = None
+            for compte in comptes:
+                numero, solde = compte.get_numero_compte(), compte.get_solde()
+                self.nombre += 1
+                self.total += solde
+                self.histogramme[self.__tranche(solde)] += 1
+                self.__tas_min.append((solde, numero))
+                self.__tas_max.append((-solde, numero))
+            # heapify en O(n) plutôt que n insertions en O(log n)
+            heapq.heapify(self.__tas_min)
+            heapq.heapify(self.__tas_max)
+
+    def __reconstruire_tas(self):
+        """ Reconstruit les deux tas à partir de tous les comptes (O(n)) """
+        self.__tas_min = []
+        self.__tas_max = []
+        self.__limite_min = self.__limite_max = None
+        for compte in self.__tous_les_comptes():
+            self.__tas_min.append((compte.get_solde(), compte.get_numero_compte()))
+            self.__tas_max.append((-compte.get_solde(), compte.get_numero_compte()))
+        heapq.heapify(self.__tas_min)
+        heapq.heapify(self.__tas_max)
+
+    def __tranche(self, solde):
+        return max(0, bisect.bisect_right(self.__bornes, solde) - 1)
+
+    def __ajouter(self, numero, solde):
+        self.nombre += 1
+        self.total += solde
+        self.histogramme[self.__tranche(solde)] += 1
+        heapq.heappush(self.__tas_min, (solde, numero))
+        heapq.heappush(self.__tas_max, (-solde, numero))
+
+    def __retirer(self, solde):
+        self.nombre -= 1
+        self.total -= solde
+        self.histogramme[self.__tranche(solde)] -= 1
+
+    def ajouter(self, numero, solde):
+        """ Un compte a été ouvert """
+        with self.__verrou:
+            self.__ajouter(numero, solde)
+
+    def retirer(self, numero, solde):
+        """ Un compte a été supprimé """
+        with self.__verrou:
+            self.__retirer(solde)
+
+    def modifier(self, numero, ancien_solde, nouveau_solde):
+        """ Le solde d'un compte a changé """
+        with self.__verrou:
+            self.__retirer(ancien_solde)
+            self.__ajouter(numero, nouveau_solde)
+
+    def __sommet(self, tas, signe, limite):
+        """ Premier élément encore valide du tas (purge les entrées périmées).
+            Retourne (solde, fiable) : fiable est faux si un compte absent
+            du tas pourrait être plus extrême. """
+        # Les tas ne grossissent pas sans limite : reconstruction si trop d'entrées mortes
+        if len(tas) > 2 * self.nombre + 64:
+            if self.__groupe is not None:
+                tas.sort(key=lambda entree: self.__groupe(entree[1]))
+            tas[:] = [(s, n) for s, n in tas if self.__solde_actuel(n) == signe * s]
+            heapq.heapify(tas)
+        while tas:
+            cle, numero = tas[0]
+            if self.__solde_actuel(numero) == signe * cle:
+                return signe * cle, limite is None or cle <= limite
+            heapq.heappop(tas)
+        return None, limite is None or self.nombre == 0
+
+    def __extreme(self, signe):
+        for _ in range(2):
+            if signe == 1:
+                solde, fiable = self.__sommet(self.__tas_min, 1, self.__limite_min)
+            else:
+                solde, fiable = self.__sommet(self.__tas_max, -1, self.__limite_max)
+            if fiable:
+                return solde
+            self.__reconstruire_tas()
+        return solde
+
+    def minimum(self):
+        """ Plus petit solde, ou None si la banque est vide """
+        with self.__verrou:
+            return self.__extreme(1)
+
+    def maximum(self):
+        """ Plus grand solde, ou None si la banque est vide """
+        with self.__verrou:
+            return self.__extreme(-1)
+
+    def __extremes_valides(self, tas, signe, limite):
+        """ Les TAILLE_EXTREMES_STATISTIQUES premières entrées valides du tas
+            (seulement celles dont on est sûr qu'aucun compte absent ne les précède) """
+        extremes, vus = [], set()
+        for cle, numero in sorted(tas):
+            if limite is not None and cle > limite:
+                break
+            if numero not in vus and self.__solde_actuel(numero) == signe * cle:
+                vus.add(numero)
+                extremes.append([cle, numero])
+                if len(extremes) == TAILLE_EXTREMES_STATISTIQUES:
+                    break
+        return extremes
+
+    def exporter(self):
+        """ Agrégats sérialisables en JSON (rechargés sans relire les comptes) """
+        with self.__verrou:
+            return {
+                "tranches": self.tranches,
+                "nombre": self.nombre,
+                "total": self.total,
+                "histogramme": self.histogramme,
+                "tas_min": self.__extremes_valides(self.__tas_min, 1, self.__limite_min),
+                "tas_max": self.__extremes_valides(self.__tas_max, -1, self.__limite_max),
+            }
+
+    def importer(self, donnees):
+        """ Recharge des agrégats exportés ; retourne False s'ils sont inutilisables """
+        if donnees.get("tranches") != self.tranches or self.__tous_les_comptes is None:
+            return False
+        with self.__verrou:
+            self.nombre = donnees["nombre"]
+            self.total = donnees["total"]
+            self.histogramme = list(donnees["histogramme"])
+            self.__tas_min = [tuple(e) for e in donnees["tas_min"]]
+            self.__tas_max = [tuple(e) for e in donnees["tas_max"]]
+            heapq.heapify(self.__tas_min)
+            heapq.heapify(self.__tas_max)
+            self.__limite_min = self.__limite(self.__tas_min)
+            self.__limite_max = self.__limite(self.__tas_max)
+        return True
+
+    def __limite(self, tas):
+        """ Les comptes absents d'un tas importé ont une clé au moins égale
+            à la plus grande sauvegardée ; un tas qui les contient tous est complet """
+        if len(tas) >= self.nombre:
+            return None
+        # Tas vide mais comptes existants : reconstruction à la première lecture
+        return max(tas)[0] if tas else float('-inf')
+
+    def histogramme_par_tranche(self):
+        """ Nombre de comptes par tranche de solde (libellés en Fcfa) """
+        bornes = self.tranches + [None]
+        return {
+            f"{bas}-{haut}" if haut is not None else f"{bas}+": effectif
+            for bas, haut, effectif in zip(bornes, bornes[1:], self.histogramme)
+        }
+
+    def resume(self):
+        """ Retourne tous les agrégats dans un dictionnaire """
+        return {
+            "nombre_comptes": self.nombre,
+            "total_actifs": self.total,
+            "solde_min": self.minimum(),
+            "solde_max": self.maximum(),
+            "histogramme": self.histogramme_par_tranche(),
+        }
+
+    def verifier(self, comptes):
+        """ Compare les agrégats à un recalcul complet (audit).
+            Retourne la liste des écarts, vide si tout est cohérent. """
+        reference = StatistiquesBanque(self.__solde_actuel, tranches=self.tranches)
+        reference.reconstruire(comptes)
+        attendu, obtenu = reference.resume(), self.resume()
+        return [(cle, valeur, obtenu[cle]) for cle, valeur in attendu.items() if valeur != obtenu[cle]]
@@ -0,0 +1,58 @@
+from array import array
+from models.montant import Montant
+from config.constants import (
+    SOLDE_MINIMUM, TAUX_INTERET_MENSUEL_PB, FRAIS_TENUE_COMPTE, FRAIS_SOLDE_BAS
+)
+
+try:
+    import numpy
+except ImportError:  # Dépendance facultative : repli sur array
+    numpy = None
+
+
+class ReglesMensuelles:
+    """ Règles du traitement mensuel (montants en centimes)
+
+        - intérêts : taux_pb points de base (1/10 000) du solde, arrondis au
+          centime, seulement si le solde atteint solde_minimum ;
+        - frais de tenue de compte pour tous, plus frais_solde_bas si le solde
+          est sous solde_minimum ;
+        - les frais sont plafonnés : un solde ne devient jamais négatif.
+    """
+
+    def __init__(self, taux_pb=TAUX_INTERET_MENSUEL_PB,
+                 frais_tenue=Montant.depuis_fcfa(FRAIS_TENUE_COMPTE),
+                 frais_solde_bas=Montant.depuis_fcfa(FRAIS_SOLDE_BAS),
+                 solde_minimum=Montant.depuis_fcfa(SOLDE_MINIMUM)):
+        self.taux_pb = taux_pb
+        self.frais_tenue = frais_tenue
+        self.frais_solde_bas = frais_solde_bas
+        self.solde_minimum = solde_minimum
+
+
+def calculer_mouvements(soldes, regles):
+    """ Calcule d'un bloc les intérêts et les frais de chaque solde.
+
+        soldes : array('q') en centimes. Retourne deux array('q') (intérêts, frais).
+        Avec numpy, le calcul est vectoriel et travaille sur le tampon sans copie.
+    """
+    if numpy is not None:
+        return _calculer_numpy(soldes, regles)
+    taux, minimum = regles.taux_pb, regles.solde_minimum
+    frais_tenue, frais_bas = regles.frais_tenue, regles.frais_solde_bas
+    # Arrondi au centime le plus proche (soldes positifs)
+    interets = array('q', [(s * taux + 5_000) // 10_000 if s >= minimum else 0 for s in soldes])
+    frais = array('q', [
+        min(frais_tenue + (frais_bas if s < minimum else 0), s + i)
+        for s, i in zip(soldes, interets)
+    ])
+    return interets, frais
+
+
+def _calculer_numpy(soldes, regles):
+    s = numpy.frombuffer(soldes, dtype=numpy.int64)
+    eligibles = s >= regles.solde_minimum
+    interets = numpy.where(eligibles, (s * regles.taux_pb + 5_000) // 10_000, 0)
+    frais = numpy.where(eligibles, regles.frais_tenue, regles.frais_tenue + regles.frais_solde_bas)
+    frais = numpy.minimum(frais, s + interets)
+    return array('q', interets.astype(numpy.int64).tobytes()), array('q', frais.astype(numpy.int64).tobytes())
@@ -0,0 +1,83 @@
+import datetime
+from models.montant import Montant
+from config.constants import FORMAT_DATE
+
+
+class Transaction:
+    """ Enregistrement compact d'une transaction
+
+        Le type est un code d'une lettre et la date un horodatage epoch :
+        le texte de la date n'est construit qu'à l'affichage.
+    """
+
+    __slots__ = ("code", "montant_centimes", "horodatage", "solde_centimes")
+
+    DEPOT = "D"
+    RETRAIT = "R"
+    INTERETS = "I"
+    FRAIS = "F"
+    # Solde initial, daté à l'ouverture : repère de solde_au, absent des relevés
+    OUVERTURE = "O"
+    LIBELLES = {DEPOT: "Dépôt", RETRAIT: "Retrait", INTERETS: "Intérêts", FRAIS: "Frais", OUVERTURE: "Ouverture"}
+    CODES = {libelle: code for code, libelle in LIBELLES.items()}
+    # Types qui augmentent le solde
+    CREDITS = frozenset((DEPOT, INTERETS, OUVERTURE))
+
+    def __init__(self, code, montant_centimes, horodatage, solde_centimes):
+        self.code = code
+        self.montant_centimes = montant_centimes
+        self.horodatage = horodatage
+        self.solde_centimes = solde_centimes
+
+    @property
+    def type(self):
+        """ Libellé du type de transaction """
+        return self.LIBELLES[self.code]
+
+    @property
+    def date(self):
+        """ Date formatée (calculée à la demande) """
+        return datetime.datetime.fromtimestamp(self.horodatage).strftime(FORMAT_DATE)
+
+    def to_dict(self):
+        """ Forme compacte écrite sur disque """
+        return {"t": self.code, "m": self.montant_centimes, "h": self.horodatage, "s": self.solde_centimes}
+
+    @classmethod
+    def from_dict(cls, data):
+        """ Relit une transaction, y compris dans les anciens formats sur disque """
+        if "t" in data:
+            return cls(data["t"], data["m"], data["h"], data["s"])
+        if "montant_centimes" in data:
+            return cls(cls.CODES[data["type"]], data["montant_centimes"],
+                       data["horodatage"], data["solde_centimes"])
+        # Format d'origine : montants en Fcfa (float)
+        return cls(
+            cls.CODES[data["type"]],
+            Montant.depuis_fcfa(data["montant"], arrondir=True),
+            data["horodatage"],
+            Montant.depuis_fcfa(data["solde_apres_transaction"], arrondir=True),
+        )
+
+    def solde_avant(self):
+        """ Solde du compte juste avant cette transaction """
+        if self.code in self.CREDITS:
+            return self.solde_centimes - self.montant_centimes
+        return self.solde_centimes + self.montant_centimes
+
+    def get_info(self):
+        """ Retourne la transaction sous forme lisible """
+        return {
+            "type": self.type,
+            "montant_centimes": self.montant_centimes,
+            "date": self.date,
+            "solde_centimes": self.solde_centimes,
+        }
+
+    def __eq__(self, autre):
+        if not isinstance(autre, Transaction):
+            return NotImplemented
+        return self.to_dict() == autre.to_dict()
+
+    def __repr__(self):
+        return f"Transaction({self.type}, {Montant.formater(self.montant_centimes)}, {self.date})"
@@ -0,0 +1,118 @@
+# ============================================================================
+# tests/test_ancienne_banque.py
+# ============================================================================
+TEST_ANCIENNE_BANQUE = """
+Tests de recoupement : l'ancien point d'entrée (banque.py) et le paquet
+donnent les mêmes résultats, au même coût par opération
+"""
+import contextlib
+import io
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+import unittest
+from unittest import mock
+import banque as ancienne
+from models.banque import Banque
+from models.montant import Montant
+
+NOMBRE_COMPTES = 20_000
+NOMBRE_OPERATIONS = 300
+
+
+class TestAncienneBanque(unittest.TestCase):
+    """Recoupement entre banque.Banque et models.banque.Banque"""
+
+    def setUp(self):
+        """Deux copies d'une grande banque à l'ancien format (soldes en Fcfa)"""
+        self.dossier = tempfile.mkdtemp()
+        aleatoire = random.Random(7)
+        data = {
+            f"N{i}": {"titulaire": f"Client {i}", "numero_compte": f"N{i}", "solde": aleatoire.randint(100, 10_000)}
+            for i in range(NOMBRE_COMPTES)
+        }
+        self.fichiers = []
+        for nom in ("ancienne", "paquet"):
+            fichier = os.path.join(self.dossier, nom, "banque.json")
+            os.makedirs(os.path.dirname(fichier))
+            with open(fichier, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            self.fichiers.append(fichier)
+        numeros = list(data)
+        self.operations = [
+            (aleatoire.choice("DRT"), aleatoire.choice(numeros), aleatoire.choice(numeros), aleatoire.randint(1, 5_000))
+            for _ in range(NOMBRE_OPERATIONS)
+        ]
+
+    def tearDown(self):
+        """Nettoyage après chaque test"""
+        shutil.rmtree(self.dossier, ignore_errors=True)
+
+    def executer_ancienne(self):
+        banque = ancienne.Banque("Ancienne", fichier=self.fichiers[0])
+        actions = {
+            "D": lambda n, _, m: banque.effectuer_depot(n, m),
+            "R": lambda n, _, m: banque.effectuer_retrait(n, m),
+            "T": lambda n, d, m: banque.transferer(n, d, m),
+        }
+        return banque, banque.moteur, actions
+
+    def executer_paquet(self):
+        banque = Banque("Paquet", fichier=self.fichiers[1])
+        actions = {
+            "D": lambda n, _, m: banque.effectuer_depot(n, Montant.depuis_fcfa(m))[0],
+            "R": lambda n, _, m: banque.effectuer_retrait(n, Montant.depuis_fcfa(m))[0],
+            "T": lambda n, d, m: n != d and banque.transferer(n, d, Montant.depuis_fcfa(m))[0],
+        }
+        return banque, banque, actions
+
+    def chronometrer(self, demarrer):
+        """ Exécute les opérations ; retourne (succès, soldes, statistiques, s / opération) """
+        with contextlib.redirect_stdout(io.StringIO()):
+            banque, moteur, actions = demarrer()
+            debut = time.perf_counter()
+            succes = [actions[code](source, dest, montant) for code, source, dest, montant in self.operations]
+            duree = (time.perf_counter() - debut) / len(self.operations)
+            soldes = {c.get_numero_compte(): c.get_solde() for page in moteur.parcourir_comptes(taille_page=5_000)
+                      for c in page}
+            statistiques = moteur.statistiques()
+            banque.fermer()
+        return succes, soldes, statistiques, duree
+
+    def test_memes_resultats_meme_cout(self):
+        """Mêmes succès, mêmes soldes, mêmes agrégats ; coût par opération comparable"""
+        succes_a, soldes_a, stats_a, duree_a = self.chronometrer(self.executer_ancienne)
+        succes_p, soldes_p, stats_p, duree_p = self.chronometrer(self.executer_paquet)
+        self.assertEqual(succes_a, succes_p)
+        self.assertEqual(soldes_a, soldes_p)
+        self.assertEqual(stats_a, stats_p)
+        # Même moteur : seul l'affichage diffère (pas de réécriture du fichier à chaque opération)
+        self.assertLess(duree_a, 3 * duree_p + 1e-3)
+
+    def test_ouverture(self):
+        """Ouverture de compte : un numéro déjà pris est refusé"""
+        with contextlib.redirect_stdout(io.StringIO()):
+            banque = ancienne.Banque("Ancienne", fichier=self.fichiers[0])
+            self.assertTrue(banque.ouvrir_compte(ancienne.CompteBancaire("Nouveau", "X1", Montant.depuis_fcfa(500))))
+            self.assertFalse(banque.ouvrir_compte(ancienne.CompteBancaire("Autre", "X1", Montant.depuis_fcfa(500))))
+            self.assertEqual(banque.calcul_total_actif(), Montant.vers_fcfa(banque.moteur.statistiques()["total_actifs"]))
+            banque.fermer()
+
+    def test_ouverture_interactive_refusee(self):
+        """Menu d'ouverture : un refus du moteur est affiché, pas le message de succès"""
+        sortie = io.StringIO()
+        with contextlib.redirect_stdout(sortie):
+            banque = ancienne.Banque("Ancienne", fichier=self.fichiers[0])
+            with mock.patch.object(banque.moteur, "ouvrir_compte", return_value=(False, "Refusé")), \
+                    mock.patch("builtins.input", side_effect=["X1", "Nouveau", "500", "0"]):
+                banque.ouvrir_compte_interactif()
+            banque.fermer()
+        self.assertIn("❌ Erreur : Refusé", sortie.getvalue())
+        self.assertNotIn("crée avec succès", sortie.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,248 @@
+# ============================================================================
+# tests/test_banque.py
+# ============================================================================
+TEST_BANQUE = """
+Tests unitaires pour la classe Banque
+"""
+import datetime
+import os
+import shutil
+import tempfile
+import unittest
+from models.banque import Banque
+
+
+class TestBanque(unittest.TestCase):
+    """Tests pour la classe Banque"""
+
+    def setUp(self):
+        """Initialisation avant chaque test"""
+        self.dossier = tempfile.mkdtemp()
+        self.fichier = os.path.join(self.dossier, "banque.json")
+        self.banque = Banque("Test Banque", fichier=self.fichier)
+
+    def tearDown(self):
+        """Nettoyage après chaque test"""
+        self.banque.fermer()
+        shutil.rmtree(self.dossier, ignore_errors=True)
+
+    def test_ouvrir_compte(self):
+        """Test d'ouverture d'un compte"""
+        succes, _ = self.banque.ouvrir_compte("Jean", "C001", 50000)
+        self.assertTrue(succes)
+        self.assertEqual(len(self.banque), 1)
+        self.assertEqual(self.banque.chercher_compte("C001").get_titulaire(), "Jean")
+
+    def test_ouvrir_compte_doublon(self):
+        """Test d'ouverture d'un compte déjà existant"""
+        self.banque.ouvrir_compte("Jean", "C001", 50000)
+        succes, _ = self.banque.ouvrir_compte("Paul", "C001", 50000)
+        self.assertFalse(succes)
+        self.assertEqual(len(self.banque), 1)
+
+    def test_chercher_compte_inexistant(self):
+        """Test de recherche d'un compte inexistant"""
+        self.assertIsNone(self.banque.chercher_compte("C999"))
+
+    def test_supprimer_compte(self):
+        """Test de suppression d'un compte"""
+        self.banque.ouvrir_compte("Jean", "C001", 50000)
+        succes, _ = self.banque.supprimer_compte("C001")
+        self.assertTrue(succes)
+        self.assertIsNone(self.banque.chercher_compte("C001"))
+        self.assertFalse(self.banque.supprimer_compte("C001")[0])
+
+    def test_transferer(self):
+        """Test de transfert entre deux comptes"""
+        self.banque.ouvrir_compte("Jean", "C001", 50000)
+        self.banque.ouvrir_compte("Paul", "C002", 20000)
+        succes, _ = self.banque.transferer("C001", "C002", 30000)
+        self.assertTrue(succes)
+        self.assertEqual(self.banque.chercher_compte("C001").get_solde(), 20000)
+        self.assertEqual(self.banque.chercher_compte("C002").get_solde(), 50000)
+
+    def test_persistance(self):
+        """Test du rechargement des comptes depuis le fichier"""
+        self.banque.ouvrir_compte("Jean", "C001", 50000)
+        self.banque.ouvrir_compte("Paul", "C002", 20000)
+        self.banque.effectuer_depot("C001", 10000)
+
+        rechargee = Banque("Test Banque", fichier=self.fichier)
+        self.assertEqual(len(rechargee), 2)
+        self.assertEqual(rechargee.chercher_compte("C001").get_solde(), 60000)
+
+    def test_rejeu_journal(self):
+        """Test du rejeu du journal sans compaction"""
+        self.banque.ouvrir_compte("Jean", "C001", 50000)
+        self.banque.ouvrir_compte("Paul", "C002", 20000)
+        self.banque.transferer("C001", "C002", 10000)
+        self.banque.supprimer_compte("C002")
+        self.assertFalse(os.path.exists(self.fichier))
+
+        rechargee = Banque("Test Banque", fichier=self.fichier)
+        self.assertEqual(len(rechargee), 1)
+        self.assertEqual(rechargee.chercher_compte("C001").get_solde(), 40000)
+        rechargee.fermer()
+
+    def test_compaction(self):
+        """Test de la compaction du journal dans l'instantané"""
+        self.banque.ouvrir_compte("Jean", "C001", 50000)
+        self.assertTrue(self.banque.compacter())
+        journal = os.path.join(self.dossier, "banque.journal")
+        self.assertEqual(os.path.getsize(journal), 0)
+
+        rechargee = Banque("Test Banque", fichier=self.fichier)
+        self.assertEqual(rechargee.chercher_compte("C001").get_solde(), 50000)
+        rechargee.fermer()
+
+    def test_journal_ligne_incomplete(self):
+        """Test du rejeu avec une dernière ligne tronquée par un crash"""
+        self.banque.ouvrir_compte("Jean", "C001", 50000)
+        journal = os.path.join(self.dossier, "banque.journal")
+        with open(journal, 'a', encoding='utf-8') as f:
+            f.write('{"op":"maj","comptes":[{"titu')
+
+        rechargee = Banque("Test Banque", fichier=self.fichier)
+        self.assertEqual(len(rechargee), 1)
+        rechargee.effectuer_depot("C001", 10000)
+        rechargee.fermer()
+        self.assertEqual(Banque("Test", fichier=self.fichier).chercher_compte("C001").get_solde(), 60000)
+
+    def test_historique_persistant(self):
+        """Test de la relecture de l'historique après redémarrage"""
+        self.banque.ouvrir_compte("Jean", "C001", 50000)
+        self.banque.ouvrir_compte("Paul", "C002", 20000)
+        self.banque.effectuer_depot("C001", 10000)
+        self.banque.transferer("C001", "C002", 5000)
+
+        rechargee = Banque("Test Banque", fichier=self.fichier)
+        pages = list(rechargee.historique("C001", taille_page=1))
+        self.assertEqual(len(pages), 2)
+        self.assertEqual([p[0].type for p in pages], ["Dépôt", "Retrait"])
+        self.assertEqual(pages[-1][0].solde_centimes, 55000)
+        self.assertEqual(len(list(rechargee.historique("C002"))), 1)
+
+    def test_historique_par_dates(self):
+        """Test du filtrage de l'historique par période"""
+        self.banque.ouvrir_compte("Jean", "C001", 50000)
+        self.banque.effectuer_depot("C001", 10000)
+        demain = datetime.datetime.now() + datetime.timedelta(days=1)
+        hier = datetime.datetime.now() - datetime.timedelta(days=1)
+
+        self.assertEqual(list(self.banque.historique("C001", debut=demain)), [])
+        self.assertEqual(len(next(self.banque.historique("C001", debut=hier, fin=demain))), 1)
+
+    def test_historique_memoire_bornee(self):
+        """Test de la fenêtre bornée de l'historique en mémoire"""
+        self.banque.ouvrir_compte("Jean", "C001", 50000)
+        compte = self.banque.chercher_compte("C001")
+        for _ in range(compte.historique.maxlen + 5):
+            self.banque.effectuer_depot("C001", 100)
+        self.assertEqual(len(compte.historique), compte.historique.maxlen)
+        total = sum(len(page) for page in self.banque.historique("C001"))
+        self.assertEqual(total, compte.historique.maxlen + 5)
+
+    def test_appliquer_lot(self):
+        """Test d'un lot d'opérations persisté en une seule écriture"""
+        self.banque.ouvrir_compte("Jean", "C001", 50000)
+        self.banque.ouvrir_compte("Paul", "C002", 20000)
+        self.banque.compacter()
+
+        succes, resultats = self.banque.appliquer_lot([
+            ("depot", "C001", 10000),
+            ("retrait", "C002", 100000),
+            ("transfert", "C001", "C002", 5000),
+        ])
+        self.assertFalse(succes)
+        self.assertEqual([r[0] for r in resultats], [True, False, True])
+        journal = os.path.join(self.dossier, "banque.journal")
+        with open(journal, encoding='utf-8') as f:
+            self.assertEqual(len(f.readlines()), 1)
+
+        rechargee = Banque("Test Banque", fichier=self.fichier)
+        self.assertEqual(rechargee.chercher_compte("C001").get_solde(), 55000)
+        self.assertEqual(rechargee.chercher_compte("C002").get_solde(), 25000)
+        self.assertEqual(sum(len(p) for p in rechargee.historique("C001")), 2)
+
+    def test_appliquer_lot_atomique(self):
+        """Test de l'annulation complète d'un lot atomique"""
+        self.banque.ouvrir_compte("Jean", "C001", 50000)
+        self.banque.ouvrir_compte("Paul", "C002", 20000)
+
+        succes, resultats = self.banque.appliquer_lot([
+            ("depot", "C001", 10000),
+            ("transfert", "C001", "C002", 5000),
+            ("retrait", "C002", 100000),
+            ("depot", "C002", 1000),
+        ], atomique=True)
+        self.assertFalse(succes)
+        self.assertEqual(len(resultats), 3)
+        self.assertEqual(self.banque.chercher_compte("C001").get_solde(), 50000)
+        self.assertEqual(self.banque.chercher_compte("C002").get_solde(), 20000)
+        self.assertEqual(len(self.banque.chercher_compte("C001").historique), 0)
+        self.assertEqual(list(self.banque.historique("C001")), [])
+
+    def test_lot_exception(self):
+        """Test de l'annulation d'un lot interrompu par une exception"""
+        self.banque.ouvrir_compte("Jean", "C001", 50000)
+        with self.assertRaises(RuntimeError):
+            with self.banque.lot():
+                self.banque.effectuer_depot("C001", 10000)
+                self.banque.ouvrir_compte("Paul", "C002", 20000)
+                self.banque.supprimer_compte("C001")
+                raise RuntimeError("panne")
+        self.assertEqual(self.banque.chercher_compte("C001").get_solde(), 50000)
+        self.assertIsNone(self.banque.chercher_compte("C002"))
+
+    def test_lot_atomique_imbrique(self):
+        """Un lot atomique dans un lot englobant n'annule que ses propres opérations"""
+        self.banque.ouvrir_compte("Jean", "C001", 50000)
+        self.banque.ouvrir_compte("Paul", "C002", 20000)
+        with self.banque.lot():
+            self.banque.effectuer_depot("C002", 1000)
+            succes, _ = self.banque.appliquer_lot([
+                ("depot", "C001", 10000),
+                ("retrait", "C002", 100000),
+            ], atomique=True)
+            self.assertFalse(succes)
+            self.assertEqual(self.banque.chercher_compte("C001").get_solde(), 50000)
+            self.assertEqual(self.banque.chercher_compte("C002").get_solde(), 21000)
+        self.assertEqual(self.banque.verifier_statistiques(), [])
+        self.banque.fermer()
+        self.banque = Banque("Test Banque", fichier=self.fichier)
+        self.assertEqual(self.banque.chercher_compte("C001").get_solde(), 50000)
+        self.assertEqual(self.banque.chercher_compte("C002").get_solde(), 21000)
+        self.assertEqual(len(list(self.banque.historique("C001"))), 0)
+        self.assertEqual(sum(len(p) for p in self.banque.historique("C002")), 1)
+
+    def test_statistiques_incrementales(self):
+        """Test des agrégats tenus à jour à chaque opération"""
+        self.banque.ouvrir_compte("Jean", "C001", 50000)
+        self.banque.ouvrir_compte("Paul", "C002", 200000)
+        self.banque.ouvrir_compte("Marie", "C003", 15000)
+        self.banque.transferer("C002", "C003", 100000)
+        self.banque.effectuer_retrait("C001", 40000)
+        self.banque.supprimer_compte("C002")
+
+        stats = self.banque.statistiques()
+        self.assertEqual(stats['nombre_comptes'], 2)
+        self.assertEqual(stats['total_actifs'], 125000)
+        self.assertEqual(stats['solde_min'], 10000)
+        self.assertEqual(stats['solde_max'], 115000)
+        self.assertEqual(stats['histogramme']['0-1000'], 1)
+        self.assertEqual(stats['histogramme']['1000-10000'], 1)
+        self.assertEqual(self.banque.verifier_statistiques(), [])
+
+    def test_statistiques_apres_annulation(self):
+        """Test de la cohérence des agrégats après l'annulation d'un lot"""
+        self.banque.ouvrir_compte("Jean", "C001", 50000)
+        self.banque.appliquer_lot([
+            ("depot", "C001", 500000),
+            ("retrait", "C001", 10000000),
+        ], atomique=True)
+        self.assertEqual(self.banque.statistiques()['solde_max'], 50000)
+        self.assertEqual(self.banque.verifier_statistiques(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+# ============================================================================
+# tests/test_banque_repartie.py
+# ============================================================================
+TEST_BANQUE_REPARTIE = """
+Tests unitaires de la banque répartie sur plusieurs processus
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from models.banque import Banque
+from models.banque_repartie import BanqueRepartie
+from models.montant import Montant
+from utils.journal import Journal
+
+
+class TestBanqueRepartie(unittest.TestCase):
+    """Tests pour BanqueRepartie (routage et transferts en deux phases)"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Une seule banque pour la classe : démarrer des processus est coûteux"""
+        cls.dossier = tempfile.mkdtemp()
+        cls.banque = BanqueRepartie("Test", dossier=cls.dossier, nombre_processus=3)
+        # Deux comptes sur des shards différents, deux sur le même
+        numeros = [f"C{i}" for i in range(20)]
+        cls.a = numeros[0]
+        cls.b = next(n for n in numeros if cls.banque.shard(n) != cls.banque.shard(cls.a))
+        cls.c = next(n for n in numeros[1:] if cls.banque.shard(n) == cls.banque.shard(cls.a))
+        for numero in (cls.a, cls.b, cls.c):
+            cls.banque.ouvrir_compte(f"Client {numero}", numero, Montant.depuis_fcfa(1000))
+
+    @classmethod
+    def tearDownClass(cls):
+        """Nettoyage après les tests"""
+        cls.banque.fermer()
+        shutil.rmtree(cls.dossier, ignore_errors=True)
+
+    def solde(self, numero):
+        return self.banque.chercher_compte(numero)["solde_centimes"]
+
+    def test_routage(self):
+        """Chaque compte est servi par son processus ; les agrégats couvrent tous les shards"""
+        self.assertEqual(self.banque.chercher_compte(self.b)["titulaire"], f"Client {self.b}")
+        self.assertIsNone(self.banque.chercher_compte("inconnu"))
+        statistiques = self.banque.statistiques()
+        self.assertEqual(statistiques["nombre_comptes"], len(self.banque))
+        self.assertEqual(statistiques["total_actifs"], sum(self.solde(n) for n in (self.a, self.b, self.c)))
+
+    def test_transfert_entre_shards(self):
+        """Transfert en deux phases : débit et crédit, ou rien"""
+        avant = self.solde(self.a), self.solde(self.b)
+        succes, _ = self.banque.transferer(self.a, self.b, 500)
+        self.assertTrue(succes)
+        self.assertEqual((self.solde(self.a), self.solde(self.b)), (avant[0] - 500, avant[1] + 500))
+
+        succes, message = self.banque.transferer(self.a, self.b, 10**12)
+        self.assertFalse(succes)
+        self.assertEqual(message, "Fonds insuffisants")
+        succes, _ = self.banque.transferer(self.a, "absent", 100)
+        self.assertFalse(succes)
+        self.assertEqual((self.solde(self.a), self.solde(self.b)), (avant[0] - 500, avant[1] + 500))
+
+    def test_reprise_apres_annulation(self):
+        """Un transfert annulé, renvoyé avec le même identifiant, ne crédite rien"""
+        dest = next(f"N{i}" for i in range(50) if self.banque.shard(f"N{i}") != self.banque.shard(self.a))
+        total = self.banque.statistiques()["total_actifs"]
+        avant = self.solde(self.a)
+        self.assertFalse(self.banque.transferer(self.a, dest, 500, identifiant="reprise")[0])
+        self.assertEqual(self.solde(self.a), avant)
+        self.banque.ouvrir_compte("Client nouveau", dest, Montant.depuis_fcfa(1000))
+        self.assertFalse(self.banque.transferer(self.a, dest, 500, identifiant="reprise")[0])
+        self.assertEqual(self.solde(self.a), avant)
+        self.assertEqual(self.solde(dest), Montant.depuis_fcfa(1000))
+        self.assertEqual(self.banque.statistiques()["total_actifs"], total + Montant.depuis_fcfa(1000))
+        self.assertTrue(self.banque.supprimer_compte(dest)[0])
+
+    def test_lot(self):
+        """Un lot mélange opérations locales et transferts entre shards, dans l'ordre"""
+        total = self.banque.statistiques()["total_actifs"]
+        succes, resultats = self.banque.appliquer_lot([
+            ("depot", self.a, 100), ("transfert", self.a, self.b, 50),
+            ("transfert", self.a, self.c, 50), ("retrait", self.b, 10**12),
+        ])
+        self.assertFalse(succes)
+        self.assertEqual([r[0] for r in resultats], [True, True, True, False])
+        self.assertEqual(self.banque.statistiques()["total_actifs"], total + 100)
+        with self.assertRaises(ValueError):
+            self.banque.appliquer_lot([("transfert", self.a, self.b, 1)], atomique=True)
+
+    def test_lot_operations_invalides(self):
+        """Une opération inconnue ou mal formée est refusée sans être routée"""
+        succes, resultats = self.banque.appliquer_lot([
+            ("foo",), ("depot", self.a, 100), ("transfert", self.a, 50), (),
+        ])
+        self.assertFalse(succes)
+        self.assertEqual(resultats[0], (False, "Opération inconnue : foo"))
+        self.assertTrue(resultats[1][0])
+        self.assertFalse(resultats[2][0])
+        self.assertFalse(resultats[3][0])
+        avant = self.solde(self.a)
+        succes, resultats = self.banque.appliquer_lot([("depot", self.a, 100), ("foo",)], atomique=True)
+        self.assertFalse(succes)
+        self.assertEqual(self.solde(self.a), avant)
+
+
+class TestRepriseCoordinateur(unittest.TestCase):
+    """Reprise des transferts interrompus au redémarrage"""
+
+    def setUp(self):
+        self.dossier = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dossier, ignore_errors=True)
+
+    def test_debit_sans_decision_rembourse(self):
+        """Un débit préparé sans décision de valider est remboursé"""
+        banque = BanqueRepartie("Test", dossier=self.dossier, nombre_processus=2)
+        source = next(f"S{i}" for i in range(20) if banque.shard(f"S{i}") == 0)
+        dest = next(f"D{i}" for i in range(20) if banque.shard(f"D{i}") == 1)
+        banque.ouvrir_compte("Source", source, Montant.depuis_fcfa(1000))
+        banque.ouvrir_compte("Dest", dest, Montant.depuis_fcfa(1000))
+        banque.fermer()
+
+        # Coordinateur arrêté entre la préparation et la décision
+        shard = Banque("Shard", fichier=os.path.join(self.dossier, "banque_0.json"))
+        shard.effectuer_retrait(source, 300, identifiant="t1:debit")
+        shard.fermer()
+        journal = Journal(os.path.join(self.dossier, "coordinateur.journal"))
+        journal.ajouter({"op": "debut", "transfert": "t1", "source": source, "dest": dest, "montant": 300})
+        journal.fermer()
+
+        banque = BanqueRepartie("Test", dossier=self.dossier, nombre_processus=2)
+        try:
+            self.assertEqual(banque.chercher_compte(source)["solde_centimes"], Montant.depuis_fcfa(1000))
+            self.assertEqual(banque.chercher_compte(dest)["solde_centimes"], Montant.depuis_fcfa(1000))
+        finally:
+            banque.fermer()
+        with self.assertRaises(ValueError):
+            BanqueRepartie("Test", dossier=self.dossier, nombre_processus=3)
+
+
+if __name__ == '__main__':
+    unittest.main()
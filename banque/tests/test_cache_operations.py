@@ -0,0 +1,128 @@
+# ============================================================================
+# tests/test_cache_operations.py
+# ============================================================================
+TEST_CACHE_OPERATIONS = """
+Tests unitaires des opérations idempotentes (identifiant fourni par le client)
+"""
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from models.banque import Banque
+from models.montant import Montant
+from utils.cache_operations import CacheOperations
+
+
+class TestCacheOperations(unittest.TestCase):
+    """Tests pour CacheOperations et le paramètre identifiant de Banque"""
+
+    def setUp(self):
+        """Initialisation avant chaque test"""
+        self.dossier = tempfile.mkdtemp()
+        self.fichier = os.path.join(self.dossier, "banque.json")
+        self.banque = Banque("Test", fichier=self.fichier)
+        self.banque.ouvrir_compte("Alice", "A1", Montant.depuis_fcfa(1000))
+        self.banque.ouvrir_compte("Bob", "B1", Montant.depuis_fcfa(1000))
+
+    def tearDown(self):
+        """Nettoyage après chaque test"""
+        self.banque.fermer()
+        shutil.rmtree(self.dossier, ignore_errors=True)
+
+    def solde(self, numero):
+        return self.banque.chercher_compte(numero).get_solde()
+
+    def test_depot_renvoye(self):
+        """Un dépôt renvoyé avec le même identifiant n'est appliqué qu'une fois"""
+        premier = self.banque.effectuer_depot("A1", Montant.depuis_fcfa(50), identifiant="op-1")
+        second = self.banque.effectuer_depot("A1", Montant.depuis_fcfa(50), identifiant="op-1")
+        self.assertEqual(premier, second)
+        self.assertEqual(self.solde("A1"), Montant.depuis_fcfa(1050))
+        self.banque.effectuer_depot("A1", Montant.depuis_fcfa(50), identifiant="op-2")
+        self.assertEqual(self.solde("A1"), Montant.depuis_fcfa(1100))
+
+    def test_persistance(self):
+        """Le cache survit à un redémarrage"""
+        resultat = self.banque.transferer("A1", "B1", Montant.depuis_fcfa(100), identifiant="t-1")
+        lot = self.banque.appliquer_lot([("depot", "B1", 1), ("retrait", "B1", 10**12)], identifiant="l-1")
+        self.banque.fermer()
+        self.banque = Banque("Test", fichier=self.fichier)
+        self.assertEqual(self.banque.transferer("A1", "B1", Montant.depuis_fcfa(100), identifiant="t-1"), resultat)
+        self.assertEqual(self.banque.appliquer_lot([], identifiant="l-1"), lot)
+        self.assertEqual(self.solde("A1"), Montant.depuis_fcfa(900))
+
+    def test_renvois_simultanes(self):
+        """Des renvois simultanés attendent le premier résultat"""
+        fils = [
+            threading.Thread(target=self.banque.effectuer_retrait, args=("A1", 100), kwargs={"identifiant": "r-1"})
+            for _ in range(8)
+        ]
+        for fil in fils:
+            fil.start()
+        for fil in fils:
+            fil.join()
+        self.assertEqual(self.solde("A1"), Montant.depuis_fcfa(1000) - 100)
+
+    def test_lot_annule(self):
+        """Une opération d'un lot annulé n'est pas enregistrée"""
+        with self.assertRaises(RuntimeError):
+            with self.banque.lot():
+                self.banque.effectuer_depot("A1", 100, identifiant="d-1")
+                raise RuntimeError()
+        self.banque.effectuer_depot("A1", 100, identifiant="d-1")
+        self.assertEqual(self.solde("A1"), Montant.depuis_fcfa(1000) + 100)
+
+    def test_capacite_et_duree(self):
+        """Les identifiants les moins récents et les résultats expirés sont oubliés"""
+        maintenant = [0.0]
+        cache = CacheOperations(os.path.join(self.dossier, "cache.operations"),
+                                capacite=2, duree=10, horloge=lambda: maintenant[0])
+        for identifiant in ("a", "b", "c"):
+            cache.enregistrer(identifiant, (True, identifiant))
+        self.assertIsNone(cache.chercher("a"))
+        self.assertEqual(cache.chercher("b"), (True, "b"))
+        maintenant[0] = 11
+        self.assertIsNone(cache.chercher("c"))
+        cache.fermer()
+
+    def test_journalisation_differee(self):
+        """Avec differer, un résultat n'est durable qu'une fois journaliser() appelé"""
+        differes = []
+        fichier = os.path.join(self.dossier, "cache.operations")
+        cache = CacheOperations(fichier, differer=differes.append)
+        self.assertEqual(cache.executer("x", lambda: (True, "x")), (True, "x"))
+        self.assertEqual(cache.executer("y", lambda: (True, "y")), (True, "y"))
+        self.assertEqual(cache.chercher("y"), (True, "y"))
+        cache.journaliser(differes[:1])
+        cache.fermer()  # La compaction ne rend pas durable un résultat en attente
+        relu = CacheOperations(fichier)
+        self.assertEqual(relu.chercher("x"), (True, "x"))
+        self.assertIsNone(relu.chercher("y"))
+        relu.fermer()
+
+    def test_resultat_apres_ecriture_asynchrone(self):
+        """Avec le thread d'écriture, le résultat est journalisé par ce thread, après le compte"""
+        self.banque.fermer()
+        self.banque = Banque("Test", fichier=self.fichier, asynchrone=True)
+        fils = []
+        journaliser = CacheOperations.journaliser
+
+        def espion(cache, enregistrements):
+            fils.append(threading.current_thread().name)
+            return journaliser(cache, enregistrements)
+
+        CacheOperations.journaliser = espion
+        try:
+            self.banque.effectuer_depot("A1", 100, identifiant="d-1")
+            self.banque.fermer()
+        finally:
+            CacheOperations.journaliser = journaliser
+        self.assertEqual(fils, ["banque-ecrivain"])
+        self.banque = Banque("Test", fichier=self.fichier)
+        self.banque.effectuer_depot("A1", 100, identifiant="d-1")
+        self.assertEqual(self.solde("A1"), Montant.depuis_fcfa(1000) + 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+# ============================================================================
+# tests/test_codec_json.py
+# ============================================================================
+TEST_CODEC_JSON = """
+Tests unitaires du codec JSON et du décodeur en flux
+"""
+import io
+import json
+import unittest
+from utils.codec_json import CODECS, CodecStandard, ecrire_objet, iterer_objet, obtenir_codec
+
+
+class TestCodecJson(unittest.TestCase):
+    """Tests pour utils.codec_json"""
+
+    DONNEES = {
+        "C001": {"titulaire": "Jérôme Ébénézer", "solde_centimes": 1234567890123},
+        "C002": {"titulaire": "Ngo Ndjock", "solde_centimes": 0, "liste": [1, 2.5, None, True]},
+        "C€3": {"titulaire": "", "solde_centimes": -7},
+    }
+
+    def test_flux_petits_blocs(self):
+        """Les valeurs, nombres et caractères multi-octets coupés entre deux blocs sont reconstitués"""
+        for indent in (None, 4):
+            donnees = json.dumps(self.DONNEES, indent=indent, ensure_ascii=False).encode('utf-8')
+            for taille_bloc in (1, 2, 3, 7, 64):
+                paires = list(iterer_objet(io.BytesIO(donnees), taille_bloc))
+                self.assertEqual(dict(paires), self.DONNEES)
+
+    def test_nombre_a_cheval(self):
+        """Un nombre de premier niveau coupé à n'importe quel octet est relu en entier"""
+        donnees = b'{"a": 12.5, "b": -1.25e+3, "c": 1234567, "d": 0.5}'
+        attendu = {"a": 12.5, "b": -1250.0, "c": 1234567, "d": 0.5}
+        for debut in range(1, len(donnees)):
+            flux = io.BytesIO(b' ' * (64 - debut) + donnees)
+            self.assertEqual(dict(iterer_objet(flux, 64)), attendu)
+
+    def test_objet_vide(self):
+        """Un objet vide ne produit aucune paire"""
+        self.assertEqual(list(iterer_objet(io.BytesIO(b' { } '))), [])
+
+    def test_fichier_tronque(self):
+        """Un fichier tronqué lève JSONDecodeError"""
+        donnees = json.dumps(self.DONNEES).encode('utf-8')[:-10]
+        with self.assertRaises(json.JSONDecodeError):
+            list(iterer_objet(io.BytesIO(donnees), 8))
+
+    def test_ecrire_objet(self):
+        """L'écriture en flux produit un JSON compact relisible par chaque codec"""
+        for codec in CODECS.values():
+            flux = io.BytesIO()
+            ecrire_objet(flux, self.DONNEES.items(), codec, taille_bloc=16)
+            self.assertNotIn(b'\n', flux.getvalue())
+            self.assertEqual(codec.decoder(flux.getvalue()), self.DONNEES)
+            self.assertEqual(json.loads(flux.getvalue()), self.DONNEES)
+
+    def test_obtenir_codec(self):
+        """Le codec standard est toujours disponible, un codec inconnu est refusé"""
+        self.assertIs(obtenir_codec("json"), CodecStandard)
+        self.assertIn(obtenir_codec("auto"), CODECS.values())
+        with self.assertRaises(ValueError):
+            obtenir_codec("pickle")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+# ============================================================================
+# tests/test_compte_bancaire.py
+# ============================================================================
+TEST_COMPTE_BANCAIRE = """
+Tests unitaires pour CompteBancaire et Transaction
+"""
+import unittest
+from models.compte_bancaire import CompteBancaire
+from models.transaction import Transaction
+
+
+class TestCompteBancaire(unittest.TestCase):
+    """Tests pour la classe CompteBancaire"""
+
+    def setUp(self):
+        """Initialisation avant chaque test"""
+        self.compte = CompteBancaire("Jean", "C001", 50000)
+
+    def test_deposer(self):
+        """Test d'un dépôt"""
+        self.assertTrue(self.compte.deposer(1000))
+        self.assertEqual(self.compte.get_solde(), 51000)
+        self.assertFalse(self.compte.deposer(0))
+
+    def test_retirer(self):
+        """Test d'un retrait et d'un retrait impossible"""
+        self.assertTrue(self.compte.retirer(1000))
+        self.assertEqual(self.compte.get_solde(), 49000)
+        self.assertFalse(self.compte.retirer(100000))
+
+    def test_transactions_compactes(self):
+        """Test des enregistrements de transaction"""
+        self.compte.deposer(1000)
+        self.compte.retirer(500)
+        depot, retrait = self.compte.historique
+        self.assertEqual((depot.type, depot.montant_centimes, depot.solde_centimes), ("Dépôt", 1000, 51000))
+        self.assertEqual(retrait.code, Transaction.RETRAIT)
+        self.assertRegex(retrait.date, r"\d{2}/\d{2}/\d{4} \d{2}:\d{2}:\d{2}")
+
+    def test_ecouteurs(self):
+        """Test : dépôts, retraits et mouvements en masse sont signalés aux écouteurs"""
+        recues = []
+        ecouteur = lambda numero, transaction: recues.append((numero, transaction))
+        CompteBancaire.abonner(ecouteur)
+        try:
+            self.compte.deposer(1000)
+            frais = self.compte.appliquer_mouvement(Transaction.FRAIS, -200, 1_700_000_000.0)
+        finally:
+            CompteBancaire.desabonner(ecouteur)
+        self.assertEqual([numero for numero, _ in recues], ["C001", "C001"])
+        self.assertIs(recues[1][1], frais)
+        self.assertEqual((frais.horodatage, frais.montant_centimes, frais.solde_centimes),
+                         (1_700_000_000.0, 200, 50800))
+        self.assertIs(self.compte.historique[-1], frais)
+
+    def test_slots(self):
+        """Test : ni compte ni transaction n'ont de __dict__"""
+        self.compte.deposer(1000)
+        self.assertFalse(hasattr(self.compte, "__dict__"))
+        self.assertFalse(hasattr(self.compte.historique[0], "__dict__"))
+
+    def test_historique_paresseux(self):
+        """Test : la fenêtre d'historique n'est créée qu'au besoin"""
+        self.assertEqual(self.compte.sauvegarder_etat()[2], [])
+        self.assertEqual(len(self.compte.historique), 0)
+
+    def test_transaction_dict(self):
+        """Test de la sérialisation compacte et des anciens formats"""
+        transaction = Transaction(Transaction.DEPOT, 1000, 1_700_000_000.0, 51000)
+        self.assertEqual(Transaction.from_dict(transaction.to_dict()), transaction)
+        ancien = {"type": "Dépôt", "montant": 10.0, "date": "", "horodatage": 1_700_000_000.0,
+                  "solde_apres_transaction": 510.0}
+        self.assertEqual(Transaction.from_dict(ancien), transaction)
+
+    def test_dict_compte(self):
+        """Test de la conversion du compte en dictionnaire et retour"""
+        copie = CompteBancaire.from_dict(self.compte.to_dict())
+        self.assertEqual(copie.get_solde(), 50000)
+        self.assertEqual(copie.get_titulaire(), "Jean")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,159 @@
+# ============================================================================
+# tests/test_concurrence.py
+# ============================================================================
+TEST_CONCURRENCE = """
+Tests de charge : transferts concurrents sur une même banque
+"""
+import os
+import random
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from models.banque import Banque
+from models.compte_bancaire import CompteBancaire
+from utils.file_manager import FileManager
+
+NOMBRE_COMPTES = 20
+NOMBRE_THREADS = 8
+TRANSFERTS_PAR_THREAD = 2000
+
+
+class TestConcurrence(unittest.TestCase):
+    """Transferts aléatoires depuis plusieurs threads"""
+
+    def setUp(self):
+        """Initialisation avant chaque test"""
+        self.dossier = tempfile.mkdtemp()
+        self.fichier = os.path.join(self.dossier, "banque.json")
+
+    def tearDown(self):
+        """Nettoyage après chaque test"""
+        shutil.rmtree(self.dossier, ignore_errors=True)
+
+    def marteler(self, banque):
+        """Lance des transferts aléatoires en parallèle"""
+        numeros = [f"C{i:03d}" for i in range(NOMBRE_COMPTES)]
+
+        def travailleur(graine):
+            aleatoire = random.Random(graine)
+            for _ in range(TRANSFERTS_PAR_THREAD):
+                source, dest = aleatoire.sample(numeros, 2)
+                banque.transferer(source, dest, aleatoire.randint(1, 300))
+
+        with ThreadPoolExecutor(max_workers=NOMBRE_THREADS) as pool:
+            list(pool.map(travailleur, range(NOMBRE_THREADS)))
+
+    def verifier_conservation(self, asynchrone):
+        banque = Banque("Test Banque", fichier=self.fichier, asynchrone=asynchrone)
+        for i in range(NOMBRE_COMPTES):
+            banque.ouvrir_compte(f"Client {i}", f"C{i:03d}", 100_000)
+        total = NOMBRE_COMPTES * 100_000
+
+        self.marteler(banque)
+        soldes = {f"C{i:03d}": banque.chercher_compte(f"C{i:03d}").get_solde()
+                  for i in range(NOMBRE_COMPTES)}
+        self.assertEqual(sum(soldes.values()), total)
+        self.assertTrue(all(solde >= 0 for solde in soldes.values()))
+        self.assertEqual(banque.statistiques()['total_actifs'], total)
+        self.assertEqual(banque.verifier_statistiques(), [])
+        banque.fermer()
+
+        # Les soldes persistés sont identiques aux soldes en mémoire
+        rechargee = Banque("Test Banque", fichier=self.fichier)
+        for numero, solde in soldes.items():
+            self.assertEqual(rechargee.chercher_compte(numero).get_solde(), solde)
+
+    def test_conservation_synchrone(self):
+        """Le total des actifs est conservé (écritures synchrones)"""
+        self.verifier_conservation(asynchrone=False)
+
+    def test_conservation_asynchrone(self):
+        """Le total des actifs est conservé (thread d'écriture)"""
+        self.verifier_conservation(asynchrone=True)
+
+    def test_historique_asynchrone(self):
+        """Chaque transfert réussi produit deux transactions sur disque"""
+        banque = Banque("Test Banque", fichier=self.fichier, asynchrone=True)
+        banque.ouvrir_compte("Jean", "C001", 100000)
+        banque.ouvrir_compte("Paul", "C002", 100000)
+        for _ in range(50):
+            banque.transferer("C001", "C002", 100)
+        banque.fermer()
+        self.assertEqual(sum(len(p) for p in banque.historique("C001")), 50)
+        self.assertEqual(sum(len(p) for p in banque.historique("C002")), 50)
+
+    def test_crash_apres_compaction(self):
+        """Une compaction pendant des transferts n'écrit jamais un transfert à moitié fait"""
+        banque = Banque("Test Banque", fichier=self.fichier)
+        for i in range(4):
+            banque.ouvrir_compte(f"Client {i}", f"C{i:03d}", 100_000)
+        total = 4 * 100_000
+        # Le journal vient d'être vidé : l'instantané est tout ce qui survivrait à un crash
+        totaux_apres_crash = []
+        compacter = FileManager.compacter
+
+        def compacter_puis_crash(fichier, comptes, journal):
+            resultat = compacter(fichier, comptes, journal)
+            soldes = FileManager.lire_instantane(fichier).values()
+            totaux_apres_crash.append(sum(c.get_solde() for c in soldes))
+            return resultat
+
+        # Un dépôt lent élargit la fenêtre entre le débit et le crédit d'un transfert
+        deposer = CompteBancaire.deposer
+
+        def deposer_lentement(compte, montant):
+            time.sleep(0.001)
+            return deposer(compte, montant)
+
+        fin = threading.Event()
+
+        def transferts():
+            aleatoire = random.Random(0)
+            while not fin.is_set():
+                source, dest = aleatoire.sample([f"C{i:03d}" for i in range(4)], 2)
+                banque.transferer(source, dest, 100)
+
+        with mock.patch.object(FileManager, "compacter", staticmethod(compacter_puis_crash)), \
+                mock.patch.object(CompteBancaire, "deposer", deposer_lentement):
+            threads = [threading.Thread(target=transferts) for _ in range(2)]
+            for thread in threads:
+                thread.start()
+            try:
+                for _ in range(30):
+                    banque.compacter()
+            finally:
+                fin.set()
+                for thread in threads:
+                    thread.join()
+        banque.fermer()
+        self.assertEqual(len(totaux_apres_crash), 30)
+        self.assertEqual(set(totaux_apres_crash), {total})
+
+    def test_lot_d_un_autre_thread(self):
+        """Un dépôt fait pendant le lot d'un autre thread n'est pas annulé avec ce lot"""
+        banque = Banque("Test Banque", fichier=self.fichier)
+        banque.ouvrir_compte("Jean", "C001", 100000)
+        resultats = []
+        depot = threading.Thread(target=lambda: resultats.append(banque.effectuer_depot("C001", 500)))
+        with self.assertRaises(RuntimeError):
+            with banque.lot():
+                banque.effectuer_depot("C001", 100)
+                depot.start()
+                time.sleep(0.2)  # Le dépôt attend la fin du lot
+                self.assertEqual(resultats, [])
+                raise RuntimeError("échec du lot")
+        depot.join()
+        self.assertTrue(resultats[0][0])
+        self.assertEqual(banque.chercher_compte("C001").get_solde(), 100500)
+        banque.fermer()
+        rechargee = Banque("Test Banque", fichier=self.fichier)
+        self.assertEqual(rechargee.chercher_compte("C001").get_solde(), 100500)
+        rechargee.fermer()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+# ============================================================================
+# tests/test_csv_comptes.py
+# ============================================================================
+TEST_CSV_COMPTES = """
+Tests unitaires de l'import / export CSV des comptes
+"""
+import csv
+import os
+import shutil
+import tempfile
+import unittest
+from models.banque import Banque
+from utils.csv_comptes import CsvComptes
+
+
+class TestCsvComptes(unittest.TestCase):
+    """Tests pour Banque.importer_csv et Banque.exporter_csv"""
+
+    def setUp(self):
+        """Initialisation avant chaque test"""
+        self.dossier = tempfile.mkdtemp()
+        self.fichier = os.path.join(self.dossier, "banque.json")
+        self.banque = Banque("Test", fichier=self.fichier)
+        self.csv = os.path.join(self.dossier, "clients.csv")
+        self.rejets = os.path.join(self.dossier, "clients.rejets.csv")
+
+    def tearDown(self):
+        """Nettoyage après chaque test"""
+        self.banque.fermer()
+        shutil.rmtree(self.dossier, ignore_errors=True)
+
+    def ecrire_csv(self, contenu):
+        with open(self.csv, 'w', encoding='utf-8') as f:
+            f.write(contenu)
+
+    def lire_rejets(self):
+        with open(self.rejets, 'r', encoding='utf-8', newline='') as f:
+            return list(csv.reader(f))
+
+    def test_import(self):
+        """Les lignes valides sont importées, avec ou sans en-tête"""
+        self.ecrire_csv("numero_compte,titulaire,solde\nC001,Jean Dupont,1500.50\nC002,\"Diallo, Awa\",200\n")
+        succes, message = self.banque.importer_csv(self.csv)
+        self.assertTrue(succes, message)
+        self.assertEqual(self.banque.chercher_compte("C001").get_solde(), 150050)
+        self.assertEqual(self.banque.chercher_compte("C002").get_titulaire(), "Diallo, Awa")
+        self.assertFalse(os.path.exists(self.rejets))
+
+        self.ecrire_csv("C003,Paul,300\n")
+        self.assertTrue(self.banque.importer_csv(self.csv)[0])
+        self.assertEqual(len(self.banque), 3)
+        self.assertEqual(self.banque.statistiques()['nombre_comptes'], 3)
+
+    def test_rejets(self):
+        """Lignes invalides et doublons vont dans le fichier de rejets"""
+        self.banque.ouvrir_compte("Existant", "C000", 10000)
+        self.ecrire_csv(
+            "C000,Doublon banque,500\n"      # 1 : déjà dans la banque
+            "C001,Jean,500\n"                # 2 : valide
+            "C001,Encore Jean,500\n"         # 3 : doublon du fichier
+            ",Sans numero,500\n"             # 4
+            "C004, ,500\n"                   # 5
+            "C005,Solde bas,10\n"            # 6
+            "C006,Solde faux,abc\n"          # 7
+            "C007,Trop de colonnes,500,x\n"  # 8
+            "C008,Marie,1 000\n"             # 9 : montant invalide
+            "C009,Awa,1000\n"                # 10 : valide
+        )
+        succes, message = self.banque.importer_csv(self.csv)
+        self.assertTrue(succes)
+        self.assertIn("2 compte(s) importé(s), 8 ligne(s) rejetée(s)", message)
+        self.assertEqual(self.banque.chercher_compte("C000").get_titulaire(), "Existant")
+        rejets = self.lire_rejets()
+        self.assertEqual(rejets[0], ["ligne", "motif", "numero_compte", "titulaire", "solde"])
+        self.assertEqual([ligne[0] for ligne in rejets[1:]], ["1", "3", "4", "5", "6", "7", "8", "9"])
+        self.assertIn("ligne 2", rejets[2][1])
+        self.assertEqual(rejets[7][2:], ["C007", "Trop de colonnes", "500", "x"])
+
+        # Un nouvel import sans rejet efface l'ancien fichier de rejets
+        self.ecrire_csv("C010,Ali,1000\n")
+        self.assertTrue(self.banque.importer_csv(self.csv)[0])
+        self.assertFalse(os.path.exists(self.rejets))
+
+    def test_persistance(self):
+        """L'import survit à un redémarrage"""
+        self.ecrire_csv("".join(f"C{i:04d},Client {i},{1000 + i}\n" for i in range(500)))
+        self.assertTrue(self.banque.importer_csv(self.csv)[0])
+        self.banque.fermer()
+        self.banque = Banque("Test", fichier=self.fichier)
+        self.assertEqual(len(self.banque), 500)
+        self.assertEqual(self.banque.chercher_compte("C0499").get_solde(), 149900)
+
+    def test_fichier_absent(self):
+        """Un fichier illisible n'importe rien"""
+        succes, message = self.banque.importer_csv(os.path.join(self.dossier, "absent.csv"))
+        self.assertFalse(succes)
+        self.assertEqual(len(self.banque), 0)
+
+    def test_encodage_invalide_annule_tout(self):
+        """Une erreur de lecture en cours de fichier annule les comptes déjà lus"""
+        with open(self.csv, 'wb') as f:
+            f.write(b"C001,Jean,500\nC002,\xff\xfe,500\n")
+        self.assertFalse(self.banque.importer_csv(self.csv)[0])
+        self.assertIsNone(self.banque.chercher_compte("C001"))
+        self.assertEqual(self.banque.statistiques()['nombre_comptes'], 0)
+
+    def test_aller_retour(self):
+        """Un export réimporté dans une banque vide redonne les mêmes comptes"""
+        self.banque.ouvrir_compte("Jean \"JJ\" Dupont", "C001", 150050)
+        self.banque.ouvrir_compte("Diallo; Awa", "C002", 20000)
+        sortie = os.path.join(self.dossier, "export.csv")
+        succes, message = self.banque.exporter_csv(sortie)
+        self.assertTrue(succes)
+        self.assertIn("2 compte(s)", message)
+
+        autre = Banque("Autre", fichier=os.path.join(self.dossier, "autre", "banque.json"))
+        try:
+            self.assertTrue(autre.importer_csv(sortie)[0])
+            for numero in ("C001", "C002"):
+                self.assertEqual(autre.chercher_compte(numero).to_dict(),
+                                 self.banque.chercher_compte(numero).to_dict())
+        finally:
+            autre.fermer()
+
+    def test_blocs(self):
+        """La lecture se fait par blocs de taille fixe"""
+        self.ecrire_csv("numero_compte,titulaire,solde\n" + "C1,A,100\n" * 25)
+        tailles = [len(bloc) for bloc in CsvComptes.lire_blocs(self.csv, taille_bloc=10)]
+        self.assertEqual(tailles, [10, 10, 5])
+
+
+if __name__ == '__main__':
+    unittest.main()
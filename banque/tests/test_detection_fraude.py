@@ -0,0 +1,92 @@
+# ============================================================================
+# tests/test_detection_fraude.py
+# ============================================================================
+TEST_DETECTION_FRAUDE = """
+Tests unitaires de la détection de vélocité des retraits
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from models.banque import Banque
+from models.compte_bancaire import CompteBancaire
+from models.detection_fraude import DetecteurVelocite, RegleVelocite
+from models.montant import Montant
+from models.transaction import Transaction
+
+
+class TestDetectionFraude(unittest.TestCase):
+    """Tests pour DetecteurVelocite"""
+
+    def setUp(self):
+        """Deux règles : plus de 3 retraits en 60 s, plus de 1000 Fcfa en 3600 s"""
+        self.detecteur = DetecteurVelocite([
+            RegleVelocite("nombre", (Transaction.RETRAIT,), 60, nombre_max=3),
+            RegleVelocite("montant", (Transaction.RETRAIT,), 3600, somme_max=Montant.depuis_fcfa(1000), capacite=4),
+        ])
+
+    def retrait(self, numero, horodatage, fcfa):
+        self.detecteur.recevoir(numero, Transaction(Transaction.RETRAIT, Montant.depuis_fcfa(fcfa), horodatage, 0))
+
+    def test_nombre_dans_la_fenetre(self):
+        """Une alerte au franchissement du seuil, pas à chaque retrait suivant"""
+        for seconde in (0, 10, 20, 30, 40):
+            self.retrait("A", seconde, 1)
+        self.assertEqual([a.regle for a in self.detecteur.alertes], ["nombre"])
+        self.assertEqual(self.detecteur.fenetre("A", "nombre"), (4, Montant.depuis_fcfa(4)))
+
+    def test_fenetre_glissante(self):
+        """Les retraits sortis de la fenêtre ne comptent plus"""
+        for seconde in (0, 30, 61, 92, 123):
+            self.retrait("A", seconde, 1)
+        self.assertEqual(len(self.detecteur.alertes), 0)
+        self.assertEqual(self.detecteur.fenetre("A", "nombre")[0], 2)
+
+    def test_somme_memoire_constante(self):
+        """Somme sur des seaux de temps en nombre fixe ; les dépôts sont ignorés"""
+        self.detecteur.recevoir("B", Transaction(Transaction.DEPOT, Montant.depuis_fcfa(10**6), 0, 0))
+        for minute in range(6):
+            self.retrait("B", minute * 100, 300)
+        alertes = [a for a in self.detecteur.alertes if a.regle == "montant"]
+        self.assertEqual(len(alertes), 1)
+        self.assertEqual(alertes[0].somme, Montant.depuis_fcfa(1200))
+        self.assertEqual(self.detecteur.fenetre("B", "montant"), (6, Montant.depuis_fcfa(1800)))
+
+    def test_somme_au_dela_de_la_capacite(self):
+        """Beaucoup de petits retraits dans la fenêtre comptent tous dans la somme"""
+        detecteur = DetecteurVelocite()
+        for i in range(240):  # 5 000 Fcfa toutes les 15 s pendant une heure
+            detecteur.recevoir("C", Transaction(Transaction.RETRAIT, Montant.depuis_fcfa(5000), i * 15, 0))
+        self.assertEqual([a.regle for a in detecteur.alertes], ["montant_retraits"])
+        self.assertEqual(detecteur.alertes[0].somme, Montant.depuis_fcfa(1_005_000))
+        self.assertEqual(detecteur.fenetre("C", "montant_retraits"), (240, Montant.depuis_fcfa(1_200_000)))
+        # Une heure et un seau plus tard, la fenêtre est vide
+        detecteur.recevoir("C", Transaction(Transaction.RETRAIT, 1, 240 * 15 + 3600 + 60, 0))
+        self.assertEqual(detecteur.fenetre("C", "montant_retraits"), (1, 1))
+
+    def test_regle_inconnue(self):
+        """Une règle inconnue n'a pas de fenêtre"""
+        self.retrait("A", 0, 1)
+        self.assertIsNone(self.detecteur.fenetre("A", "inconnue"))
+
+    def test_branche_sur_la_banque(self):
+        """Les retraits faits par la Banque arrivent au détecteur"""
+        dossier = tempfile.mkdtemp()
+        recues = []
+        self.detecteur.alerter = recues.append
+        banque = Banque("Test", fichier=os.path.join(dossier, "banque.json"))
+        try:
+            banque.ouvrir_compte("Alice", "A1", Montant.depuis_fcfa(10_000))
+            with self.detecteur:
+                for _ in range(4):
+                    banque.effectuer_retrait("A1", Montant.depuis_fcfa(10))
+            banque.effectuer_retrait("A1", Montant.depuis_fcfa(10))
+        finally:
+            banque.fermer()
+            shutil.rmtree(dossier, ignore_errors=True)
+        self.assertEqual([(a.numero_compte, a.regle) for a in recues], [("A1", "nombre")])
+        self.assertEqual(CompteBancaire.ecouteurs, ())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+# ============================================================================
+# tests/test_index_titulaires.py
+# ============================================================================
+TEST_INDEX_TITULAIRES = """
+Tests unitaires de l'index des titulaires (recherche par préfixe)
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from models.banque import Banque
+from models.index_titulaires import normaliser
+from models.montant import Montant
+
+
+class TestIndexTitulaires(unittest.TestCase):
+    """Tests pour Banque.rechercher_titulaire"""
+
+    def setUp(self):
+        """Initialisation avant chaque test"""
+        self.dossier = tempfile.mkdtemp()
+        self.banque = Banque("Test", fichier=os.path.join(self.dossier, "banque.json"))
+        for titulaire, numero in [
+            ("Éloïse Dupont", "001"), ("eloise martin", "002"),
+            ("Jean Dupond", "003"), ("Aziz Éléonore", "004"),
+        ]:
+            self.banque.ouvrir_compte(titulaire, numero, Montant.depuis_fcfa(100))
+
+    def tearDown(self):
+        """Nettoyage après chaque test"""
+        self.banque.fermer()
+        shutil.rmtree(self.dossier, ignore_errors=True)
+
+    def numeros(self, texte, **options):
+        comptes, _ = self.banque.rechercher_titulaire(texte, **options)
+        return sorted(compte.get_numero_compte() for compte in comptes)
+
+    def test_normalisation(self):
+        """Accents, casse et espaces multiples sont ignorés"""
+        self.assertEqual(normaliser("  ÉLOÏSE   Dupont "), "eloise dupont")
+
+    def test_prefixe_sans_casse_ni_accents(self):
+        """Le préfixe porte sur chaque mot, sans casse ni accents"""
+        self.assertEqual(self.numeros("ELO"), ["001", "002"])
+        self.assertEqual(self.numeros("ele"), ["004"])
+        self.assertEqual(self.numeros("dupon"), ["001", "003"])
+        self.assertEqual(self.numeros("éloise d"), ["001"])
+        self.assertEqual(self.numeros("zzz"), [])
+        self.assertEqual(self.numeros("   "), [])
+
+    def test_pagination(self):
+        """Les pages s'enchaînent sans doublon ni oubli"""
+        for i in range(25):
+            self.banque.ouvrir_compte(f"Paul Paulin {i}", f"P{i:02d}", Montant.depuis_fcfa(100))
+        vus, curseur = [], None
+        while True:
+            comptes, curseur = self.banque.rechercher_titulaire("paul", curseur, taille_page=7)
+            self.assertLessEqual(len(comptes), 7)
+            vus.extend(compte.get_numero_compte() for compte in comptes)
+            if curseur is None:
+                break
+        self.assertEqual(sorted(vus), [f"P{i:02d}" for i in range(25)])
+
+    def test_mise_a_jour(self):
+        """Modification, suppression et ouverture mettent l'index à jour"""
+        self.assertEqual(self.numeros("jean"), ["003"])
+        self.banque.modifier_compte("003", "Jeanne Moreau")
+        self.assertEqual(self.numeros("dupond"), [])
+        self.assertEqual(self.numeros("moreau"), ["003"])
+        self.banque.supprimer_compte("001")
+        self.assertEqual(self.numeros("dupon"), [])
+        self.banque.ouvrir_compte("Dupont Léa", "005", Montant.depuis_fcfa(100))
+        self.assertEqual(self.numeros("lea"), ["005"])
+
+    def test_annulation_lot(self):
+        """Un lot annulé remet l'index dans son état initial"""
+        self.numeros("jean")
+        with self.assertRaises(RuntimeError):
+            with self.banque.lot():
+                self.banque.modifier_compte("003", "Marc")
+                self.banque.supprimer_compte("002")
+                self.banque.ouvrir_compte("Jean Nouveau", "006", Montant.depuis_fcfa(100))
+                raise RuntimeError()
+        self.assertEqual(self.numeros("jean"), ["003"])
+        self.assertEqual(self.numeros("marc"), [])
+        self.assertEqual(self.numeros("martin"), ["002"])
+
+
+if __name__ == '__main__':
+    unittest.main()
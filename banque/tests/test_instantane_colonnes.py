@@ -0,0 +1,108 @@
+# ============================================================================
+# tests/test_instantane_colonnes.py
+# ============================================================================
+TEST_INSTANTANE_COLONNES = """
+Tests unitaires de l'instantané binaire en colonnes
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from array import array
+from models.banque import Banque
+from utils.instantane_colonnes import InstantaneColonnes
+
+
+class TestInstantaneColonnes(unittest.TestCase):
+    """Tests pour InstantaneColonnes et Banque.exporter_instantane"""
+
+    def setUp(self):
+        """Initialisation avant chaque test"""
+        self.dossier = tempfile.mkdtemp()
+        self.fichier = os.path.join(self.dossier, "banque.json")
+        self.instantane = os.path.join(self.dossier, "banque.colonnes")
+        self.banque = Banque("Test", fichier=self.fichier)
+        self.banque.ouvrir_compte("Jean", "C002", 50000)
+        self.banque.ouvrir_compte("Hélène", "C001", 20000)
+        self.banque.ouvrir_compte("Paul", "C010", 500_000_000)
+        self.banque.effectuer_retrait("C001", 19900)
+
+    def tearDown(self):
+        """Nettoyage après chaque test"""
+        self.banque.fermer()
+        shutil.rmtree(self.dossier, ignore_errors=True)
+
+    def test_agregats(self):
+        """Les agrégats de l'instantané sont ceux de la banque"""
+        succes, _ = self.banque.exporter_instantane(self.instantane)
+        self.assertTrue(succes)
+        stats = self.banque.statistiques()
+        with InstantaneColonnes(self.instantane) as instantane:
+            self.assertEqual(len(instantane), 3)
+            self.assertEqual(instantane.total(), stats["total_actifs"])
+            self.assertEqual(instantane.minimum(), stats["solde_min"])
+            self.assertEqual(instantane.maximum(), stats["solde_max"])
+            self.assertEqual(instantane.histogramme(), stats["histogramme"])
+
+    def test_colonnes(self):
+        """Comptes triés par numéro, colonne des soldes lisible comme array('q')"""
+        self.banque.exporter_instantane(self.instantane)
+        with InstantaneColonnes(self.instantane) as instantane:
+            self.assertEqual([instantane.numero(i) for i in range(3)], ["C001", "C002", "C010"])
+            self.assertEqual(instantane.titulaire(0), "Hélène")
+            self.assertEqual(instantane.chercher("C010"), 500_000_000)
+            self.assertIsNone(instantane.chercher("C003"))
+            with open(self.instantane, 'rb') as f:
+                f.seek(instantane.decalage_soldes)
+                soldes = array('q')
+                soldes.fromfile(f, 3)
+            self.assertEqual(list(soldes), list(instantane.soldes))
+
+    def test_import(self):
+        """Un instantané restaure les comptes dans une banque vide"""
+        self.banque.exporter_instantane(self.instantane)
+        self.assertFalse(self.banque.importer_instantane(self.instantane)[0])
+
+        autre = Banque("Autre", fichier=os.path.join(self.dossier, "autre.json"))
+        succes, _ = autre.importer_instantane(self.instantane)
+        self.assertTrue(succes)
+        self.assertEqual(autre.chercher_compte("C001").get_solde(), 100)
+        self.assertEqual(autre.statistiques()["total_actifs"], self.banque.statistiques()["total_actifs"])
+        autre.fermer()
+
+    def test_banque_vide(self):
+        """Un instantané vide est valide"""
+        vide = Banque("Vide", fichier=os.path.join(self.dossier, "vide.json"))
+        vide.exporter_instantane(self.instantane)
+        vide.fermer()
+        with InstantaneColonnes(self.instantane) as instantane:
+            self.assertEqual(instantane.total(), 0)
+            self.assertIsNone(instantane.minimum())
+
+    def test_fichier_invalide(self):
+        """Un fichier qui n'est pas un instantané est refusé"""
+        with open(self.instantane, 'wb') as f:
+            f.write(b"{}" * 40)
+        with self.assertRaises(ValueError):
+            InstantaneColonnes(self.instantane)
+
+    def test_fichier_tronque(self):
+        """Un instantané tronqué, même au milieu d'une colonne, est refusé"""
+        self.banque.exporter_instantane(self.instantane)
+        with open(self.instantane, 'rb') as f:
+            contenu = f.read()
+        for taille in (InstantaneColonnes.EN_TETE.size + 3, InstantaneColonnes.EN_TETE.size + 28, len(contenu) - 1):
+            with open(self.instantane, 'wb') as f:
+                f.write(contenu[:taille])
+            with self.assertRaises(ValueError):
+                InstantaneColonnes(self.instantane)
+        autre = Banque("Autre", fichier=os.path.join(self.dossier, "autre", "banque.json"))
+        try:
+            self.assertFalse(autre.importer_instantane(self.instantane)[0])
+            self.assertEqual(len(autre), 0)
+        finally:
+            autre.fermer()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+# ============================================================================
+# tests/test_instrumentation.py
+# ============================================================================
+TEST_INSTRUMENTATION = """
+Tests unitaires des mesures de performance (compteurs et histogrammes de latence)
+"""
+import json
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from models.banque import Banque
+from utils.file_manager import FileManager
+from utils.instrumentation import HistogrammeLatences, Instrumentation
+
+
+class TestHistogrammeLatences(unittest.TestCase):
+    """Tests pour HistogrammeLatences"""
+
+    def test_seaux_contigus(self):
+        """Chaque valeur tombe dans le seau dont elle est entre les bornes"""
+        h = HistogrammeLatences(precision=3)
+        for valeur in list(range(300)) + [2**40 + 12345, 10**9]:
+            indice = h.indice(valeur)
+            self.assertLessEqual(h.borne_inferieure(indice), valeur)
+            self.assertLessEqual(valeur, h.borne_superieure(indice))
+            self.assertEqual(h.borne_superieure(indice) + 1, h.borne_inferieure(indice + 1))
+
+    def test_percentiles_precis(self):
+        """L'erreur relative sur un percentile reste sous 2**-precision"""
+        aleatoire = random.Random(0)
+        valeurs = sorted(int(aleatoire.lognormvariate(10, 2)) for _ in range(10_000))
+        h = HistogrammeLatences(precision=7)
+        for valeur in valeurs:
+            h.enregistrer(valeur)
+        for p in (50, 90, 99, 99.9):
+            exact = valeurs[int(-(-len(valeurs) * p // 100)) - 1]
+            self.assertGreaterEqual(h.percentile(p), exact)
+            self.assertLessEqual(h.percentile(p), exact * (1 + 2**-7) + 1)
+        self.assertEqual(h.percentile(100), valeurs[-1])
+        self.assertEqual(sum(e for _, e in h.seaux()), len(valeurs))
+
+    def test_vide(self):
+        self.assertIsNone(HistogrammeLatences().percentile(50))
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Tests pour Instrumentation sur Banque et FileManager"""
+
+    def setUp(self):
+        """Initialisation avant chaque test"""
+        self.dossier = tempfile.mkdtemp()
+        self.originales = (Banque.effectuer_depot, vars(FileManager)["sauvegarder_comptes"])
+        self.instrumentation = Instrumentation()
+        self.banque = Banque("Test", fichier=os.path.join(self.dossier, "banque.json"))
+
+    def tearDown(self):
+        """Nettoyage après chaque test"""
+        self.instrumentation.desactiver()
+        self.banque.fermer()
+        shutil.rmtree(self.dossier, ignore_errors=True)
+
+    def test_inactive_ne_mesure_rien(self):
+        """Inactive, les méthodes sont les originales et rien n'est compté"""
+        self.banque.ouvrir_compte("Jean", "C001", 10000)
+        self.assertIs(Banque.effectuer_depot, self.originales[0])
+        self.assertEqual(self.instrumentation.instantane()["operations"], {})
+
+    def test_compteurs_et_echecs(self):
+        """Appels, refus et opérations imbriquées sont comptés"""
+        self.instrumentation.activer()
+        self.instrumentation.activer()  # Sans effet : pas de double chronométrage
+        self.banque.ouvrir_compte("Jean", "C001", 10000)
+        for _ in range(5):
+            self.banque.effectuer_depot("C001", 100)
+        self.banque.effectuer_depot("C999", 100)
+        operations = self.instrumentation.instantane()["operations"]
+        self.assertEqual(operations["Banque.effectuer_depot"]["appels"], 6)
+        self.assertEqual(operations["Banque.effectuer_depot"]["echecs"], 1)
+        self.assertGreaterEqual(operations["Banque.chercher_compte"]["appels"], 6)
+        self.assertIn("Validators.valider_montant", operations)
+        depot = operations["Banque.effectuer_depot"]
+        self.assertLessEqual(depot["min_ns"], depot["p50_ns"])
+        self.assertLessEqual(depot["p50_ns"], depot["p99_ns"])
+        self.assertLessEqual(depot["p99_ns"], depot["max_ns"])
+
+    def test_exceptions_et_methodes_statiques(self):
+        """Les méthodes statiques de FileManager sont mesurées, échecs et exceptions compris"""
+        self.instrumentation.activer()
+        self.assertTrue(FileManager.sauvegarder_comptes(os.path.join(self.dossier, "copie.json"), []))
+        # Le « dossier » parent est un fichier
+        self.assertFalse(FileManager.sauvegarder_comptes(os.path.join(self.dossier, "copie.json", "x.json"), []))
+        with self.assertRaises(OSError):
+            FileManager.synchroniser_dossier(os.path.join(self.dossier, "absent"))
+        mesures = self.instrumentation.instantane()["operations"]
+        self.assertEqual(mesures["FileManager.synchroniser_dossier"]["echecs"], 1)
+        mesures = mesures["FileManager.sauvegarder_comptes"]
+        mesures = self.instrumentation.instantane()["operations"]["FileManager.sauvegarder_comptes"]
+        self.assertEqual((mesures["appels"], mesures["echecs"]), (2, 1))
+
+    def test_desactiver_et_reinitialiser(self):
+        """Désactiver remet les originales ; réinitialiser efface les compteurs"""
+        self.instrumentation.activer()
+        self.banque.ouvrir_compte("Jean", "C001", 10000)
+        self.instrumentation.reinitialiser()
+        self.assertEqual(self.instrumentation.instantane()["operations"], {})
+        self.banque.effectuer_depot("C001", 100)
+        self.assertEqual(self.instrumentation.instantane()["operations"]["Banque.effectuer_depot"]["appels"], 1)
+        self.instrumentation.desactiver()
+        self.assertIs(Banque.effectuer_depot, self.originales[0])
+        self.assertIs(vars(FileManager)["sauvegarder_comptes"], self.originales[1])
+        self.banque.effectuer_depot("C001", 100)
+        self.assertEqual(self.instrumentation.instantane()["operations"]["Banque.effectuer_depot"]["appels"], 1)
+
+    def test_export_json(self):
+        """L'instantané s'exporte en JSON"""
+        self.instrumentation.activer()
+        self.banque.ouvrir_compte("Jean", "C001", 10000)
+        fichier = os.path.join(self.dossier, "mesures.json")
+        self.instrumentation.exporter(fichier)
+        with open(fichier, 'r', encoding='utf-8') as f:
+            instantane = json.load(f)
+        self.assertTrue(instantane["active"])
+        self.assertEqual(instantane["operations"]["Banque.ouvrir_compte"]["appels"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+# ============================================================================
+# tests/test_liste_comptes.py
+# ============================================================================
+TEST_LISTE_COMPTES = """
+Tests unitaires de la liste paginée des comptes
+"""
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from models.banque import Banque
+from models.montant import Montant
+
+
+class TestListeComptes(unittest.TestCase):
+    """Tests pour Banque.page_comptes, parcourir_comptes et lister_comptes"""
+
+    def setUp(self):
+        """Initialisation avant chaque test"""
+        self.dossier = tempfile.mkdtemp()
+        self.banque = Banque("Test", fichier=os.path.join(self.dossier, "banque.json"))
+        # Soldes volontairement en double : le numéro départage
+        for i, (titulaire, solde) in enumerate([
+            ("Zoé", 500), ("aline", 100), ("Émile", 300), ("Bruno", 100), ("carla", 900), ("Denis", 300),
+        ]):
+            self.banque.ouvrir_compte(titulaire, f"C{5 - i}", Montant.depuis_fcfa(solde))
+
+    def tearDown(self):
+        """Nettoyage après chaque test"""
+        self.banque.fermer()
+        shutil.rmtree(self.dossier, ignore_errors=True)
+
+    def numeros(self, **options):
+        return [
+            compte.get_numero_compte()
+            for page in self.banque.parcourir_comptes(taille_page=4, **options)
+            for compte in page
+        ]
+
+    def test_tris(self):
+        """Tri par numéro, titulaire (sans casse ni accents) et solde"""
+        self.assertEqual(self.numeros(), ["C0", "C1", "C2", "C3", "C4", "C5"])
+        self.assertEqual(self.numeros(tri="titulaire"), ["C4", "C2", "C1", "C0", "C3", "C5"])
+        self.assertEqual(self.numeros(tri="solde"), ["C2", "C4", "C0", "C3", "C5", "C1"])
+        self.assertEqual(self.numeros(tri="solde", decroissant=True), ["C1", "C5", "C3", "C0", "C4", "C2"])
+        with self.assertRaises(ValueError):
+            self.banque.page_comptes(tri="inconnu")
+
+    def test_pagination(self):
+        """Le curseur enchaîne les pages ; None après la dernière"""
+        page, curseur = self.banque.page_comptes(taille_page=4)
+        self.assertEqual(len(page), 4)
+        page, curseur = self.banque.page_comptes(curseur=curseur, taille_page=4)
+        self.assertEqual([c.get_numero_compte() for c in page], ["C4", "C5"])
+        self.assertIsNone(curseur)
+        _, curseur = self.banque.page_comptes(taille_page=6)
+        self.assertIsNone(curseur)
+        for taille in (0, -1):
+            with self.assertRaises(ValueError):
+                self.banque.page_comptes(taille_page=taille)
+
+    def test_filtre_solde(self):
+        """Seuls les comptes dans l'intervalle de soldes sont listés"""
+        self.assertEqual(
+            self.numeros(tri="solde", solde_min=Montant.depuis_fcfa(300), solde_max=Montant.depuis_fcfa(500)),
+            ["C0", "C3", "C5"],
+        )
+
+    def test_affichage_par_page(self):
+        """lister_comptes n'affiche que la page demandée"""
+        sortie = io.StringIO()
+        with contextlib.redirect_stdout(sortie):
+            curseur = self.banque.lister_comptes(taille_page=2)
+        self.assertEqual(sortie.getvalue().count("Numéro :"), 2)
+        self.assertIsNotNone(curseur)
+
+
+if __name__ == '__main__':
+    unittest.main()
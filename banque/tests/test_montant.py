@@ -0,0 +1,101 @@
+# ============================================================================
+# tests/test_montant.py
+# ============================================================================
+TEST_MONTANT = """
+Tests unitaires pour les montants en centimes et la migration des anciens fichiers
+"""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from decimal import Decimal
+from models.banque import Banque
+from models.montant import Montant
+from utils.migration import migrer
+from utils.validators import Validators
+
+
+class TestMontant(unittest.TestCase):
+    """Tests pour la classe Montant"""
+
+    def test_depuis_fcfa(self):
+        """Test des conversions exactes vers les centimes"""
+        self.assertEqual(Montant.depuis_fcfa(100), 10000)
+        self.assertEqual(Montant.depuis_fcfa("12,5"), 1250)
+        self.assertEqual(Montant.depuis_fcfa(0.1), 10)
+        self.assertEqual(Montant.depuis_fcfa(Decimal("19.99")), 1999)
+
+    def test_depuis_fcfa_invalide(self):
+        """Test des saisies refusées"""
+        for valeur in ["abc", "1.234", True, "nan"]:
+            with self.assertRaises(ValueError):
+                Montant.depuis_fcfa(valeur)
+        self.assertEqual(Montant.depuis_fcfa(100.30000000000001, arrondir=True), 10030)
+
+    def test_formater(self):
+        """Test de l'affichage"""
+        self.assertEqual(Montant.formater(123456), "1234.56")
+        self.assertEqual(Montant.formater(-5), "-0.05")
+
+    def test_validators(self):
+        """Test des validateurs sur les centimes"""
+        self.assertTrue(Validators.valider_montant(1))
+        self.assertFalse(Validators.valider_montant(1.5))
+        self.assertFalse(Validators.valider_montant(0))
+        self.assertTrue(Validators.valider_solde(Montant.depuis_fcfa(100)))
+        self.assertFalse(Validators.valider_solde(Montant.depuis_fcfa(99)))
+
+    def test_pas_de_derive(self):
+        """Test : dix mille dépôts de 0.10 Fcfa tombent juste"""
+        dossier = tempfile.mkdtemp()
+        try:
+            banque = Banque("Test", fichier=os.path.join(dossier, "banque.json"))
+            banque.ouvrir_compte("Jean", "C001", Montant.depuis_fcfa(100))
+            compte = banque.chercher_compte("C001")
+            for _ in range(10_000):
+                compte.deposer(Montant.depuis_fcfa("0.10"))
+            self.assertEqual(compte.get_solde(), Montant.depuis_fcfa(1100))
+            banque.fermer()
+        finally:
+            shutil.rmtree(dossier, ignore_errors=True)
+
+
+class TestMigration(unittest.TestCase):
+    """Tests de lecture et de migration de l'ancien format (Fcfa float)"""
+
+    def setUp(self):
+        """Écrit un fichier à l'ancien format"""
+        self.dossier = tempfile.mkdtemp()
+        self.fichier = os.path.join(self.dossier, "banque.json")
+        with open(self.fichier, 'w', encoding='utf-8') as f:
+            json.dump({"C001": {"titulaire": "Jean", "numero_compte": "C001",
+                                "solde": 100.30000000000001}}, f)
+        os.makedirs(os.path.join(self.dossier, "historique"))
+        with open(os.path.join(self.dossier, "historique", "C001.jsonl"), 'w', encoding='utf-8') as f:
+            f.write(json.dumps({"type": "Dépôt", "montant": 0.3, "date": "01/01/2026 00:00:00",
+                                "horodatage": 0, "solde_apres_transaction": 100.3}) + "\n")
+
+    def tearDown(self):
+        """Nettoyage après chaque test"""
+        shutil.rmtree(self.dossier, ignore_errors=True)
+
+    def test_lecture_ancien_format(self):
+        """Test de la lecture transparente de l'ancien format"""
+        banque = Banque("Test", fichier=self.fichier)
+        self.assertEqual(banque.chercher_compte("C001").get_solde(), 10030)
+        transaction = next(banque.historique("C001"))[0]
+        self.assertEqual(transaction.montant_centimes, 30)
+        self.assertEqual(transaction.solde_centimes, 10030)
+
+    def test_migration(self):
+        """Test de la réécriture au nouveau format"""
+        self.assertTrue(migrer(self.fichier))
+        with open(self.fichier, encoding='utf-8') as f:
+            self.assertEqual(json.load(f)["C001"]["solde_centimes"], 10030)
+        with open(os.path.join(self.dossier, "historique", "C001.jsonl"), encoding='utf-8') as f:
+            self.assertNotIn('"montant"', f.read())
+
+
+if __name__ == '__main__':
+    unittest.main()
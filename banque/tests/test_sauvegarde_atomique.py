@@ -0,0 +1,147 @@
+# ============================================================================
+# tests/test_sauvegarde_atomique.py
+# ============================================================================
+TEST_SAUVEGARDE_ATOMIQUE = """
+Injection de fautes : le processus est tué au milieu d'une sauvegarde
+"""
+import json
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+import threading
+import unittest
+from unittest import mock
+from models.banque import Banque
+from utils.file_manager import FileManager
+from utils.journal import Journal
+
+DOSSIER_BANQUE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Sauvegarde d'une banque de 2000 comptes ; le processus se tue lui-même
+# juste avant le fsync du fichier temporaire (écrit mais pas renommé)
+TUER_AVANT_RENOMMAGE = """
+import os, signal, sys
+from models.compte_bancaire import CompteBancaire
+from utils.file_manager import FileManager
+comptes = [CompteBancaire(f"Client {i}", f"C{i:05d}", 999) for i in range(2000)]
+os.fsync = lambda descripteur: os.kill(os.getpid(), signal.SIGKILL)
+FileManager.sauvegarder_comptes(sys.argv[1], comptes)
+"""
+
+# Sauvegardes en boucle, jusqu'à ce que le test tue le processus ;
+# "pret" n'est annoncé qu'une fois la première sauvegarde terminée
+SAUVEGARDER_EN_BOUCLE = """
+import sys
+from models.compte_bancaire import CompteBancaire
+from utils.file_manager import FileManager
+comptes = [CompteBancaire(f"Client {i}", f"C{i:05d}", 100) for i in range(5000)]
+FileManager.sauvegarder_comptes(sys.argv[1], comptes)
+print("pret", flush=True)
+while True:
+    for compte in comptes:
+        compte.deposer(1)
+    FileManager.sauvegarder_comptes(sys.argv[1], comptes)
+"""
+
+
+@unittest.skipUnless(hasattr(signal, "SIGKILL"), "SIGKILL indisponible")
+class TestSauvegardeAtomique(unittest.TestCase):
+    """Un crash pendant la sauvegarde ne tronque jamais le fichier de la banque"""
+
+    def setUp(self):
+        """Initialisation avant chaque test"""
+        self.dossier = tempfile.mkdtemp()
+        self.fichier = os.path.join(self.dossier, "banque.json")
+
+    def tearDown(self):
+        """Nettoyage après chaque test"""
+        shutil.rmtree(self.dossier, ignore_errors=True)
+
+    def lancer(self, script):
+        return subprocess.Popen(
+            [sys.executable, "-c", script, self.fichier],
+            cwd=DOSSIER_BANQUE, stdout=subprocess.PIPE, text=True,
+        )
+
+    def test_crash_avant_renommage(self):
+        """L'ancienne version reste intacte si le processus meurt avant le renommage"""
+        banque = Banque("Test", fichier=self.fichier)
+        banque.ouvrir_compte("Jean", "C001", 50000)
+        banque.fermer()
+
+        processus = self.lancer(TUER_AVANT_RENOMMAGE)
+        processus.communicate(timeout=60)
+        self.assertEqual(processus.returncode, -signal.SIGKILL)
+        self.assertTrue(os.path.exists(self.fichier + ".tmp"))
+
+        rechargee = Banque("Test", fichier=self.fichier)
+        self.assertEqual(len(rechargee), 1)
+        self.assertEqual(rechargee.chercher_compte("C001").get_solde(), 50000)
+        rechargee.fermer()
+
+    def test_crash_a_un_instant_quelconque(self):
+        """Tué à des instants variés, le fichier est toujours complet et lisible"""
+        verifies = 0
+        for essai in range(5):
+            processus = self.lancer(SAUVEGARDER_EN_BOUCLE)
+            processus.stdout.readline()
+            time.sleep(0.05 + essai * 0.07)
+            processus.kill()
+            processus.communicate(timeout=60)
+            if not os.path.exists(self.fichier):
+                continue
+            with open(self.fichier, encoding='utf-8') as f:
+                data = json.load(f)
+            self.assertEqual(len(data), 5000)
+            # Une seule et même sauvegarde : tous les soldes sont identiques
+            self.assertEqual(len({infos["solde_centimes"] for infos in data.values()}), 1)
+            verifies += 1
+        # Sans aucun fichier relu, le test ne vérifierait rien
+        self.assertGreater(verifies, 0)
+
+    def test_echec_sans_fichier_temporaire(self):
+        """Une erreur pendant l'écriture supprime le fichier temporaire"""
+        with self.assertRaises(ValueError):
+            with FileManager.ecriture_atomique(self.fichier) as f:
+                f.write("{")
+                raise ValueError("échec simulé")
+        self.assertFalse(os.path.exists(self.fichier))
+        self.assertFalse(os.path.exists(self.fichier + ".tmp"))
+
+
+class TestGroupeCommit(unittest.TestCase):
+    """Regroupement des fsync du journal"""
+
+    def test_un_fsync_pour_une_rafale(self):
+        """Des écritures concurrentes partagent leurs fsync"""
+        dossier = tempfile.mkdtemp()
+        journal = Journal(os.path.join(dossier, "banque.journal"), durable=True, fenetre=0.01)
+        fsync = os.fsync
+        appels = []
+
+        def compter(descripteur):
+            appels.append(descripteur)
+            fsync(descripteur)
+
+        def ecrire(i):
+            journal.ajouter({"op": "maj", "comptes": [], "i": i})
+            journal.synchroniser()
+
+        with mock.patch("utils.journal.os.fsync", compter):
+            threads = [threading.Thread(target=ecrire, args=(i,)) for i in range(16)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        journal.fermer()
+        shutil.rmtree(dossier, ignore_errors=True)
+        self.assertEqual(journal.taille, 16)
+        self.assertLess(len(appels), 16)
+
+
+if __name__ == '__main__':
+    unittest.main()
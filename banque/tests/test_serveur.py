@@ -0,0 +1,109 @@
+# ============================================================================
+# tests/test_serveur.py
+# ============================================================================
+TEST_SERVEUR = """
+Tests du serveur asyncio de la banque
+"""
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from models.banque import Banque
+from ui.serveur import ServeurBanque
+
+
+class TestServeur(unittest.IsolatedAsyncioTestCase):
+    """Tests pour ServeurBanque"""
+
+    async def asyncSetUp(self):
+        """Démarre un serveur sur un port libre"""
+        self.dossier = tempfile.mkdtemp()
+        self.banque = Banque("Test Banque", fichier=os.path.join(self.dossier, "banque.json"),
+                             asynchrone=True)
+        self.serveur = await ServeurBanque(self.banque).demarrer("127.0.0.1", 0)
+        self.port = self.serveur.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        """Arrête le serveur et nettoie"""
+        self.serveur.close()
+        await self.serveur.wait_closed()
+        self.banque.fermer()
+        shutil.rmtree(self.dossier, ignore_errors=True)
+
+    async def envoyer(self, connexion, requete):
+        lecteur, ecrivain = connexion
+        ecrivain.write(json.dumps(requete).encode() + b"\n")
+        await ecrivain.drain()
+        return json.loads(await lecteur.readline())
+
+    async def test_operations(self):
+        """Test des opérations de base via le serveur"""
+        connexion = await asyncio.open_connection("127.0.0.1", self.port)
+        reponse = await self.envoyer(connexion, {"id": 1, "op": "ouvrir", "titulaire": "Jean",
+                                                 "numero_compte": "C001", "solde": 50000})
+        self.assertEqual(reponse["id"], 1)
+        self.assertTrue(reponse["succes"])
+        await self.envoyer(connexion, {"op": "ouvrir", "titulaire": "Paul",
+                                       "numero_compte": "C002", "solde": 50000})
+        reponse = await self.envoyer(connexion, {"op": "transfert", "source": "C001",
+                                                 "destination": "C002", "montant": 20000})
+        self.assertTrue(reponse["succes"])
+
+        reponse = await self.envoyer(connexion, {"op": "statistiques"})
+        self.assertEqual(reponse["resultat"]["total_actifs"], 100000)
+
+        self.banque.compacter()  # attend le thread d'écriture
+        reponse = await self.envoyer(connexion, {"op": "historique", "numero_compte": "C002"})
+        self.assertEqual(reponse["resultat"][0]["solde_centimes"], 70000)
+        connexion[1].close()
+
+    async def test_requetes_invalides(self):
+        """Test des réponses d'erreur"""
+        connexion = await asyncio.open_connection("127.0.0.1", self.port)
+        self.assertFalse((await self.envoyer(connexion, {"op": "inconnue"}))["succes"])
+        reponse = await self.envoyer(connexion, {"op": "depot"})
+        self.assertIn("numero_compte", reponse["message"])
+        connexion[1].write(b"pas du json\n")
+        self.assertFalse(json.loads(await connexion[0].readline())["succes"])
+        connexion[1].close()
+
+    async def test_champs_mal_types(self):
+        """Un champ du mauvais type reçoit une réponse d'erreur, la connexion reste ouverte"""
+        self.banque.ouvrir_compte("Jean", "C001", 10000)
+        connexion = await asyncio.open_connection("127.0.0.1", self.port)
+        for requete, champ in (
+            ({"op": "compte", "numero_compte": [1]}, "numero_compte"),
+            ({"op": "transfert", "source": {"a": 1}, "destination": "C001", "montant": 1}, "source"),
+            ({"op": "ouvrir", "titulaire": 12, "numero_compte": "C002", "solde": 10000}, "titulaire"),
+            ({"op": "depot", "numero_compte": "C001", "montant": "100"}, "montant"),
+            ({"op": "depot", "numero_compte": "C001", "montant": True}, "montant"),
+            ({"op": "depot", "numero_compte": "C001", "montant": 1.5}, "montant"),
+            ({"op": "historique", "numero_compte": "C001", "taille_page": 0}, "taille_page"),
+            ({"op": "historique", "numero_compte": "C001", "taille_page": "10"}, "taille_page"),
+        ):
+            reponse = await self.envoyer(connexion, {"id": 7, **requete})
+            self.assertEqual(reponse["id"], 7)
+            self.assertFalse(reponse["succes"])
+            self.assertIn(champ, reponse["message"])
+        reponse = await self.envoyer(connexion, {"op": "depot", "numero_compte": "C001", "montant": 100})
+        self.assertTrue(reponse["succes"])
+        connexion[1].close()
+
+    async def test_clients_concurrents(self):
+        """Test de dépôts envoyés par plusieurs clients en parallèle"""
+        self.banque.ouvrir_compte("Jean", "C001", 10000)
+
+        async def client():
+            connexion = await asyncio.open_connection("127.0.0.1", self.port)
+            for _ in range(50):
+                await self.envoyer(connexion, {"op": "depot", "numero_compte": "C001", "montant": 100})
+            connexion[1].close()
+
+        await asyncio.gather(*(client() for _ in range(10)))
+        self.assertEqual(self.banque.chercher_compte("C001").get_solde(), 60000)
+
+
+if __name__ == '__main__':
+    unittest.main()
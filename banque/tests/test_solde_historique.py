@@ -0,0 +1,170 @@
+# ============================================================================
+# tests/test_solde_historique.py
+# ============================================================================
+TEST_SOLDE_HISTORIQUE = """
+Tests unitaires du solde à une date (points de contrôle de l'historique)
+"""
+import datetime
+import os
+import random
+import shutil
+import tempfile
+import time
+import unittest
+from unittest import mock
+from models.banque import Banque
+from models.transaction import Transaction
+from utils.historique import HistoriqueTransactions
+
+
+def transactions_aleatoires(nombre, graine=0):
+    """ Transactions chronologiques avec des soldes cohérents, à partir de 1 000 000 centimes """
+    aleatoire = random.Random(graine)
+    solde, horodatage, transactions = 1_000_000, 1_700_000_000.0, []
+    for _ in range(nombre):
+        horodatage += aleatoire.choice((0, 0.5, 30, 3600))
+        code = aleatoire.choice((Transaction.DEPOT, Transaction.RETRAIT, Transaction.INTERETS, Transaction.FRAIS))
+        montant = aleatoire.randint(1, 5000)
+        solde += montant if code in Transaction.CREDITS else -montant
+        transactions.append(Transaction(code, montant, horodatage, solde))
+    return transactions
+
+
+def solde_brut(transactions, instant):
+    """ Référence : relit tout l'historique """
+    solde = transactions[0].solde_avant()
+    for transaction in transactions:
+        if transaction.horodatage > instant:
+            break
+        solde = transaction.solde_centimes
+    return solde
+
+
+class TestSoldeHistorique(unittest.TestCase):
+    """Tests pour HistoriqueTransactions.solde_au"""
+
+    def setUp(self):
+        """Initialisation avant chaque test"""
+        self.dossier = tempfile.mkdtemp()
+        # Petit intervalle : beaucoup de points de contrôle
+        self.historique = HistoriqueTransactions(self.dossier, intervalle=256)
+        self.transactions = transactions_aleatoires(2000)
+
+    def tearDown(self):
+        """Nettoyage après chaque test"""
+        shutil.rmtree(self.dossier, ignore_errors=True)
+
+    def verifier(self):
+        instants = {t.horodatage for t in self.transactions[::7]}
+        instants |= {i - 0.25 for i in instants} | {0.0, self.transactions[-1].horodatage + 1}
+        for instant in sorted(instants):
+            date = datetime.datetime.fromtimestamp(instant)
+            self.assertEqual(self.historique.solde_au("C1", date), solde_brut(self.transactions, instant))
+
+    def test_comme_relecture_complete(self):
+        """Le solde lu depuis un point de contrôle égale celui de la relecture complète"""
+        # Par lots de tailles variées, comme les écritures groupées de la banque
+        debut = 0
+        for taille in (1, 5, 300, 1, 94, 1599):
+            self.historique.ajouter_lot([("C1", t) for t in self.transactions[debut:debut + taille]])
+            debut += taille
+        self.assertTrue(os.path.getsize(os.path.join(self.dossier, "C1.points")) > 0)
+        self.verifier()
+
+    def test_historique_sans_points(self):
+        """Un historique écrit avant les points de contrôle est indexé à la première requête"""
+        self.historique.ajouter_lot([("C1", t) for t in self.transactions])
+        points = os.path.join(self.dossier, "C1.points")
+        with open(points, 'rb') as f:
+            attendus = f.read()
+        os.remove(points)
+        self.verifier()
+        with open(points, 'rb') as f:
+            self.assertEqual(f.read(), attendus)
+
+    def test_ajout_apres_ligne_coupee(self):
+        """Un ajout après un crash en cours d'écriture coupe d'abord la ligne incomplète"""
+        self.historique.ajouter_lot([("C1", t) for t in self.transactions[:1000]])
+        with open(os.path.join(self.dossier, "C1.jsonl"), 'ab') as f:
+            f.write(b'{"type":"DEPOT","mont')
+        with open(os.path.join(self.dossier, "C1.points"), 'ab') as f:
+            f.write(b'\x00' * 5)
+        self.historique.ajouter_lot([("C1", t) for t in self.transactions[1000:]])
+        self.assertEqual(len(list(self.historique.parcourir("C1"))), len(self.transactions))
+        self.verifier()
+
+    def test_synchronisation_disque(self):
+        """Durable : l'historique et ses points de contrôle sont synchronisés sur disque"""
+        synchronises = []
+        fsync = lambda descripteur: synchronises.append(os.fstat(descripteur).st_ino)
+        for durable in (True, False):
+            historique = HistoriqueTransactions(os.path.join(self.dossier, str(durable)), intervalle=256, durable=durable)
+            with mock.patch("utils.historique.os.fsync", side_effect=fsync):
+                historique.ajouter_lot([("C1", t) for t in self.transactions[:100]])
+        fichiers = {os.stat(os.path.join(self.dossier, "True", "C1" + extension)).st_ino
+                    for extension in (".jsonl", ".points")}
+        self.assertEqual(set(synchronises), fichiers)
+
+    def test_compte_sans_historique(self):
+        """Sans transaction, pas de solde historique"""
+        self.assertIsNone(self.historique.solde_au("C2", datetime.datetime.now()))
+
+    def test_suppression(self):
+        """Supprimer l'historique efface aussi les points de contrôle"""
+        self.historique.ajouter_lot([("C1", t) for t in self.transactions])
+        self.historique.supprimer("C1")
+        self.assertEqual(os.listdir(self.dossier), [])
+
+
+class TestSoldeAuBanque(unittest.TestCase):
+    """Tests pour Banque.solde_au, avec les deux moteurs"""
+
+    def setUp(self):
+        """Initialisation avant chaque test"""
+        self.dossier = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Nettoyage après chaque test"""
+        shutil.rmtree(self.dossier, ignore_errors=True)
+
+    def verifier(self, moteur):
+        banque = Banque("Test", fichier=os.path.join(self.dossier, moteur, "banque.json"), moteur=moteur)
+        try:
+            avant = datetime.datetime.now() - datetime.timedelta(days=1)
+            banque.ouvrir_compte("Jean", "C001", 10000)
+            banque.ouvrir_compte("Paul", "C002", 20000)
+            ouvert = datetime.datetime.now()
+            time.sleep(0.01)  # Le dépôt suivant est daté après ouvert
+            # Avant l'ouverture : 0 ; entre l'ouverture et le premier dépôt : le solde initial
+            self.assertEqual(banque.solde_au("C001", avant), 0)
+            self.assertEqual(banque.solde_au("C001", ouvert), 10000)
+            banque.effectuer_depot("C001", 5000)
+            banque.transferer("C001", "C002", 3000)
+            maintenant = datetime.datetime.now() + datetime.timedelta(seconds=1)
+            self.assertEqual(banque.solde_au("C001", avant), 0)
+            self.assertEqual(banque.solde_au("C001", ouvert), 10000)
+            self.assertEqual(banque.solde_au("C001", maintenant), 12000)
+            self.assertEqual(banque.solde_au("C002", avant), 0)
+            self.assertEqual(banque.solde_au("C002", maintenant), 23000)
+            self.assertEqual([t.type for page in banque.historique("C001") for t in page], ["Dépôt", "Retrait"])
+            self.assertIsNone(banque.solde_au("C999", maintenant))
+
+            # Compte importé sans historique : seul le solde actuel est connu
+            csv = os.path.join(self.dossier, moteur, "comptes.csv")
+            with open(csv, 'w', encoding='utf-8') as f:
+                f.write("C003,Awa,300\n")
+            self.assertTrue(banque.importer_csv(csv)[0])
+            self.assertIsNone(banque.solde_au("C003", avant))
+            self.assertEqual(banque.solde_au("C003", maintenant), 30000)
+        finally:
+            banque.fermer()
+
+    def test_json(self):
+        self.verifier("json")
+
+    def test_sqlite(self):
+        self.verifier("sqlite")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+# ============================================================================
+# tests/test_stockage_shards.py
+# ============================================================================
+TEST_STOCKAGE_SHARDS = """
+Tests unitaires du chargement paresseux par shards
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from models.banque import Banque
+from utils.stockage_shards import ComptesShardes, StockageShards
+from config.constants import NOMBRE_SHARDS
+
+
+class TestStockageShards(unittest.TestCase):
+    """Tests pour Banque(paresseux=True)"""
+
+    def setUp(self):
+        """Initialisation avant chaque test"""
+        self.dossier = tempfile.mkdtemp()
+        self.fichier = os.path.join(self.dossier, "banque.json")
+
+    def tearDown(self):
+        """Nettoyage après chaque test"""
+        shutil.rmtree(self.dossier, ignore_errors=True)
+
+    def remplir(self, nombre):
+        banque = Banque("Test", fichier=self.fichier, paresseux=True)
+        for i in range(nombre):
+            banque.ouvrir_compte(f"Titulaire {i}", f"C{i:04d}", 10000 + i * 100)
+        banque.fermer()
+
+    def test_persistance(self):
+        """Les comptes et les opérations survivent à un redémarrage"""
+        self.remplir(50)
+        banque = Banque("Test", fichier=self.fichier, paresseux=True)
+        self.assertEqual(len(banque), 50)
+        banque.transferer("C0001", "C0002", 5000)
+        banque.supprimer_compte("C0003")
+        banque.fermer()
+
+        banque = Banque("Test", fichier=self.fichier, paresseux=True)
+        self.assertEqual(len(banque), 49)
+        self.assertEqual(banque.chercher_compte("C0001").get_solde(), 5100)
+        self.assertEqual(banque.chercher_compte("C0002").get_solde(), 15200)
+        self.assertIsNone(banque.chercher_compte("C0003"))
+        banque.fermer()
+
+    def test_demarrage_sans_lecture(self):
+        """Après une fermeture propre, le démarrage ne lit aucun shard"""
+        self.remplir(200)
+        stockage = StockageShards(self.fichier)
+        comptes = stockage.charger()
+        self.assertEqual(len(comptes), 200)
+        self.assertEqual(comptes.shards_charges(), [])
+        self.assertEqual(stockage.statistiques_sauvegardees()["nombre"], 200)
+        stockage.fermer(comptes, stockage.statistiques_sauvegardees())
+
+    def test_statistiques_rechargees(self):
+        """Les statistiques rechargées restent exactes après des opérations"""
+        self.remplir(200)
+        banque = Banque("Test", fichier=self.fichier, paresseux=True)
+        # Le plus petit et le plus grand solde disparaissent
+        banque.effectuer_retrait("C0000", 9900)
+        banque.supprimer_compte("C0199")
+        self.assertEqual(banque.statistiques()["solde_min"], 100)
+        self.assertEqual(banque.statistiques()["solde_max"], 10000 + 198 * 100)
+        self.assertEqual(banque.verifier_statistiques(), [])
+        banque.fermer()
+
+    def test_purge_par_shard(self):
+        """La purge de chaque tas de statistiques lit chaque shard au plus une fois"""
+        self.remplir(200)
+        banque = Banque("Test", fichier=self.fichier, paresseux=True)
+        banque.statistiques()
+        # Entrées mortes : les tas dépassent 2 * nombre + 64
+        for _ in range(3):
+            for i in range(200):
+                banque.effectuer_depot(f"C{i:04d}", 100)
+        lectures = []
+        lire = ComptesShardes.lire
+        ComptesShardes.lire = lambda comptes, indice: lectures.append(indice) or lire(comptes, indice)
+        try:
+            self.assertEqual(banque.statistiques()["solde_min"], 10300)
+        finally:
+            ComptesShardes.lire = lire
+        # Une passe par tas (minimum, maximum), plus la lecture du sommet
+        self.assertLessEqual(len(lectures), 2 * (NOMBRE_SHARDS + 1))
+        self.assertEqual(banque.verifier_statistiques(), [])
+        banque.fermer()
+
+    def test_eviction_lru(self):
+        """Au plus taille_cache shards restent en mémoire"""
+        self.remplir(40)
+        banque = Banque("Test", fichier=self.fichier, paresseux=True)
+        for i in range(40):
+            self.assertIsNotNone(banque.chercher_compte(f"C{i:04d}"))
+        banque.fermer()
+
+        stockage = StockageShards(self.fichier, taille_cache=2)
+        comptes = stockage.charger()
+        vus = sum(1 for _ in comptes.values())
+        self.assertEqual(vus, 40)
+        self.assertLessEqual(len(comptes.shards_charges()), 2)
+        stockage.fermer(comptes, None)
+
+    def test_compte_utilise_non_duplique(self):
+        """Un compte encore référencé est retrouvé tel quel après éviction"""
+        self.remplir(40)
+        stockage = StockageShards(self.fichier, taille_cache=1)
+        comptes = stockage.charger()
+        compte = comptes.get("C0005")
+        for i in range(40):
+            comptes.get(f"C{i:04d}")
+        self.assertIs(comptes.get("C0005"), compte)
+        stockage.fermer(comptes, None)
+
+    def test_import_fichier_existant(self):
+        """Un fichier de banque existant est réparti dans les shards"""
+        banque = Banque("Test", fichier=self.fichier)
+        banque.ouvrir_compte("Jean", "C001", 50000)
+        banque.fermer()
+        banque = Banque("Test", fichier=self.fichier, paresseux=True)
+        self.assertEqual(banque.chercher_compte("C001").get_solde(), 50000)
+        banque.fermer()
+
+    def test_asynchrone_incompatible(self):
+        """Le chargement paresseux refuse le thread d'écriture"""
+        with self.assertRaises(ValueError):
+            Banque("Test", fichier=self.fichier, asynchrone=True, paresseux=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+# ============================================================================
+# tests/test_stockage_sqlite.py
+# ============================================================================
+TEST_STOCKAGE_SQLITE = """
+Tests unitaires du moteur de stockage SQLite
+"""
+import datetime
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from models.banque import Banque
+
+
+class TestStockageSqlite(unittest.TestCase):
+    """Tests pour Banque(moteur="sqlite")"""
+
+    def setUp(self):
+        """Initialisation avant chaque test"""
+        self.dossier = tempfile.mkdtemp()
+        self.fichier = os.path.join(self.dossier, "banque.json")
+        self.base = os.path.join(self.dossier, "banque.sqlite3")
+        self.banque = Banque("Test", fichier=self.fichier, moteur="sqlite")
+
+    def tearDown(self):
+        """Nettoyage après chaque test"""
+        self.banque.fermer()
+        shutil.rmtree(self.dossier, ignore_errors=True)
+
+    def recharger(self):
+        self.banque.fermer()
+        self.banque = Banque("Test", fichier=self.fichier, moteur="sqlite")
+        return self.banque
+
+    def test_persistance(self):
+        """Les comptes et les opérations survivent à un redémarrage"""
+        self.banque.ouvrir_compte("Jean", "C001", 50000)
+        self.banque.ouvrir_compte("Paul", "C002", 20000)
+        self.banque.transferer("C001", "C002", 10000)
+        self.banque.ouvrir_compte("Marie", "C003", 30000)
+        self.banque.supprimer_compte("C003")
+
+        banque = self.recharger()
+        self.assertEqual(len(banque), 2)
+        self.assertEqual(banque.chercher_compte("C001").get_solde(), 40000)
+        self.assertEqual(banque.chercher_compte("C002").get_solde(), 30000)
+        self.assertFalse(os.path.exists(self.fichier))
+
+    def test_ecriture_par_ligne(self):
+        """Un dépôt ne modifie que la ligne du compte et ajoute une transaction (après l'ouverture)"""
+        self.banque.ouvrir_compte("Jean", "C001", 50000)
+        self.banque.effectuer_depot("C001", 10000)
+        with sqlite3.connect(self.base) as connexion:
+            self.assertEqual(connexion.execute("SELECT solde_centimes FROM comptes").fetchall(), [(60000,)])
+            self.assertEqual(connexion.execute("SELECT code FROM transactions").fetchall(), [("O",), ("D",)])
+
+    def test_historique_par_dates(self):
+        """L'historique est lu par pages et filtré par dates"""
+        self.banque.ouvrir_compte("Jean", "C001", 50000)
+        for _ in range(5):
+            self.banque.effectuer_depot("C001", 1000)
+        banque = self.recharger()
+        pages = list(banque.historique("C001", taille_page=2))
+        self.assertEqual([len(p) for p in pages], [2, 2, 1])
+        self.assertEqual(pages[-1][0].solde_centimes, 55000)
+        demain = datetime.datetime.now() + datetime.timedelta(days=1)
+        self.assertEqual(list(banque.historique("C001", debut=demain)), [])
+
+    def test_lot_annule(self):
+        """Un lot annulé n'écrit rien dans la base"""
+        self.banque.ouvrir_compte("Jean", "C001", 50000)
+        succes, _ = self.banque.appliquer_lot([
+            ("depot", "C001", 10000),
+            ("retrait", "C001", 999999),
+        ], atomique=True)
+        self.assertFalse(succes)
+        self.assertEqual(self.recharger().chercher_compte("C001").get_solde(), 50000)
+        self.assertEqual(list(self.banque.historique("C001")), [])
+
+    def test_import_fichier_json(self):
+        """Une banque JSON existante est importée avec son historique"""
+        self.banque.fermer()
+        os.remove(self.base)
+        banque = Banque("Test", fichier=self.fichier)
+        banque.ouvrir_compte("Jean", "C001", 50000)
+        banque.effectuer_depot("C001", 10000)
+        banque.fermer()
+
+        self.banque = Banque("Test", fichier=self.fichier, moteur="sqlite")
+        self.assertEqual(self.banque.chercher_compte("C001").get_solde(), 60000)
+        self.assertEqual(sum(len(p) for p in self.banque.historique("C001")), 1)
+
+    def test_moteur_inconnu(self):
+        """Un moteur inconnu est refusé"""
+        with self.assertRaises(ValueError):
+            Banque("Test", fichier=self.fichier, moteur="csv")
+
+
+if __name__ == '__main__':
+    unittest.main()
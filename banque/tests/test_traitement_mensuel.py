@@ -0,0 +1,66 @@
+# ============================================================================
+# tests/test_traitement_mensuel.py
+# ============================================================================
+TEST_TRAITEMENT_MENSUEL = """
+Tests unitaires du traitement mensuel (intérêts et frais en masse)
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from array import array
+from models.banque import Banque
+from models.traitement_mensuel import ReglesMensuelles, calculer_mouvements
+
+
+class TestTraitementMensuel(unittest.TestCase):
+    """Tests pour calculer_mouvements et Banque.appliquer_traitement_mensuel"""
+
+    def setUp(self):
+        """Initialisation avant chaque test"""
+        self.dossier = tempfile.mkdtemp()
+        self.fichier = os.path.join(self.dossier, "banque.json")
+        self.banque = Banque("Test", fichier=self.fichier)
+        # 1 % d'intérêts, 5 Fcfa de frais, 10 Fcfa de plus sous 100 Fcfa
+        self.regles = ReglesMensuelles(taux_pb=100, frais_tenue=500, frais_solde_bas=1000, solde_minimum=10000)
+
+    def tearDown(self):
+        """Nettoyage après chaque test"""
+        self.banque.fermer()
+        shutil.rmtree(self.dossier, ignore_errors=True)
+
+    def test_calcul(self):
+        """Intérêts arrondis au centime, frais majorés sous le minimum et plafonnés"""
+        soldes = array('q', [1_000_050, 10000, 9999, 800, 0])
+        interets, frais = calculer_mouvements(soldes, self.regles)
+        self.assertEqual(list(interets), [10001, 100, 0, 0, 0])
+        self.assertEqual(list(frais), [500, 500, 1500, 800, 0])
+
+    def test_traitement_banque(self):
+        """Le traitement met à jour les soldes, l'historique et les statistiques"""
+        self.banque.ouvrir_compte("Jean", "C001", 1_000_000)
+        self.banque.ouvrir_compte("Paul", "C002", 20000)
+        self.banque.effectuer_retrait("C002", 19500)
+
+        succes, _ = self.banque.appliquer_traitement_mensuel(self.regles)
+        self.assertTrue(succes)
+        self.assertEqual(self.banque.chercher_compte("C001").get_solde(), 1_000_000 + 10000 - 500)
+        self.assertEqual(self.banque.chercher_compte("C002").get_solde(), 0)
+        self.assertEqual(self.banque.verifier_statistiques(), [])
+
+        types = [t.type for page in self.banque.historique("C001") for t in page]
+        self.assertEqual(types, ["Intérêts", "Frais"])
+
+        self.banque.fermer()
+        self.banque = Banque("Test", fichier=self.fichier)
+        self.assertEqual(self.banque.chercher_compte("C001").get_solde(), 1_009_500)
+        self.assertEqual(self.banque.chercher_compte("C002").get_solde(), 0)
+
+    def test_refus_dans_un_lot(self):
+        """Le traitement n'est pas accepté à l'intérieur d'un lot"""
+        with self.banque.lot():
+            self.assertFalse(self.banque.appliquer_traitement_mensuel(self.regles)[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,9 @@
+import datetime
 from models.banque import Banque
+from models.compte_bancaire import CompteBancaire
+from models.montant import Montant
+from utils.instrumentation import INSTRUMENTATION
+from config.constants import FICHIER_INSTRUMENTATION
 
 
 class Menu:
@@ -22,6 +27,11 @@ class Menu:
         print(" 8. 🔄 Faire un transfert")
         print(" 9. 🆔 Modifier un compte")
         print(" 10 ❌ Supprimer un compte")
+        print(" 11 🔎 Rechercher par titulaire")
+        print(" 12 🕰️  Solde à une date")
+        print(" 13 ⏱️  Mesures de performance")
+        print(" 14 📥 Importer des comptes (CSV)")
+        print(" 15 📤 Exporter les comptes (CSV)")
         print(" 0. 🚪 Quitter le programme")
         print("="*50)
 
@@ -32,7 +42,7 @@ class Menu:
         titulaire = input("Nom du titulaire : ").strip()
 
         try:
-            solde = float(input("Solde initial : ").strip())
+            solde = Montant.depuis_fcfa(input("Solde initial : ").strip())
             succes, message = self.banque.ouvrir_compte(titulaire, numero_compte, solde)
 
             if succes:
@@ -107,7 +117,7 @@ class Menu:
         numero_compte = input("Numéro de compte : ").strip()
 
         try:
-            montant = float(input("Montant à déposer : ").strip())
+            montant = Montant.depuis_fcfa(input("Montant à déposer : ").strip())
             succes, message = self.banque.effectuer_depot(numero_compte, montant)
 
             if succes:
@@ -124,7 +134,7 @@ class Menu:
         numero_compte = input("Numéro de compte : ").strip()
 
         try:
-            montant = float(input("Montant à retirer : ").strip())
+            montant = Montant.depuis_fcfa(input("Montant à retirer : ").strip())
             succes, message = self.banque.effectuer_retrait(numero_compte, montant)
 
             if succes:
@@ -142,7 +152,7 @@ class Menu:
         numero_dest = input("Compte destinataire : ").strip()
 
         try:
-            montant = float(input("Montant à transférer : ").strip())
+            montant = Montant.depuis_fcfa(input("Montant à transférer : ").strip())
             succes, message = self.banque.transferer(numero_source, numero_dest, montant)
 
             if succes:
@@ -152,6 +162,158 @@ class Menu:
         except ValueError:
             print("❌ Montant invalide")
 
+    def historique_interactif(self):
+        """ Interface pour consulter l'historique page par page """
+        print("\\n--- HISTORIQUE ---")
+
+        numero = input("Numéro de compte : ").strip()
+        if not self.banque.chercher_compte(numero):
+            print(f"❌ Compte {numero} introuvable")
+            return
+
+        try:
+            saisie = input("Date de début jj/mm/aaaa (vide = tout) : ").strip()
+            debut = datetime.datetime.strptime(saisie, "%d/%m/%Y") if saisie else None
+            saisie = input("Date de fin jj/mm/aaaa (vide = tout) : ").strip()
+            fin = datetime.datetime.strptime(saisie, "%d/%m/%Y") + datetime.timedelta(days=1) if saisie else None
+        except ValueError:
+            print("❌ Date invalide")
+            return
+
+        vide = True
+        for page in self.banque.historique(numero, debut, fin):
+            vide = False
+            for transaction in page:
+                CompteBancaire.afficher_transaction(transaction)
+            if input("Entrée pour continuer, q pour arrêter : ").strip().lower() == 'q':
+                break
+        if vide:
+            print(" ❌ Aucune transaction effectuée.")
+
+    def lister_comptes_interactif(self):
+        """ Interface pour parcourir les comptes page par page """
+        tris = {"1": "numero", "2": "titulaire", "3": "solde"}
+        saisie = input("Trier par 1. numéro, 2. titulaire, 3. solde (défaut 1) : ").strip()
+        tri = tris.get(saisie or "1")
+        if tri is None:
+            print("❌ Choix de tri invalide")
+            return
+        decroissant = input("Ordre décroissant ? (o/N) : ").strip().lower() == 'o'
+
+        try:
+            saisie = input("Solde minimum en Fcfa (vide = aucun) : ").strip()
+            solde_min = Montant.depuis_fcfa(saisie) if saisie else None
+            saisie = input("Solde maximum en Fcfa (vide = aucun) : ").strip()
+            solde_max = Montant.depuis_fcfa(saisie) if saisie else None
+        except ValueError:
+            print("❌ Solde invalide")
+            return
+
+        curseur = None
+        while True:
+            curseur = self.banque.lister_comptes(
+                tri, curseur, solde_min=solde_min, solde_max=solde_max, decroissant=decroissant
+            )
+            if curseur is None:
+                break
+            if input("Entrée pour continuer, q pour arrêter : ").strip().lower() == 'q':
+                break
+
+    def recherche_titulaire_interactif(self):
+        """ Interface pour chercher des comptes par nom, page par page """
+        print("\\n--- RECHERCHE PAR TITULAIRE ---")
+
+        texte = input("Début du nom ou du prénom : ").strip()
+        if not texte:
+            print("❌ Le texte à chercher est obligatoire")
+            return
+
+        curseur, vide = None, True
+        while True:
+            comptes, curseur = self.banque.rechercher_titulaire(texte, curseur)
+            for compte in comptes:
+                vide = False
+                compte.get_infos()
+            if curseur is None:
+                break
+            if input("Entrée pour continuer, q pour arrêter : ").strip().lower() == 'q':
+                break
+        if vide:
+            print(f"❌ Aucun titulaire ne correspond à « {texte} »")
+
+    def solde_au_interactif(self):
+        """ Interface pour consulter le solde d'un compte à la fin d'une journée passée """
+        print("\\n--- SOLDE À UNE DATE ---")
+
+        numero = input("Numéro de compte : ").strip()
+        if not self.banque.chercher_compte(numero):
+            print(f"❌ Compte {numero} introuvable")
+            return
+
+        try:
+            saisie = input("Date jj/mm/aaaa : ").strip()
+            jour = datetime.datetime.strptime(saisie, "%d/%m/%Y")
+        except ValueError:
+            print("❌ Date invalide")
+            return
+
+        # Solde en fin de journée : toutes les transactions du jour comptent
+        solde = self.banque.solde_au(numero, jour + datetime.timedelta(days=1, microseconds=-1))
+        if solde is None:
+            print(f"❌ Solde du compte {numero} au {saisie} inconnu (compte importé sans historique)")
+            return
+        print(f"Solde du compte {numero} au {saisie} : {Montant.formater(solde)} Fcfa")
+
+    def instrumentation_interactif(self):
+        """ Interface pour consulter, exporter ou (dés)activer les mesures de performance """
+        INSTRUMENTATION.afficher()
+        if not INSTRUMENTATION.active:
+            if input("Activer les mesures ? (o/N) : ").strip().lower() == 'o':
+                INSTRUMENTATION.activer()
+                print("✔ Mesures activées")
+            return
+
+        saisie = input(f"Exporter en JSON ? Fichier (vide = {FICHIER_INSTRUMENTATION}, n = non) : ").strip()
+        if saisie.lower() != 'n':
+            fichier = saisie or FICHIER_INSTRUMENTATION
+            try:
+                INSTRUMENTATION.exporter(fichier)
+                print(f"✔ Mesures écrites dans {fichier}")
+            except OSError as e:
+                print(f"❌ Export impossible : {e}")
+        if input("Désactiver les mesures ? (o/N) : ").strip().lower() == 'o':
+            INSTRUMENTATION.desactiver()
+            print("✔ Mesures désactivées")
+
+    def import_csv_interactif(self):
+        """ Interface pour ouvrir en masse les comptes d'un fichier CSV """
+        print("\\n--- IMPORT CSV ---")
+        print("Colonnes : numero_compte, titulaire, solde (en Fcfa)")
+
+        fichier = input("Fichier à importer : ").strip()
+        if not fichier:
+            print("❌ Le nom du fichier est obligatoire")
+            return
+
+        succes, message = self.banque.importer_csv(fichier)
+        if succes:
+            print(f"✔ {message}")
+        else:
+            print(f"❌ {message}")
+
+    def export_csv_interactif(self):
+        """ Interface pour écrire tous les comptes dans un fichier CSV """
+        fichier = input("Fichier CSV à écrire : ").strip()
+        if not fichier:
+            print("❌ Le nom du fichier est obligatoire")
+            return
+
+        succes, message = self.banque.exporter_csv(fichier)
+        if succes:
+            print(f"✔ {message}")
+        else:
+            print(f"❌ {message}")
+
     def executer(self):
         """ Boucle principale du programme """
         print(f"\\n{'='*50}")
@@ -164,7 +326,7 @@ class Menu:
             choix = input("\\nVotre choix : ").strip()
 
             if choix == '1':
-                self.banque.lister_comptes()
+                self.lister_comptes_interactif()
 
             elif choix == '2':
                 self.ouvrir_compte_interactif()
@@ -184,8 +346,7 @@ class Menu:
                     print(f"❌ Compte {numero} introuvable")
 
             elif choix == '6':
-                numero = input("Numéro de compte : ").strip()
-                self.banque.afficher_historique(numero)
+                self.historique_interactif()
 
             elif choix == '7':
                 self.banque.obtenir_statistiques()
@@ -199,7 +360,23 @@ class Menu:
             elif choix == '10':
                 self.supprimer_compte_interactif()
 
+            elif choix == '11':
+                self.recherche_titulaire_interactif()
+
+            elif choix == '12':
+                self.solde_au_interactif()
+
+            elif choix == '13':
+                self.instrumentation_interactif()
+
+            elif choix == '14':
+                self.import_csv_interactif()
+
+            elif choix == '15':
+                self.export_csv_interactif()
+
             elif choix == '0':
+                self.banque.fermer()
                 print("\\n👋 Au revoir !")
                 break
             else:
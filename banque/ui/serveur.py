@@ -0,0 +1,167 @@
+"""
+    Serveur asyncio : expose la banque à plusieurs clients simultanés,
+    une requête JSON par ligne sur une connexion TCP locale.
+
+    Lancer depuis le dossier banque :
+        python -m ui.serveur [port]
+
+    Requête : {"id": 1, "op": "depot", "numero_compte": "C001", "montant": 50000}
+    Réponse : {"id": 1, "succes": true, "message": "Dépôt de 500.00 Fcfa effectué"}
+
+    Les montants (montant, solde) sont des entiers en centimes de Fcfa ; numéros
+    et noms sont des chaînes. Un champ d'un autre type est refusé (succes: false).
+
+    Une opération qui modifie la banque peut porter un champ "id_operation"
+    choisi par le client : renvoyée avec le même identifiant (après un délai
+    dépassé, par exemple), elle retourne la première réponse sans être rejouée.
+
+    Opérations : ouvrir, depot, retrait, transfert, compte, historique, statistiques,
+    instrumentation (mesures de performance, voir utils.instrumentation).
+"""
+import asyncio
+import datetime
+import itertools
+import json
+import sys
+from models.banque import Banque
+from utils.instrumentation import INSTRUMENTATION
+from config.constants import SERVEUR_HOTE, SERVEUR_PORT, TAILLE_PAGE_HISTORIQUE
+
+# Types acceptés pour chaque champ de requête, vérifiés avant toute opération
+# (bool est exclu des entiers : type() et non isinstance())
+TYPES_CHAMPS = {
+    "numero_compte": (str,), "titulaire": (str,), "source": (str,), "destination": (str,),
+    "montant": (int,), "solde": (int,), "taille_page": (int,), "page": (int,),
+    "debut": (str,), "fin": (str,), "id_operation": (str, int),
+}
+# Champs lus avec requete.get() : null vaut absence
+CHAMPS_FACULTATIFS = {"debut", "fin", "id_operation"}
+
+
+def verifier_champs(requete):
+    """ Message d'erreur pour le premier champ mal typé de la requête, ou None """
+    for champ, types in TYPES_CHAMPS.items():
+        if champ not in requete:
+            continue
+        valeur = requete[champ]
+        if valeur is None and champ in CHAMPS_FACULTATIFS:
+            continue
+        if type(valeur) not in types:
+            return f"Champ {champ} : {' ou '.join(t.__name__ for t in types)} attendu"
+    if requete.get("taille_page", 1) <= 0:
+        return "Champ taille_page : entier positif attendu"
+    if requete.get("page", 0) < 0:
+        return "Champ page : entier positif ou nul attendu"
+    return None
+
+
+class ServeurBanque:
+    """ Serveur de requêtes JSON au-dessus d'une Banque
+
+        La banque doit être créée avec asynchrone=True : les sauvegardes
+        partent alors au thread d'écriture et ne bloquent jamais la boucle.
+    """
+
+    def __init__(self, banque):
+        self.banque = banque
+        self.__operations = {
+            "ouvrir": lambda r: banque.ouvrir_compte(
+                r["titulaire"], r["numero_compte"], r["solde"], identifiant=r.get("id_operation")
+            ),
+            "depot": lambda r: banque.effectuer_depot(
+                r["numero_compte"], r["montant"], identifiant=r.get("id_operation")
+            ),
+            "retrait": lambda r: banque.effectuer_retrait(
+                r["numero_compte"], r["montant"], identifiant=r.get("id_operation")
+            ),
+            "transfert": lambda r: banque.transferer(
+                r["source"], r["destination"], r["montant"], identifiant=r.get("id_operation")
+            ),
+        }
+
+    async def traiter(self, requete):
+        """ Exécute une requête et retourne la réponse (dict) """
+        op = requete.get("op")
+        erreur = verifier_champs(requete)
+        if erreur is not None:
+            return {"succes": False, "message": erreur}
+        try:
+            if op in self.__operations:
+                succes, message = self.__operations[op](requete)
+                return {"succes": succes, "message": message}
+
+            if op == "compte":
+                compte = self.banque.chercher_compte(requete["numero_compte"])
+                if not compte:
+                    return {"succes": False, "message": f"Compte No {requete['numero_compte']} introuvable"}
+                return {"succes": True, "resultat": compte.to_dict()}
+
+            if op == "historique":
+                # Lecture disque : hors de la boucle d'événements
+                transactions = await asyncio.to_thread(self.__lire_historique, requete)
+                return {"succes": True, "resultat": transactions}
+
+            if op == "statistiques":
+                return {"succes": True, "resultat": self.banque.statistiques()}
+
+            if op == "instrumentation":
+                return {"succes": True, "resultat": INSTRUMENTATION.instantane()}
+
+            return {"succes": False, "message": f"Opération inconnue : {op}"}
+
+        except KeyError as e:
+            return {"succes": False, "message": f"Champ manquant : {e.args[0]}"}
+        except ValueError as e:
+            return {"succes": False, "message": f"Valeur invalide : {e}"}
+
+    def __lire_historique(self, requete):
+        """ Retourne une page de l'historique d'un compte """
+        debut = requete.get("debut")
+        fin = requete.get("fin")
+        pages = self.banque.historique(
+            requete["numero_compte"],
+            datetime.datetime.fromisoformat(debut) if debut else None,
+            datetime.datetime.fromisoformat(fin) if fin else None,
+            requete.get("taille_page", TAILLE_PAGE_HISTORIQUE),
+        )
+        page = next(itertools.islice(pages, requete.get("page", 0), None), [])
+        return [transaction.get_info() for transaction in page]
+
+    async def gerer_client(self, lecteur, ecrivain):
+        """ Sert les requêtes d'un client jusqu'à sa déconnexion """
+        try:
+            while ligne := await lecteur.readline():
+                try:
+                    requete = json.loads(ligne)
+                    reponse = await self.traiter(requete)
+                    reponse["id"] = requete.get("id")
+                except (json.JSONDecodeError, AttributeError):
+                    reponse = {"succes": False, "message": "Requête JSON invalide"}
+                ecrivain.write(json.dumps(reponse, ensure_ascii=False).encode() + b"\n")
+                await ecrivain.drain()
+        except ConnectionError:
+            pass
+        finally:
+            ecrivain.close()
+
+    async def demarrer(self, hote=SERVEUR_HOTE, port=SERVEUR_PORT):
+        """ Démarre l'écoute et retourne l'objet serveur asyncio """
+        return await asyncio.start_server(self.gerer_client, hote, port)
+
+
+async def servir(banque, hote=SERVEUR_HOTE, port=SERVEUR_PORT):
+    """ Sert la banque jusqu'à interruption """
+    serveur = await ServeurBanque(banque).demarrer(hote, port)
+    print(f"✔ {banque.nom_banque} à l'écoute sur {hote}:{port}")
+    async with serveur:
+        await serveur.serve_forever()
+
+
+if __name__ == "__main__":
+    banque = Banque("Banque Nationale", asynchrone=True)
+    try:
+        asyncio.run(servir(banque, port=int(sys.argv[1]) if len(sys.argv) > 1 else SERVEUR_PORT))
+    except KeyboardInterrupt:
+        print("\\n👋 Arrêt du serveur")
+    finally:
+        banque.fermer()
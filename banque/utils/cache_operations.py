@@ -0,0 +1,155 @@
+import threading
+import time
+from collections import OrderedDict
+from utils.codec_json import CODEC
+from utils.file_manager import FileManager
+from utils.journal import Journal
+from config.constants import (
+    CAPACITE_CACHE_OPERATIONS, DUREE_CACHE_OPERATIONS, SYNCHRONISATION_DISQUE, FENETRE_GROUPE_COMMIT
+)
+
+
+def _restaurer(resultat):
+    '''Rend à un résultat relu du disque sa forme d'origine (JSON n'a que des listes) :
+    (succès, message) ou, pour appliquer_lot, (succès, liste des (succès, message))'''
+    succes, detail = resultat
+    if isinstance(detail, list):
+        detail = [tuple(element) for element in detail]
+    return succes, detail
+
+
+class CacheOperations:
+    '''Résultats des opérations déjà exécutées, par identifiant fourni par le client
+
+    Un client qui renvoie une opération (après un délai dépassé, par exemple)
+    avec le même identifiant reçoit le résultat d'origine au lieu de
+    l'exécuter une seconde fois. Le cache est borné : au plus capacite
+    identifiants (les moins récemment utilisés sortent en premier), chacun
+    valable duree secondes.
+
+    Chaque résultat est ajouté à un journal JSON (une ligne par opération)
+    relu au démarrage ; le journal est réécrit quand il dépasse deux fois
+    la capacité, ce qui garde un coût O(1) amorti par opération.
+
+    Un résultat ne doit être durable qu'après la modification qu'il
+    annonce. Quand celle-ci est écrite par un autre thread, differer
+    (enregistrement) confie la journalisation à ce thread, qui appelle
+    journaliser() une fois la modification écrite.
+    '''
+
+    def __init__(self, fichier, capacite=CAPACITE_CACHE_OPERATIONS, duree=DUREE_CACHE_OPERATIONS,
+                 durable=SYNCHRONISATION_DISQUE, horloge=time.time, differer=None):
+        self.capacite = capacite
+        self.duree = duree
+        self.__horloge = horloge
+        # identifiant -> (expiration, résultat), du moins au plus récemment utilisé
+        self.__resultats = OrderedDict()
+        # Identifiants en cours d'exécution : un renvoi simultané attend le résultat
+        self.__en_cours = set()
+        # Identifiants dont la journalisation est différée : pas encore durables
+        self.differer = differer
+        self.__en_attente = set()
+        self.__condition = threading.Condition()
+        self.journal = Journal(fichier, durable, FENETRE_GROUPE_COMMIT)
+        self.__charger()
+
+    def __len__(self):
+        return len(self.__resultats)
+
+    def __charger(self):
+        '''Relit le journal en ignorant les résultats expirés'''
+        maintenant = self.__horloge()
+        for enregistrement in self.journal.rejouer():
+            if enregistrement['expiration'] > maintenant:
+                self.__resultats[enregistrement['id']] = (
+                    enregistrement['expiration'], _restaurer(enregistrement['resultat'])
+                )
+                self.__resultats.move_to_end(enregistrement['id'])
+        while len(self.__resultats) > self.capacite:
+            self.__resultats.popitem(last=False)
+
+    def chercher(self, identifiant):
+        '''Résultat enregistré pour identifiant, ou None'''
+        with self.__condition:
+            return self.__chercher(identifiant)
+
+    def __chercher(self, identifiant):
+        entree = self.__resultats.get(identifiant)
+        if entree is None:
+            return None
+        if entree[0] <= self.__horloge():
+            del self.__resultats[identifiant]
+            return None
+        self.__resultats.move_to_end(identifiant)
+        return entree[1]
+
+    def enregistrer(self, identifiant, resultat):
+        '''Mémorise et journalise le résultat d'une opération'''
+        with self.__condition:
+            enregistrement = self.__enregistrer(identifiant, resultat)
+        self.__publier(enregistrement)
+
+    def __enregistrer(self, identifiant, resultat):
+        '''Mémorise un résultat ; retourne l'enregistrement à journaliser'''
+        expiration = self.__horloge() + self.duree
+        self.__resultats[identifiant] = (expiration, resultat)
+        self.__resultats.move_to_end(identifiant)
+        if len(self.__resultats) > self.capacite:
+            self.__resultats.popitem(last=False)
+        return {"id": identifiant, "expiration": expiration, "resultat": resultat}
+
+    def __publier(self, enregistrement):
+        '''Journalise tout de suite, ou confie la journalisation à differer'''
+        if self.differer is None:
+            self.journaliser([enregistrement])
+            return
+        with self.__condition:
+            self.__en_attente.add(enregistrement["id"])
+        self.differer(enregistrement)
+
+    def journaliser(self, enregistrements):
+        '''Ajoute des résultats au journal et les rend durables'''
+        with self.__condition:
+            for enregistrement in enregistrements:
+                self.__en_attente.discard(enregistrement["id"])
+                self.journal.ajouter(enregistrement)
+            if self.journal.taille >= 2 * self.capacite:
+                self.__compacter()
+        self.journal.synchroniser()
+
+    def executer(self, identifiant, operation):
+        '''Exécute operation() une seule fois pour identifiant et retourne son résultat'''
+        with self.__condition:
+            while identifiant in self.__en_cours:
+                self.__condition.wait()
+            resultat = self.__chercher(identifiant)
+            if resultat is not None:
+                return resultat
+            self.__en_cours.add(identifiant)
+        try:
+            resultat = operation()
+            with self.__condition:
+                enregistrement = self.__enregistrer(identifiant, resultat)
+        finally:
+            with self.__condition:
+                self.__en_cours.discard(identifiant)
+                self.__condition.notify_all()
+        self.__publier(enregistrement)
+        return resultat
+
+    def __compacter(self):
+        '''Réécrit le journal avec les seuls résultats encore valables et déjà durables'''
+        self.journal.fermer()
+        maintenant = self.__horloge()
+        valables = [(i, e) for i, e in self.__resultats.items()
+                    if e[0] > maintenant and i not in self.__en_attente]
+        with FileManager.ecriture_atomique(self.journal.fichier, binaire=True) as f:
+            for identifiant, (expiration, resultat) in valables:
+                f.write(CODEC.encoder({"id": identifiant, "expiration": expiration, "resultat": resultat}) + b'\n')
+        self.journal.taille = len(valables)
+
+    def fermer(self):
+        '''Compacte et ferme le journal'''
+        with self.__condition:
+            self.__compacter()
+            self.journal.fermer()
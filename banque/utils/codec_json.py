@@ -0,0 +1,148 @@
+import codecs
+import json
+from config.constants import CODEC_JSON
+
+try:
+    import orjson
+except ImportError:  # Dépendance facultative : repli sur la bibliothèque standard
+    orjson = None
+
+
+class CodecStandard:
+    '''Codec JSON de la bibliothèque standard (sortie compacte, UTF-8)'''
+
+    nom = "json"
+    # json.dumps avec des options recrée un encodeur à chaque appel
+    _encodeur = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+    @staticmethod
+    def encoder(objet):
+        return CodecStandard._encodeur.encode(objet).encode('utf-8')
+
+    @staticmethod
+    def decoder(donnees):
+        return json.loads(donnees)
+
+
+class CodecOrjson:
+    '''Codec orjson (extension C), disponible si le paquet est installé'''
+
+    nom = "orjson"
+
+    @staticmethod
+    def encoder(objet):
+        return orjson.dumps(objet)
+
+    @staticmethod
+    def decoder(donnees):
+        return orjson.loads(donnees)
+
+
+CODECS = {"json": CodecStandard}
+if orjson is not None:
+    CODECS["orjson"] = CodecOrjson
+
+
+def obtenir_codec(nom=CODEC_JSON):
+    '''Codec demandé ; "auto" choisit le plus rapide disponible'''
+    if nom == "auto":
+        return CODECS.get("orjson", CodecStandard)
+    if nom not in CODECS:
+        raise ValueError(f"Codec JSON indisponible : {nom}")
+    return CODECS[nom]
+
+
+# Codec utilisé par la persistance de la banque
+CODEC = obtenir_codec()
+
+
+def ecrire_objet(flux, paires, codec=None, taille_bloc=1 << 16):
+    '''Écrit dans flux (binaire) un objet JSON à partir de paires (clé, valeur),
+    sans construire le dictionnaire complet'''
+    codec = codec or CODEC
+    bloc = [b'{']
+    taille = 1
+    premier = True
+    for cle, valeur in paires:
+        morceau = codec.encoder(cle) + b':' + codec.encoder(valeur)
+        if not premier:
+            morceau = b',' + morceau
+        premier = False
+        bloc.append(morceau)
+        taille += len(morceau)
+        if taille >= taille_bloc:
+            flux.write(b''.join(bloc))
+            bloc, taille = [], 0
+    bloc.append(b'}')
+    flux.write(b''.join(bloc))
+
+
+def iterer_objet(flux, taille_bloc=1 << 16):
+    '''Décodeur en flux : parcourt les paires (clé, valeur) de l'objet JSON
+    de premier niveau d'un fichier binaire, sans charger tout le fichier.
+
+    Chaque valeur est décodée par json.JSONDecoder.raw_decode (orjson ne
+    sait pas décoder un préfixe) : la mémoire reste bornée par la plus
+    grande valeur, pas par la taille du fichier.
+    '''
+    decodeur = json.JSONDecoder()
+    lecteur = codecs.getincrementaldecoder('utf-8')()
+    tampon = ''
+    position = 0
+    fin_fichier = False
+
+    def completer():
+        nonlocal tampon, position, fin_fichier
+        donnees = flux.read(taille_bloc)
+        if not donnees:
+            fin_fichier = True
+        tampon = tampon[position:] + lecteur.decode(donnees, final=fin_fichier)
+        position = 0
+
+    def sauter_blancs():
+        nonlocal position
+        while True:
+            while position < len(tampon) and tampon[position] in ' \t\r\n':
+                position += 1
+            if position < len(tampon) or fin_fichier:
+                return
+            completer()
+
+    def attendre(caracteres):
+        nonlocal position
+        sauter_blancs()
+        if position >= len(tampon) or tampon[position] not in caracteres:
+            raise json.JSONDecodeError(f"'{caracteres}' attendu", tampon, position)
+        position += 1
+        return tampon[position - 1]
+
+    def valeur():
+        nonlocal position
+        sauter_blancs()
+        while True:
+            try:
+                objet, fin = decodeur.raw_decode(tampon, position)
+            except json.JSONDecodeError:
+                if fin_fichier:
+                    raise
+                completer()
+                continue
+            # Un nombre en fin de tampon peut continuer dans le bloc suivant,
+            # même décodé avant la fin : raw_decode("1.") ou ("1e+") donne 1
+            if len(tampon) - fin < 3 and not fin_fichier:
+                completer()
+                continue
+            position = fin
+            return objet
+
+    completer()
+    attendre('{')
+    sauter_blancs()
+    if position < len(tampon) and tampon[position] == '}':
+        return
+    while True:
+        cle = valeur()
+        attendre(':')
+        yield cle, valeur()
+        if attendre(',}') == '}':
+            return
@@ -0,0 +1,108 @@
+import csv
+import itertools
+import os
+from models.compte_bancaire import CompteBancaire
+from models.montant import Montant
+from utils.file_manager import FileManager
+from utils.validators import Validators
+from config.constants import SOLDE_MINIMUM, ENTETE_CSV, SEPARATEUR_CSV, TAILLE_BLOC_CSV
+
+
+class CsvComptes:
+    '''Comptes au format CSV : une ligne numéro, titulaire, solde (en Fcfa) par compte.
+
+    Lecture et écriture se font au fil de l'eau, par blocs de lignes :
+    la mémoire utilisée ne dépend pas de la taille du fichier.
+    '''
+
+    @staticmethod
+    def lire_blocs(fichier, taille_bloc=TAILLE_BLOC_CSV, separateur=SEPARATEUR_CSV):
+        '''Parcourt le fichier par blocs de [(numéro de ligne, champs)] ; l'en-tête éventuel est sauté'''
+        # utf-8-sig : accepte les fichiers enregistrés par un tableur (BOM)
+        with open(fichier, 'r', encoding='utf-8-sig', newline='') as f:
+            lignes = enumerate(csv.reader(f, delimiter=separateur), start=1)
+            premiere = next(lignes, None)
+            if premiere is None:
+                return
+            if [champ.strip().lower() for champ in premiere[1]] != list(ENTETE_CSV):
+                lignes = itertools.chain([premiere], lignes)
+            while True:
+                bloc = list(itertools.islice(lignes, taille_bloc))
+                if not bloc:
+                    return
+                yield bloc
+
+    @staticmethod
+    def analyser(champs):
+        '''Compte décrit par une ligne, selon les règles de Validators.
+        Retourne (CompteBancaire, None) ou (None, motif du rejet).'''
+        if len(champs) != len(ENTETE_CSV):
+            return None, f"{len(champs)} colonne(s) au lieu de {len(ENTETE_CSV)}"
+        numero_compte, titulaire, solde = (champ.strip() for champ in champs)
+        if not Validators.valider_numero_compte(numero_compte):
+            return None, "Numéro de compte invalide"
+        if not Validators.valider_titulaire(titulaire):
+            return None, "Nom du titulaire invalide"
+        try:
+            solde = Montant.depuis_fcfa(solde)
+        except ValueError as e:
+            return None, str(e)
+        if not Validators.valider_solde(solde):
+            return None, f"Solde minimum : {SOLDE_MINIMUM} Fcfa"
+        return CompteBancaire(titulaire, numero_compte, solde), None
+
+    @staticmethod
+    def ecrire(fichier, comptes, separateur=SEPARATEUR_CSV, taille_bloc=TAILLE_BLOC_CSV):
+        '''Écrit les comptes avec un en-tête (écriture atomique) ; retourne le nombre de comptes'''
+        nombre = 0
+        with FileManager.ecriture_atomique(fichier) as f:
+            # lineterminator : le fichier est ouvert en mode texte, sans traduction à faire
+            ecrivain = csv.writer(f, delimiter=separateur, lineterminator='\n')
+            ecrivain.writerow(ENTETE_CSV)
+            comptes = iter(comptes)
+            while True:
+                bloc = [
+                    (c.get_numero_compte(), c.get_titulaire(), Montant.formater(c.get_solde()))
+                    for c in itertools.islice(comptes, taille_bloc)
+                ]
+                if not bloc:
+                    return nombre
+                ecrivain.writerows(bloc)
+                nombre += len(bloc)
+
+
+class FichierRejets:
+    '''Lignes refusées d'un import, écrites à côté du fichier importé.
+
+    Le fichier n'est créé qu'au premier rejet ; celui d'un import précédent
+    est effacé. Chaque ligne reprend le numéro de ligne d'origine, le motif
+    du rejet, puis les champs lus.
+    '''
+
+    def __init__(self, fichier, separateur=SEPARATEUR_CSV):
+        self.fichier = fichier
+        if os.path.exists(fichier):
+            os.remove(fichier)
+        self.separateur = separateur
+        self.nombre = 0
+        self.__f = None
+        self.__ecrivain = None
+
+    def ajouter(self, numero_ligne, motif, champs):
+        if self.__f is None:
+            self.__f = open(self.fichier, 'w', encoding='utf-8', newline='')
+            self.__ecrivain = csv.writer(self.__f, delimiter=self.separateur, lineterminator='\n')
+            self.__ecrivain.writerow(("ligne", "motif", *ENTETE_CSV))
+        self.__ecrivain.writerow((numero_ligne, motif, *champs))
+        self.nombre += 1
+
+    def fermer(self):
+        if self.__f is not None:
+            self.__f.close()
+            self.__f = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fermer()
@@ -0,0 +1,74 @@
+import queue
+import threading
+import time
+
+
+class EcrivainAsynchrone:
+    '''Thread d'écriture : regroupe toutes les sauvegardes en attente en une seule écriture
+
+    fenetre (secondes) : délai laissé aux opérations d'une rafale pour
+    rejoindre la même écriture (et le même fsync).
+    '''
+
+    def __init__(self, ecrire, fenetre=0.0):
+        # ecrire(infos_comptes, suppressions, transactions, operations) fait l'écriture réelle ;
+        # operations : résultats d'opérations identifiées, à journaliser après les comptes
+        self.__ecrire = ecrire
+        self.__fenetre = fenetre
+        self.__file = queue.Queue()
+        self.__thread = threading.Thread(target=self.__boucle, name="banque-ecrivain", daemon=True)
+        self.__thread.start()
+
+    def soumettre(self, infos_comptes=(), suppressions=(), transactions=(), operations=()):
+        '''Met une sauvegarde en attente (n'attend pas l'écriture)'''
+        self.__file.put((infos_comptes, suppressions, transactions, operations))
+
+    def vider(self):
+        '''Attend que toutes les sauvegardes soumises soient écrites'''
+        self.__file.join()
+
+    def arreter(self):
+        '''Écrit les sauvegardes en attente puis arrête le thread'''
+        self.__file.put(None)
+        self.__thread.join()
+
+    def __boucle(self):
+        while True:
+            elements = [self.__file.get()]
+            if self.__fenetre and elements[0] is not None:
+                time.sleep(self.__fenetre)
+            try:
+                while True:
+                    elements.append(self.__file.get_nowait())
+            except queue.Empty:
+                pass
+
+            try:
+                self.__ecrire(*self.__regrouper(e for e in elements if e is not None))
+            except Exception as e:
+                print(f"❌ Erreur d'écriture : {e}")
+            finally:
+                for _ in elements:
+                    self.__file.task_done()
+
+            if any(e is None for e in elements):
+                return
+
+    @staticmethod
+    def __regrouper(elements):
+        '''Ne garde que le dernier état de chaque compte'''
+        etats = {}
+        transactions, operations = [], []
+        for infos_comptes, suppressions, nouvelles, resultats in elements:
+            for infos in infos_comptes:
+                etats[infos['numero_compte']] = infos
+            for numero in suppressions:
+                etats[numero] = None
+            transactions.extend(nouvelles)
+            operations.extend(resultats)
+        return (
+            [infos for infos in etats.values() if infos is not None],
+            [numero for numero, infos in etats.items() if infos is None],
+            [(numero, t) for numero, t in transactions if etats.get(numero, True) is not None],
+            operations,
+        )
@@ -1,47 +1,135 @@
 import json
 import os
+from contextlib import contextmanager
 from models.compte_bancaire import CompteBancaire
+from utils.codec_json import CODEC, ecrire_objet, iterer_objet
+from config.constants import SEUIL_LECTURE_EN_FLUX
 
 
 class FileManager:
     '''Gère la lecture et l'écriture des fichiers JSON'''
 
     @staticmethod
-    def charger_comptes(fichier):
-        '''Charge les comptes depuis un fichier JSON'''
-        comptes = []
+    def charger_comptes(fichier, journal=None):
+        '''Charge les comptes depuis un fichier JSON, indexés par numéro.
+
+        Si un journal est fourni, ses enregistrements sont rejoués
+        par-dessus l'instantané.
+        '''
+        comptes = {}
         try:
             if os.path.exists(fichier):
-                with open(fichier, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    for numero_compte, infos in data.items():
-                        compte = CompteBancaire(
-                            infos['titulaire'],
-                            infos['numero_compte'],
-                            float(infos['solde'])
-                        )
-                        comptes.append(compte)
-                print(f"✔ {len(comptes)} compte(s) chargé(s)")
+                comptes = FileManager.lire_instantane(fichier)
             else:
                 print("⚠ Aucun fichier de données trouvé. Nouveau départ.")
+            if journal is not None:
+                FileManager.rejouer_journal(comptes, journal)
+            print(f"✔ {len(comptes)} compte(s) chargé(s)")
         except (json.JSONDecodeError, FileNotFoundError) as e:
             print(f"❌ Erreur de chargement : {e}")
         return comptes
 
     @staticmethod
-    def sauvegarder_comptes(fichier, comptes):
-        '''Sauvegarde les comptes dans un fichier JSON'''
+    def lire_instantane(fichier):
+        '''Lit l'instantané JSON et construit les comptes.
+        Au-delà de SEUIL_LECTURE_EN_FLUX octets, le fichier est décodé en flux,
+        sans construire le dictionnaire complet.'''
+        comptes = {}
+        with open(fichier, 'rb') as f:
+            if os.path.getsize(fichier) > SEUIL_LECTURE_EN_FLUX:
+                paires = iterer_objet(f)
+            else:
+                paires = CODEC.decoder(f.read()).items()
+            for numero_compte, infos in paires:
+                compte = CompteBancaire.from_dict(infos)
+                comptes[compte.get_numero_compte()] = compte
+        return comptes
+
+    @staticmethod
+    def rejouer_journal(comptes, journal):
+        '''Applique les enregistrements du journal aux comptes chargés'''
+        for enregistrement in journal.rejouer():
+            if enregistrement['op'] == 'maj':
+                for infos in enregistrement['comptes']:
+                    comptes[infos['numero_compte']] = CompteBancaire.from_dict(infos)
+                for numero_compte in enregistrement.get('suppressions', ()):
+                    comptes.pop(numero_compte, None)
+            elif enregistrement['op'] == 'suppression':
+                comptes.pop(enregistrement['numero_compte'], None)
+
+    @staticmethod
+    def journaliser_lot(journal, infos_comptes, suppressions=()):
+        '''Ajoute au journal, en un seul enregistrement, l'état des comptes
+        modifiés (dictionnaires to_dict) et les numéros supprimés.
+        Le coût ne dépend pas de la taille de la banque.'''
+        enregistrement = {"op": "maj", "comptes": list(infos_comptes)}
+        if suppressions:
+            enregistrement["suppressions"] = list(suppressions)
+        journal.ajouter(enregistrement)
+
+    @staticmethod
+    def compacter(fichier, comptes, journal):
+        '''Intègre le journal dans l'instantané puis le vide'''
+        if FileManager.sauvegarder_comptes(fichier, comptes):
+            journal.vider()
+            return True
+        return False
+
+    @staticmethod
+    def replier_journal(fichier, journal):
+        '''Compacte à partir des seules données déjà persistées (instantané + journal),
+        sans lire les comptes en mémoire qui peuvent être en cours de modification'''
         try:
-            # Créer le répertoire si nécessaire
-            os.makedirs(os.path.dirname(fichier), exist_ok=True)
+            comptes = FileManager.lire_instantane(fichier) if os.path.exists(fichier) else {}
+        except json.JSONDecodeError as e:
+            print(f"❌ Erreur de compaction : {e}")
+            return False
+        FileManager.rejouer_journal(comptes, journal)
+        return FileManager.compacter(fichier, comptes.values(), journal)
+
+    @staticmethod
+    @contextmanager
+    def ecriture_atomique(fichier, binaire=False):
+        '''Ouvre un fichier temporaire qui remplace fichier à la sortie du bloc.
 
-            data = {}
-            for compte in comptes:
-                data[compte.get_numero_compte()] = compte.to_dict()
+        Le contenu est synchronisé sur disque (fsync) avant un renommage
+        atomique : après un crash, fichier contient l'ancienne ou la
+        nouvelle version, jamais une version tronquée.
+        '''
+        dossier = os.path.dirname(fichier)
+        if dossier:
+            os.makedirs(dossier, exist_ok=True)
+        temporaire = fichier + ".tmp"
+        try:
+            with open(temporaire, 'wb') if binaire else open(temporaire, 'w', encoding='utf-8') as f:
+                yield f
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temporaire, fichier)
+        except BaseException:
+            if os.path.exists(temporaire):
+                os.remove(temporaire)
+            raise
+        FileManager.synchroniser_dossier(dossier)
 
-            with open(fichier, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
+    @staticmethod
+    def synchroniser_dossier(dossier):
+        '''Rend durable un renommage dans le dossier (sans effet hors POSIX)'''
+        if not hasattr(os, 'O_DIRECTORY'):
+            return
+        descripteur = os.open(dossier or '.', os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(descripteur)
+        finally:
+            os.close(descripteur)
+
+    @staticmethod
+    def sauvegarder_comptes(fichier, comptes):
+        '''Sauvegarde les comptes dans un fichier JSON compact (écriture atomique)'''
+        try:
+            with FileManager.ecriture_atomique(fichier, binaire=True) as f:
+                ecrire_objet(f, ((compte.get_numero_compte(), compte.to_dict()) for compte in comptes))
             return True
         except Exception as e:
             print(f"❌ Erreur de sauvegarde : {e}")
-            return False
\ No newline at end of file
+            return False
@@ -0,0 +1,196 @@
+import os
+import struct
+from urllib.parse import quote
+from models.transaction import Transaction
+from utils.codec_json import CODEC
+from utils.file_manager import FileManager
+from config.constants import TAILLE_PAGE_HISTORIQUE, INTERVALLE_POINTS_CONTROLE, SYNCHRONISATION_DISQUE
+
+# Point de contrôle : horodatage, position de la transaction dans l'historique, solde après elle
+POINT = struct.Struct("<dQq")
+
+
+class HistoriqueTransactions:
+    '''Stockage sur disque de l'historique : un fichier en ajout seul par compte
+
+    À côté de chaque historique, un fichier de points de contrôle (.points)
+    reçoit un enregistrement binaire de taille fixe chaque fois qu'une
+    transaction franchit un multiple de INTERVALLE_POINTS_CONTROLE octets.
+    Le solde à une date se lit par dichotomie sur ces points, puis en
+    relisant au plus un intervalle de transactions : O(log n + k).
+
+    Avec durable=True, les deux fichiers sont synchronisés sur disque (fsync)
+    à chaque ajout, comme le journal des mutations.
+    '''
+
+    def __init__(self, dossier, intervalle=INTERVALLE_POINTS_CONTROLE, durable=SYNCHRONISATION_DISQUE):
+        self.dossier = dossier
+        self.intervalle = intervalle
+        self.durable = durable
+
+    def __fichier(self, numero_compte):
+        return os.path.join(self.dossier, quote(numero_compte, safe='') + ".jsonl")
+
+    def __points(self, numero_compte):
+        return os.path.join(self.dossier, quote(numero_compte, safe='') + ".points")
+
+    def ajouter(self, numero_compte, transaction):
+        '''Ajoute une transaction à la fin de l'historique du compte'''
+        self.ajouter_lot([(numero_compte, transaction)])
+
+    def ajouter_lot(self, transactions):
+        '''Ajoute des paires (numéro, transaction) en ouvrant chaque fichier une seule fois'''
+        par_compte = {}
+        for numero_compte, transaction in transactions:
+            par_compte.setdefault(numero_compte, []).append(transaction)
+        if not par_compte:
+            return
+        os.makedirs(self.dossier, exist_ok=True)
+        for numero_compte, liste in par_compte.items():
+            with open(self.__fichier(numero_compte), 'a+b') as f:
+                lignes, points = self.__encoder(liste, self.__reparer(f))
+                f.writelines(lignes)
+                self.__synchroniser(f)
+            if points:
+                with open(self.__points(numero_compte), 'a+b') as f:
+                    # Un point de contrôle coupé décalerait tous les suivants
+                    taille = f.seek(0, os.SEEK_END)
+                    if taille % POINT.size:
+                        f.truncate(taille - taille % POINT.size)
+                    f.write(b''.join(points))
+                    self.__synchroniser(f)
+
+    def __synchroniser(self, f):
+        '''Force l'écriture du fichier sur disque (si durable)'''
+        if self.durable:
+            f.flush()
+            os.fsync(f.fileno())
+
+    @staticmethod
+    def __reparer(f, taille_bloc=4096):
+        '''Coupe une dernière ligne incomplète (crash en cours d'écriture) avant un ajout ;
+        retourne la taille du fichier'''
+        fin = taille = f.seek(0, os.SEEK_END)
+        while fin > 0:
+            debut = max(0, fin - taille_bloc)
+            f.seek(debut)
+            position = f.read(fin - debut).rfind(b'\n')
+            if position >= 0:
+                fin = debut + position + 1
+                break
+            fin = debut
+        if fin != taille:
+            f.truncate(fin)
+        return fin
+
+    def __encoder(self, transactions, position):
+        '''Lignes JSON des transactions écrites à partir de position, et leurs points de contrôle'''
+        lignes, points = [], []
+        for transaction in transactions:
+            ligne = CODEC.encoder(transaction.to_dict()) + b'\n'
+            fin = position + len(ligne)
+            # La ligne qui contient un multiple de l'intervalle devient un point de contrôle
+            if position % self.intervalle == 0 or position // self.intervalle != (fin - 1) // self.intervalle:
+                points.append(POINT.pack(transaction.horodatage, position, transaction.solde_centimes))
+            lignes.append(ligne)
+            position = fin
+        return lignes, points
+
+    def indexer(self, numero_compte):
+        '''Recrée les points de contrôle d'un historique (fichiers antérieurs aux points)'''
+        fichier = self.__fichier(numero_compte)
+        position, points = 0, []
+        with open(fichier, 'rb') as f:
+            for ligne in f:
+                if not ligne.endswith(b'\n'):
+                    break
+                transaction = Transaction.from_dict(CODEC.decoder(ligne))
+                _, point = self.__encoder([transaction], position)
+                points.extend(point)
+                position += len(ligne)
+        with FileManager.ecriture_atomique(self.__points(numero_compte), binaire=True) as f:
+            f.write(b''.join(points))
+
+    def __point_avant(self, numero_compte, instant):
+        '''Position du dernier point de contrôle daté au plus tard de instant (0 sinon)'''
+        fichier = self.__points(numero_compte)
+        if not os.path.exists(fichier):
+            if os.path.getsize(self.__fichier(numero_compte)) < self.intervalle:
+                return 0
+            self.indexer(numero_compte)
+        with open(fichier, 'rb') as f:
+            bas, haut = 0, os.fstat(f.fileno()).st_size // POINT.size
+            position = 0
+            while bas < haut:
+                milieu = (bas + haut) // 2
+                f.seek(milieu * POINT.size)
+                horodatage, debut, _ = POINT.unpack(f.read(POINT.size))
+                if horodatage <= instant:
+                    bas, position = milieu + 1, debut
+                else:
+                    haut = milieu
+        return position
+
+    def solde_au(self, numero_compte, date):
+        '''Solde du compte à la date (datetime), d'après son historique.
+        Avant la première transaction : le solde qui la précède (0 avant l'ouverture).
+        None si le compte n'a aucune transaction.'''
+        fichier = self.__fichier(numero_compte)
+        if not os.path.exists(fichier):
+            return None
+        instant = date.timestamp()
+        debut = self.__point_avant(numero_compte, instant)
+        solde = premiere = None
+        with open(fichier, 'rb') as f:
+            f.seek(debut)
+            for ligne in f:
+                if not ligne.endswith(b'\n'):
+                    break
+                transaction = Transaction.from_dict(CODEC.decoder(ligne))
+                if premiere is None:
+                    premiere = transaction
+                if transaction.horodatage > instant:
+                    break
+                solde = transaction.solde_centimes
+        if solde is None and premiere is not None:
+            return premiere.solde_avant()
+        return solde
+
+    def parcourir(self, numero_compte, debut=None, fin=None):
+        '''Parcourt les transactions du compte, éventuellement entre deux dates (datetime)'''
+        fichier = self.__fichier(numero_compte)
+        if not os.path.exists(fichier):
+            return
+        debut = debut.timestamp() if debut else None
+        fin = fin.timestamp() if fin else None
+        with open(fichier, 'rb') as f:
+            for ligne in f:
+                if not ligne.endswith(b'\n'):
+                    break  # Dernière ligne incomplète (crash en cours d'écriture)
+                transaction = Transaction.from_dict(CODEC.decoder(ligne))
+                # Repère d'ouverture : utile à solde_au, pas une opération du relevé
+                if transaction.code == Transaction.OUVERTURE:
+                    continue
+                if debut is not None and transaction.horodatage < debut:
+                    continue
+                # Fichier chronologique : inutile de lire la suite
+                if fin is not None and transaction.horodatage > fin:
+                    break
+                yield transaction
+
+    def pages(self, numero_compte, taille_page=TAILLE_PAGE_HISTORIQUE, debut=None, fin=None):
+        '''Parcourt l'historique par pages de taille_page transactions'''
+        page = []
+        for transaction in self.parcourir(numero_compte, debut, fin):
+            page.append(transaction)
+            if len(page) == taille_page:
+                yield page
+                page = []
+        if page:
+            yield page
+
+    def supprimer(self, numero_compte):
+        '''Supprime l'historique d'un compte'''
+        for fichier in (self.__fichier(numero_compte), self.__points(numero_compte)):
+            if os.path.exists(fichier):
+                os.remove(fichier)
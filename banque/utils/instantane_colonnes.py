@@ -0,0 +1,175 @@
+import bisect
+import mmap
+import struct
+import sys
+from array import array
+from models.compte_bancaire import CompteBancaire
+from models.montant import Montant
+from utils.file_manager import FileManager
+from config.constants import TRANCHES_HISTOGRAMME
+
+
+class InstantaneColonnes:
+    '''Instantané binaire en colonnes : numéros, titulaires et soldes de tous les comptes.
+
+    Disposition (entiers 64 bits little-endian, blocs alignés sur 8 octets) :
+        en-tête   : MAGIC, nombre, taille des numéros, taille des titulaires, réservé
+        soldes    : nombre × int64 (centimes), compatible array('q') / numpy '<i8'
+        offsets   : (nombre + 1) × int64 dans la table des numéros, puis idem titulaires
+        tables    : chaînes UTF-8 concaténées (numéros, puis titulaires)
+
+    Les comptes sont triés par numéro : chercher() est une recherche dichotomique.
+    Le fichier est projeté en mémoire (mmap) ; les agrégats parcourent la
+    colonne des soldes sans construire aucun CompteBancaire.
+    '''
+
+    MAGIC = b"BQCOL\x00\x00\x01"
+    EN_TETE = struct.Struct("<8sQQQQ")
+
+    @staticmethod
+    def ecrire(fichier, comptes):
+        '''Écrit l'instantané des comptes (écriture atomique) ; retourne le nombre de comptes'''
+        lignes = sorted(
+            ((c.get_numero_compte().encode('utf-8'), c.get_titulaire().encode('utf-8'), c.get_solde())
+             for c in comptes),
+            key=lambda ligne: ligne[0],
+        )
+        soldes = array('q', (solde for _, _, solde in lignes))
+        offsets_numeros, numeros = InstantaneColonnes.__table(numero for numero, _, _ in lignes)
+        offsets_titulaires, titulaires = InstantaneColonnes.__table(titulaire for _, titulaire, _ in lignes)
+        if sys.byteorder == 'big':
+            for colonne in (soldes, offsets_numeros, offsets_titulaires):
+                colonne.byteswap()
+
+        with FileManager.ecriture_atomique(fichier, binaire=True) as f:
+            f.write(InstantaneColonnes.EN_TETE.pack(
+                InstantaneColonnes.MAGIC, len(lignes), len(numeros), len(titulaires), 0
+            ))
+            f.write(soldes.tobytes())
+            f.write(offsets_numeros.tobytes())
+            f.write(offsets_titulaires.tobytes())
+            f.write(numeros)
+            f.write(titulaires)
+        return len(lignes)
+
+    @staticmethod
+    def __table(chaines):
+        '''Table de chaînes : offsets (nombre + 1 entiers) et octets concaténés'''
+        offsets = array('q', [0])
+        morceaux = []
+        for chaine in chaines:
+            morceaux.append(chaine)
+            offsets.append(offsets[-1] + len(chaine))
+        return offsets, b''.join(morceaux)
+
+    def __init__(self, fichier):
+        self.fichier = fichier
+        with open(fichier, 'rb') as f:
+            self.__mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.__mmap) < self.EN_TETE.size:
+            magic = None
+        else:
+            magic, self.nombre, taille_numeros, taille_titulaires, _ = self.EN_TETE.unpack_from(self.__mmap, 0)
+        if magic != self.MAGIC:
+            self.__mmap.close()
+            raise ValueError(f"{fichier} n'est pas un instantané en colonnes")
+
+        n = self.nombre
+        # Taille annoncée par l'en-tête : un fichier tronqué ne doit pas atteindre memoryview.cast
+        attendue = self.EN_TETE.size + 8 * n + 16 * (n + 1) + taille_numeros + taille_titulaires
+        if len(self.__mmap) != attendue:
+            self.__mmap.close()
+            raise ValueError(
+                f"{fichier} : instantané tronqué ou corrompu ({len(self.__mmap)} octets au lieu de {attendue})"
+            )
+        # Décalage (octets) de la colonne des soldes, pour numpy.frombuffer
+        self.decalage_soldes = self.EN_TETE.size
+        debut_offsets = self.decalage_soldes + 8 * n
+        debut_numeros = debut_offsets + 16 * (n + 1)
+        self.__debut_numeros = debut_numeros
+        self.__debut_titulaires = debut_numeros + taille_numeros
+
+        self.__vue = memoryview(self.__mmap)
+        self.soldes = self.__colonne(self.decalage_soldes, n)
+        self.__offsets_numeros = self.__colonne(debut_offsets, n + 1)
+        self.__offsets_titulaires = self.__colonne(debut_offsets + 8 * (n + 1), n + 1)
+
+    def __colonne(self, debut, nombre):
+        '''Colonne d'entiers 64 bits : vue sans copie, ou copie retournée sur machine big-endian'''
+        vue = self.__vue[debut:debut + 8 * nombre]
+        if sys.byteorder == 'little':
+            return vue.cast('q')
+        colonne = array('q', vue)
+        colonne.byteswap()
+        return colonne
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fermer()
+
+    def fermer(self):
+        '''Libère les vues puis la projection du fichier'''
+        for vue in (self.soldes, self.__offsets_numeros, self.__offsets_titulaires):
+            if isinstance(vue, memoryview):
+                vue.release()
+        self.__vue.release()
+        self.__mmap.close()
+
+    def __len__(self):
+        return self.nombre
+
+    def __chaine(self, debut, offsets, i):
+        return bytes(self.__vue[debut + offsets[i]:debut + offsets[i + 1]]).decode('utf-8')
+
+    def __numero_brut(self, i):
+        debut = self.__debut_numeros
+        return bytes(self.__vue[debut + self.__offsets_numeros[i]:debut + self.__offsets_numeros[i + 1]])
+
+    def numero(self, i):
+        return self.__chaine(self.__debut_numeros, self.__offsets_numeros, i)
+
+    def titulaire(self, i):
+        return self.__chaine(self.__debut_titulaires, self.__offsets_titulaires, i)
+
+    def chercher(self, numero_compte):
+        '''Solde (centimes) d'un compte, ou None ; O(log n)'''
+        cible = numero_compte.encode('utf-8')
+        bas, haut = 0, self.nombre
+        while bas < haut:
+            milieu = (bas + haut) // 2
+            if self.__numero_brut(milieu) < cible:
+                bas = milieu + 1
+            else:
+                haut = milieu
+        if bas < self.nombre and self.__numero_brut(bas) == cible:
+            return self.soldes[bas]
+        return None
+
+    # Agrégats : parcours de la seule colonne des soldes
+    def total(self):
+        return sum(self.soldes)
+
+    def minimum(self):
+        return min(self.soldes) if self.nombre else None
+
+    def maximum(self):
+        return max(self.soldes) if self.nombre else None
+
+    def histogramme(self, tranches=TRANCHES_HISTOGRAMME):
+        '''Nombre de comptes par tranche de solde (mêmes libellés que StatistiquesBanque)'''
+        bornes = [Montant.depuis_fcfa(t) for t in tranches]
+        effectifs = [0] * len(tranches)
+        for solde in self.soldes:
+            effectifs[max(0, bisect.bisect_right(bornes, solde) - 1)] += 1
+        libelles = list(tranches) + [None]
+        return {
+            f"{bas}-{haut}" if haut is not None else f"{bas}+": effectif
+            for bas, haut, effectif in zip(libelles, libelles[1:], effectifs)
+        }
+
+    def comptes(self):
+        '''Reconstruit les comptes (import), un à un'''
+        for i in range(self.nombre):
+            yield CompteBancaire(self.titulaire(i), self.numero(i), self.soldes[i])
@@ -0,0 +1,240 @@
+import datetime
+import functools
+import inspect
+import json
+import threading
+import time
+from config.constants import PRECISION_HISTOGRAMME_LATENCES, CIBLES_INSTRUMENTATION
+
+
+class HistogrammeLatences:
+    '''Histogramme de latences (ns) à seaux log-linéaires, à la manière de HdrHistogram.
+
+    Chaque puissance de deux est découpée en 2**precision seaux : l'erreur
+    relative sur un percentile reste sous 2**-precision, quelle que soit la
+    plage (de la nanoseconde à la minute), pour quelques Ko par opération.
+    '''
+
+    __slots__ = ("precision", "moitie", "effectifs", "nombre", "total", "minimum", "maximum")
+
+    def __init__(self, precision=PRECISION_HISTOGRAMME_LATENCES):
+        self.precision = precision
+        self.moitie = 1 << precision
+        self.effectifs = [0] * (2 * self.moitie)
+        self.nombre = 0
+        self.total = 0
+        self.minimum = None
+        self.maximum = 0
+
+    def indice(self, valeur):
+        '''Seau d'une valeur : les precision + 1 bits de poids fort, et leur décalage'''
+        decalage = max(0, valeur.bit_length() - self.precision - 1)
+        return decalage * self.moitie + (valeur >> decalage)
+
+    def borne_inferieure(self, indice):
+        '''Plus petite valeur du seau indice'''
+        decalage = max(0, indice // self.moitie - 1)
+        return (indice - decalage * self.moitie) << decalage
+
+    def borne_superieure(self, indice):
+        '''Plus grande valeur du seau indice'''
+        return self.borne_inferieure(indice + 1) - 1
+
+    def enregistrer(self, valeur):
+        # indice() recopié : c'est le chemin chaud des méthodes mesurées
+        decalage = valeur.bit_length() - self.precision - 1
+        indice = decalage * self.moitie + (valeur >> decalage) if decalage > 0 else valeur
+        effectifs = self.effectifs
+        if indice >= len(effectifs):
+            effectifs.extend([0] * (indice + 1 - len(effectifs)))
+        effectifs[indice] += 1
+        self.nombre += 1
+        self.total += valeur
+        if self.minimum is None or valeur < self.minimum:
+            self.minimum = valeur
+        if valeur > self.maximum:
+            self.maximum = valeur
+
+    def percentile(self, p):
+        '''Valeur sous laquelle se trouvent p % des mesures (borne haute du seau), ou None'''
+        if not self.nombre:
+            return None
+        rang = max(1, -(-self.nombre * p // 100))
+        cumul = 0
+        for indice, effectif in enumerate(self.effectifs):
+            cumul += effectif
+            if cumul >= rang:
+                return min(self.borne_superieure(indice), self.maximum)
+        return self.maximum
+
+    def seaux(self):
+        '''Seaux non vides : [(borne inférieure, effectif)]'''
+        return [(self.borne_inferieure(i), e) for i, e in enumerate(self.effectifs) if e]
+
+
+class _Mesures:
+    '''Compteurs et histogramme d'une opération'''
+
+    __slots__ = ("appels", "echecs", "histogramme", "verrou")
+
+    def __init__(self):
+        self.appels = 0
+        self.echecs = 0
+        self.histogramme = HistogrammeLatences()
+        self.verrou = threading.Lock()
+
+    def enregistrer(self, duree, echec):
+        with self.verrou:
+            self.appels += 1
+            self.echecs += echec
+            self.histogramme.enregistrer(duree)
+
+    def reinitialiser(self):
+        with self.verrou:
+            self.appels = 0
+            self.echecs = 0
+            self.histogramme = HistogrammeLatences()
+
+    def to_dict(self):
+        with self.verrou:
+            h = self.histogramme
+            return {
+                "appels": self.appels,
+                "echecs": self.echecs,
+                "total_ns": h.total,
+                "moyenne_ns": h.total // h.nombre if h.nombre else None,
+                "min_ns": h.minimum,
+                "max_ns": h.maximum,
+                "p50_ns": h.percentile(50),
+                "p90_ns": h.percentile(90),
+                "p99_ns": h.percentile(99),
+                "p999_ns": h.percentile(99.9),
+                "seaux": h.seaux(),
+            }
+
+
+def _echec(resultat):
+    '''Les opérations retournent False ou (False, message) en cas d'échec'''
+    return resultat is False or (type(resultat) is tuple and len(resultat) == 2 and resultat[0] is False)
+
+
+class Instrumentation:
+    '''Mesure des appels aux méthodes publiques de Banque, Validators et FileManager.
+
+    Rien n'est mesuré tant que l'instrumentation est inactive : activer()
+    remplace les méthodes ciblées par des versions chronométrées, et
+    desactiver() remet les originales. Désactivée, elle ne coûte donc rien.
+    Les durées sont inclusives : un transfert compte aussi les
+    chercher_compte et les écritures qu'il déclenche.
+    '''
+
+    def __init__(self, cibles=CIBLES_INSTRUMENTATION):
+        # cibles : {"module:Classe": None (méthodes publiques) ou [noms]}
+        self.cibles = cibles
+        self.__mesures = {}
+        self.__originales = []
+        self.__verrou = threading.Lock()
+        self.depuis = None
+
+    @property
+    def active(self):
+        return bool(self.__originales)
+
+    def activer(self):
+        '''Commence à mesurer (sans effet si déjà active)'''
+        with self.__verrou:
+            if self.__originales:
+                return
+            for cible, noms in self.cibles.items():
+                module, _, nom_classe = cible.partition(":")
+                classe = getattr(__import__(module, fromlist=[nom_classe]), nom_classe)
+                for nom in noms or self.__methodes_publiques(classe):
+                    brute = vars(classe)[nom]
+                    self.__originales.append((classe, nom, brute))
+                    setattr(classe, nom, self.__chronometrer(f"{nom_classe}.{nom}", brute))
+            if self.depuis is None:
+                self.depuis = datetime.datetime.now()
+
+    def desactiver(self):
+        '''Remet les méthodes d'origine ; les mesures déjà prises sont gardées'''
+        with self.__verrou:
+            for classe, nom, brute in reversed(self.__originales):
+                setattr(classe, nom, brute)
+            self.__originales.clear()
+
+    def reinitialiser(self):
+        '''Efface les mesures (les méthodes chronométrées gardent leurs compteurs)'''
+        with self.__verrou:
+            for mesures in self.__mesures.values():
+                mesures.reinitialiser()
+            self.depuis = datetime.datetime.now() if self.__originales else None
+
+    @staticmethod
+    def __methodes_publiques(classe):
+        '''Fonctions et méthodes statiques publiques, hors générateurs et gestionnaires de contexte'''
+        noms = []
+        for nom, brute in vars(classe).items():
+            fonction = brute.__func__ if isinstance(brute, (staticmethod, classmethod)) else brute
+            if nom.startswith("_") or not inspect.isfunction(fonction):
+                continue
+            # Chronométrer un générateur ne mesurerait que sa création
+            if inspect.isgeneratorfunction(inspect.unwrap(fonction)):
+                continue
+            noms.append(nom)
+        return noms
+
+    def __chronometrer(self, operation, brute):
+        mesures = self.__mesures.get(operation)
+        if mesures is None:
+            mesures = self.__mesures[operation] = _Mesures()
+        fonction = brute.__func__ if isinstance(brute, (staticmethod, classmethod)) else brute
+        horloge = time.perf_counter_ns
+
+        @functools.wraps(fonction)
+        def mesuree(*args, **kwargs):
+            debut = horloge()
+            try:
+                resultat = fonction(*args, **kwargs)
+            except BaseException:
+                mesures.enregistrer(horloge() - debut, True)
+                raise
+            mesures.enregistrer(horloge() - debut, _echec(resultat))
+            return resultat
+
+        return type(brute)(mesuree) if isinstance(brute, (staticmethod, classmethod)) else mesuree
+
+    def instantane(self):
+        '''Photographie des mesures, sérialisable en JSON'''
+        with self.__verrou:
+            mesures = dict(self.__mesures)
+        return {
+            "active": self.active,
+            "depuis": self.depuis.isoformat(timespec="seconds") if self.depuis else None,
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "operations": {nom: m.to_dict() for nom, m in sorted(mesures.items()) if m.appels},
+        }
+
+    def exporter(self, fichier):
+        '''Écrit l'instantané des mesures dans un fichier JSON'''
+        with open(fichier, 'w', encoding='utf-8') as f:
+            json.dump(self.instantane(), f, ensure_ascii=False, indent=2)
+
+    def afficher(self):
+        '''Tableau des opérations mesurées, de la plus coûteuse à la moins coûteuse'''
+        instantane = self.instantane()
+        operations = sorted(instantane["operations"].items(), key=lambda item: -item[1]["total_ns"])
+        print("\n" + "=" * 90)
+        print(f"Mesures de performance ({'actives' if instantane['active'] else 'inactives'}"
+              f", depuis {instantane['depuis'] or '-'})")
+        print("=" * 90)
+        if not operations:
+            print(" ❌ Aucune opération mesurée.")
+            return
+        print(f"{'Opération':<36} {'appels':>8} {'échecs':>7} {'total ms':>10} "
+              f"{'p50 µs':>8} {'p99 µs':>8} {'max µs':>9}")
+        for nom, m in operations:
+            print(f"{nom:<36} {m['appels']:>8} {m['echecs']:>7} {m['total_ns'] / 1e6:>10.1f} "
+                  f"{m['p50_ns'] / 1e3:>8.1f} {m['p99_ns'] / 1e3:>8.1f} {m['max_ns'] / 1e3:>9.1f}")
+
+
+INSTRUMENTATION = Instrumentation()
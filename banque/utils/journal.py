@@ -0,0 +1,112 @@
+import os
+import threading
+import time
+from utils.codec_json import CODEC
+
+
+class Journal:
+    '''Journal en ajout seul des mutations de la banque (une ligne JSON par opération)
+
+    Avec durable=True, synchroniser() garantit que les enregistrements déjà
+    ajoutés sont sur disque (fsync). Les appels concurrents sont regroupés
+    (group commit) : un seul thread attend la fenêtre puis fait un fsync
+    pour tous les enregistrements écrits entre-temps.
+    '''
+
+    def __init__(self, fichier, durable=False, fenetre=0.0):
+        self.fichier = fichier
+        self.durable = durable
+        self.fenetre = fenetre
+        self.taille = 0
+        self.__flux = None
+        # Enregistrements écrits / synchronisés sur disque depuis l'ouverture
+        self.__ecrits = 0
+        self.__synchronises = 0
+        self.__synchronisation_en_cours = False
+        self.__condition = threading.Condition()
+        self.__reparer()
+
+    def __reparer(self):
+        '''Compte les enregistrements et coupe une dernière ligne incomplète (crash en cours d'écriture)'''
+        if not os.path.exists(self.fichier):
+            return
+        with open(self.fichier, 'rb+') as f:
+            contenu = f.read()
+            fin = contenu.rfind(b'\n') + 1
+            if fin != len(contenu):
+                f.truncate(fin)
+        self.taille = contenu.count(b'\n', 0, fin)
+
+    def ajouter(self, enregistrement):
+        '''Ajoute un enregistrement compact en fin de journal'''
+        ligne = CODEC.encoder(enregistrement) + b'\n'
+        with self.__condition:
+            if self.__flux is None:
+                dossier = os.path.dirname(self.fichier)
+                if dossier:
+                    os.makedirs(dossier, exist_ok=True)
+                self.__flux = open(self.fichier, 'ab')
+            self.__flux.write(ligne)
+            self.__flux.flush()
+            self.taille += 1
+            self.__ecrits += 1
+
+    def synchroniser(self):
+        '''Attend que les enregistrements déjà ajoutés soient sur disque (si durable)'''
+        if not self.durable:
+            return
+        with self.__condition:
+            cible = self.__ecrits
+            while self.__synchronises < cible:
+                if self.__synchronisation_en_cours:
+                    # Un autre thread synchronise : son fsync couvrira peut-être nos écritures
+                    self.__condition.wait()
+                    continue
+                self.__synchronisation_en_cours = True
+                lot = self.__synchronises
+                self.__condition.release()
+                try:
+                    # Laisse aux autres threads le temps d'écrire : un seul fsync pour tous
+                    if self.fenetre:
+                        time.sleep(self.fenetre)
+                    with self.__condition:
+                        lot = self.__ecrits
+                        flux = self.__flux
+                    # fermer() attend la fin de la synchronisation : flux reste ouvert
+                    if flux is not None:
+                        os.fsync(flux.fileno())
+                finally:
+                    self.__condition.acquire()
+                    self.__synchronisation_en_cours = False
+                    self.__synchronises = max(self.__synchronises, lot)
+                    self.__condition.notify_all()
+
+    def rejouer(self):
+        '''Parcourt les enregistrements du journal dans l'ordre'''
+        if not os.path.exists(self.fichier):
+            return
+        with open(self.fichier, 'rb') as f:
+            for ligne in f:
+                if ligne.strip():
+                    yield CODEC.decoder(ligne)
+
+    def vider(self):
+        '''Vide le journal (après compaction dans l'instantané)'''
+        self.fermer()
+        with open(self.fichier, 'wb'):
+            pass
+        self.taille = 0
+
+    def fermer(self):
+        '''Ferme le fichier du journal'''
+        with self.__condition:
+            while self.__synchronisation_en_cours:
+                self.__condition.wait()
+            if self.__flux is not None:
+                if self.durable:
+                    os.fsync(self.__flux.fileno())
+                self.__flux.close()
+                self.__flux = None
+            # Tout ce qui a été écrit est sur disque (ou intégré à l'instantané)
+            self.__synchronises = self.__ecrits
+            self.__condition.notify_all()
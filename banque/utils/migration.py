@@ -0,0 +1,55 @@
+"""
+    Migration des données vers le format courant : montants entiers en
+    centimes et transactions compactes.
+
+    Les anciens fichiers sont déjà lus de façon transparente ; ce script
+    les réécrit une fois pour toutes au nouveau format.
+
+    Lancer depuis le dossier banque :
+        python -m utils.migration [data/banque.json]
+"""
+import json
+import os
+import sys
+from models.transaction import Transaction
+from utils.file_manager import FileManager
+from utils.journal import Journal
+from config.constants import FICHIER_BANQUE, EXTENSION_JOURNAL, DOSSIER_HISTORIQUE
+
+
+def migrer_historique(dossier):
+    """ Réécrit les fichiers d'historique qui ne sont pas au format compact """
+    if not os.path.isdir(dossier):
+        return 0
+    migres = 0
+    for nom in os.listdir(dossier):
+        if not nom.endswith(".jsonl"):
+            continue  # Points de contrôle : recréés à la demande
+        chemin = os.path.join(dossier, nom)
+        with open(chemin, 'r', encoding='utf-8') as f:
+            lignes = [json.loads(ligne) for ligne in f if ligne.endswith('\n')]
+        if all('t' in ligne for ligne in lignes):
+            continue
+        with FileManager.ecriture_atomique(chemin) as f:
+            f.writelines(json.dumps(Transaction.from_dict(ligne).to_dict(), separators=(',', ':')) + '\n'
+                         for ligne in lignes)
+        # Les positions des points de contrôle ne correspondent plus au fichier réécrit
+        points = os.path.splitext(chemin)[0] + ".points"
+        if os.path.exists(points):
+            os.remove(points)
+        migres += 1
+    return migres
+
+
+def migrer(fichier):
+    """ Réécrit l'instantané (journal inclus) et l'historique au format courant """
+    journal = Journal(os.path.splitext(fichier)[0] + EXTENSION_JOURNAL)
+    if not FileManager.replier_journal(fichier, journal):
+        return False
+    migres = migrer_historique(os.path.join(os.path.dirname(fichier), DOSSIER_HISTORIQUE))
+    print(f"✔ {fichier} migré, {migres} historique(s) converti(s)")
+    return True
+
+
+if __name__ == "__main__":
+    migrer(sys.argv[1] if len(sys.argv) > 1 else FICHIER_BANQUE)
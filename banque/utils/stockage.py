@@ -0,0 +1,101 @@
+import os
+from contextlib import contextmanager
+from utils.file_manager import FileManager
+from utils.historique import HistoriqueTransactions
+from utils.journal import Journal
+from config.constants import (
+    EXTENSION_JOURNAL, SEUIL_COMPACTION, DOSSIER_HISTORIQUE, SYNCHRONISATION_DISQUE,
+    FENETRE_GROUPE_COMMIT
+)
+
+
+class Stockage:
+    '''Interface des moteurs de stockage des comptes et de leur historique'''
+
+    # Vrai si les comptes sont chargés à la demande (voir StockageShards)
+    paresseux = False
+
+    def __init__(self, fichier, durable=SYNCHRONISATION_DISQUE):
+        self.fichier = fichier
+        # Historique des transactions : pages(numero, taille_page, debut, fin)
+        self.historique = HistoriqueTransactions(
+            os.path.join(os.path.dirname(fichier), DOSSIER_HISTORIQUE), durable=durable
+        )
+
+    def charger(self):
+        '''Retourne les comptes : un mapping numéro -> CompteBancaire'''
+        raise NotImplementedError
+
+    def ecrire(self, infos_comptes, suppressions, transactions=()):
+        '''Persiste l'état des comptes modifiés (dictionnaires to_dict), les suppressions
+        et les nouvelles transactions (paires numéro, Transaction)'''
+        raise NotImplementedError
+
+    def ecrire_historique(self, suppressions, transactions):
+        '''Ajoute les transactions à l'historique et efface celui des comptes supprimés'''
+        self.historique.ajouter_lot(transactions)
+        for numero_compte in suppressions:
+            self.historique.supprimer(numero_compte)
+
+    def synchroniser(self):
+        '''Attend que les écritures déjà faites soient sur disque.
+        Appelé hors du verrou de la banque pour que les threads partagent un fsync.'''
+
+    def doit_compacter(self, nombre_comptes):
+        '''Indique si une compaction est due'''
+        return False
+
+    def compacter(self, comptes):
+        '''Réécrit les données à partir des comptes en mémoire'''
+        return True
+
+    def replier(self):
+        '''Compacte à partir des seules données déjà persistées'''
+        return True
+
+    def statistiques_sauvegardees(self):
+        '''Agrégats enregistrés à la dernière fermeture propre, ou None'''
+        return None
+
+    @contextmanager
+    def figer(self):
+        '''Garde en mémoire tous les comptes chargés pendant le bloc (lots)'''
+        yield
+
+    def fermer(self, comptes, statistiques):
+        '''Compacte et libère les fichiers'''
+        self.compacter(comptes)
+
+
+class StockageJson(Stockage):
+    '''Instantané JSON complet + journal des mutations en ajout seul'''
+
+    def __init__(self, fichier, durable=SYNCHRONISATION_DISQUE, fenetre=FENETRE_GROUPE_COMMIT):
+        super().__init__(fichier, durable)
+        self.journal = Journal(os.path.splitext(fichier)[0] + EXTENSION_JOURNAL, durable, fenetre)
+
+    def charger(self):
+        return FileManager.charger_comptes(self.fichier, self.journal)
+
+    def ecrire(self, infos_comptes, suppressions, transactions=()):
+        self.ecrire_historique(suppressions, transactions)
+        if infos_comptes or suppressions:
+            FileManager.journaliser_lot(self.journal, infos_comptes, suppressions)
+
+    def synchroniser(self):
+        self.journal.synchroniser()
+
+    def doit_compacter(self, nombre_comptes):
+        # Seuil proportionnel à la taille de la banque : le coût de la
+        # compaction reste amorti en O(1) par opération
+        return self.journal.taille >= max(SEUIL_COMPACTION, nombre_comptes)
+
+    def compacter(self, comptes):
+        return FileManager.compacter(self.fichier, list(comptes.values()), self.journal)
+
+    def replier(self):
+        return FileManager.replier_journal(self.fichier, self.journal)
+
+    def fermer(self, comptes, statistiques):
+        self.compacter(comptes)
+        self.journal.fermer()
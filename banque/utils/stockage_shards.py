@@ -0,0 +1,288 @@
+import json
+import os
+import threading
+import weakref
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
+from utils.file_manager import FileManager
+from utils.journal import Journal
+from utils.stockage import Stockage
+from config.constants import (
+    EXTENSION_JOURNAL, SEUIL_COMPACTION, SUFFIXE_SHARDS, NOMBRE_SHARDS, TAILLE_CACHE_SHARDS,
+    SYNCHRONISATION_DISQUE, FENETRE_GROUPE_COMMIT
+)
+
+
+class ComptesShardes:
+    '''Mapping numéro -> CompteBancaire réparti en shards chargés à la demande.
+
+    Chaque shard (instantané JSON + journal) n'est lu qu'au premier accès à
+    l'un de ses comptes ; au plus taille_cache shards restent en mémoire (LRU).
+    Un compte encore référencé ailleurs (opération en cours) est retrouvé
+    tel quel au rechargement de son shard, jamais dupliqué.
+    '''
+
+    def __init__(self, dossier, nombre_shards=NOMBRE_SHARDS, taille_cache=TAILLE_CACHE_SHARDS, nombre_comptes=0):
+        self.dossier = dossier
+        self.nombre_shards = nombre_shards
+        self.taille_cache = taille_cache
+        self.__nombre = nombre_comptes
+        self.__cache = OrderedDict()
+        self.__journaux = {}
+        # Journaux écrits depuis le dernier appel à synchroniser()
+        self.__a_synchroniser = set()
+        self.__vivants = weakref.WeakValueDictionary()
+        self.__fige = 0
+        self.__verrou = threading.RLock()
+
+    # Fichiers
+    def indice(self, numero_compte):
+        '''Shard d'un compte (crc32 : stable d'une exécution à l'autre, contrairement à hash)'''
+        return zlib.crc32(numero_compte.encode('utf-8')) % self.nombre_shards
+
+    def fichier(self, indice):
+        return os.path.join(self.dossier, f"shard_{indice:03d}.json")
+
+    def journal(self, indice):
+        with self.__verrou:
+            if indice not in self.__journaux:
+                self.__journaux[indice] = Journal(
+                    os.path.splitext(self.fichier(indice))[0] + EXTENSION_JOURNAL,
+                    SYNCHRONISATION_DISQUE, FENETRE_GROUPE_COMMIT
+                )
+            return self.__journaux[indice]
+
+    def shards_charges(self):
+        '''Indices des shards en mémoire, du moins au plus récemment utilisé'''
+        with self.__verrou:
+            return list(self.__cache)
+
+    def lire(self, indice):
+        '''Lit un shard sur disque (instantané + journal) sans le mettre en cache'''
+        fichier = self.fichier(indice)
+        comptes = FileManager.lire_instantane(fichier) if os.path.exists(fichier) else {}
+        FileManager.rejouer_journal(comptes, self.journal(indice))
+        return comptes
+
+    def __shard(self, indice):
+        '''Comptes du shard, chargés si besoin (éviction du moins récemment utilisé)'''
+        with self.__verrou:
+            comptes = self.__cache.get(indice)
+            if comptes is not None:
+                self.__cache.move_to_end(indice)
+                return comptes
+            comptes = self.lire(indice)
+            for numero_compte in comptes:
+                vivant = self.__vivants.pop(numero_compte, None)
+                if vivant is not None:
+                    comptes[numero_compte] = vivant
+            self.__cache[indice] = comptes
+            self.__evincer()
+            return comptes
+
+    def __evincer(self):
+        while not self.__fige and len(self.__cache) > self.taille_cache:
+            _, comptes = self.__cache.popitem(last=False)
+            # Tout est déjà journalisé : seuls les comptes encore utilisés restent joignables
+            self.__vivants.update(comptes)
+
+    @contextmanager
+    def figer(self):
+        '''Suspend l'éviction pendant le bloc'''
+        with self.__verrou:
+            self.__fige += 1
+        try:
+            yield
+        finally:
+            with self.__verrou:
+                self.__fige -= 1
+                self.__evincer()
+
+    # Interface de dictionnaire utilisée par la Banque
+    def get(self, numero_compte, defaut=None):
+        return self.__shard(self.indice(numero_compte)).get(numero_compte, defaut)
+
+    def __getitem__(self, numero_compte):
+        return self.__shard(self.indice(numero_compte))[numero_compte]
+
+    def __contains__(self, numero_compte):
+        return numero_compte in self.__shard(self.indice(numero_compte))
+
+    def __setitem__(self, numero_compte, compte):
+        with self.__verrou:
+            comptes = self.__shard(self.indice(numero_compte))
+            if numero_compte not in comptes:
+                self.__nombre += 1
+            comptes[numero_compte] = compte
+
+    def __delitem__(self, numero_compte):
+        with self.__verrou:
+            del self.__shard(self.indice(numero_compte))[numero_compte]
+            self.__nombre -= 1
+
+    def __len__(self):
+        return self.__nombre
+
+    def recompter(self):
+        '''Recompte les comptes en lisant tous les shards (après un arrêt brutal)'''
+        with self.__verrou:
+            self.__nombre = sum(len(self.lire(i)) for i in range(self.nombre_shards))
+
+    def values(self):
+        '''Parcourt tous les comptes, shard par shard'''
+        for indice in range(self.nombre_shards):
+            yield from list(self.__shard(indice).values())
+
+    def __iter__(self):
+        for compte in self.values():
+            yield compte.get_numero_compte()
+
+    # Persistance
+    def ecrire(self, infos_comptes, suppressions):
+        '''Journalise chaque mise à jour dans le journal de son shard'''
+        par_shard = {}
+        for infos in infos_comptes:
+            par_shard.setdefault(self.indice(infos['numero_compte']), ([], []))[0].append(infos)
+        for numero_compte in suppressions:
+            par_shard.setdefault(self.indice(numero_compte), ([], []))[1].append(numero_compte)
+        seuil = max(SEUIL_COMPACTION, self.__nombre // self.nombre_shards)
+        for indice, (infos, supprimes) in par_shard.items():
+            journal = self.journal(indice)
+            FileManager.journaliser_lot(journal, infos, supprimes)
+            with self.__verrou:
+                self.__a_synchroniser.add(journal)
+            if journal.taille >= seuil:
+                self.replier(indice)
+
+    def synchroniser(self):
+        '''Synchronise sur disque les journaux écrits'''
+        with self.__verrou:
+            journaux, self.__a_synchroniser = self.__a_synchroniser, set()
+        for journal in journaux:
+            journal.synchroniser()
+
+    def replier(self, indice):
+        '''Compacte un shard à partir de ses seules données persistées'''
+        with self.__verrou:
+            journal = self.journal(indice)
+            if not journal.taille:
+                return True
+            try:
+                comptes = self.lire(indice)
+            except json.JSONDecodeError as e:
+                print(f"❌ Erreur de compaction : {e}")
+                return False
+            return FileManager.compacter(self.fichier(indice), comptes.values(), journal)
+
+    def compacter(self):
+        '''Compacte tous les shards dont le journal n'est pas vide'''
+        with self.__verrou:
+            indices = [i for i in range(self.nombre_shards) if self.journal(i).taille]
+        return all([self.replier(indice) for indice in indices])
+
+    def fermer(self):
+        with self.__verrou:
+            for journal in self.__journaux.values():
+                journal.fermer()
+            self.__journaux.clear()
+
+
+class StockageShards(Stockage):
+    '''Comptes répartis en shards à côté du fichier de la banque, chargés à la demande.
+
+    index.json garde le nombre de comptes et, après une fermeture propre, les
+    statistiques : le démarrage ne lit aucun shard. Au premier démarrage, un
+    fichier de banque existant est réparti dans les shards.
+    '''
+
+    paresseux = True
+
+    def __init__(self, fichier, nombre_shards=NOMBRE_SHARDS, taille_cache=TAILLE_CACHE_SHARDS):
+        super().__init__(fichier)
+        self.dossier = os.path.splitext(fichier)[0] + SUFFIXE_SHARDS
+        self.index = os.path.join(self.dossier, "index.json")
+        self.__nombre_shards = nombre_shards
+        self.__taille_cache = taille_cache
+        self.__statistiques = None
+        self.comptes = None
+
+    def charger(self):
+        index = self.__lire_index()
+        if index is None:
+            self.comptes = self.__importer()
+        else:
+            self.comptes = ComptesShardes(
+                self.dossier, index['nombre_shards'], self.__taille_cache, index['nombre_comptes']
+            )
+            if index.get('propre'):
+                self.__statistiques = index.get('statistiques')
+            else:
+                # Arrêt brutal : le nombre de comptes est recompté
+                self.comptes.recompter()
+            print(f"✔ {len(self.comptes)} compte(s) répartis en {index['nombre_shards']} shards")
+        # Jusqu'à la prochaine fermeture propre, l'index n'est plus à jour
+        self.__ecrire_index(propre=False)
+        return self.comptes
+
+    def __lire_index(self):
+        if not os.path.exists(self.index):
+            return None
+        try:
+            with open(self.index, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except json.JSONDecodeError as e:
+            print(f"❌ Index des shards illisible, recomptage : {e}")
+            return {"nombre_shards": self.__nombre_shards, "nombre_comptes": 0}
+
+    def __ecrire_index(self, propre, statistiques=None):
+        os.makedirs(self.dossier, exist_ok=True)
+        index = {
+            "nombre_shards": self.comptes.nombre_shards,
+            "nombre_comptes": len(self.comptes),
+            "propre": propre,
+        }
+        if statistiques is not None:
+            index["statistiques"] = statistiques
+        with FileManager.ecriture_atomique(self.index) as f:
+            json.dump(index, f)
+
+    def __importer(self):
+        '''Répartit dans les shards les comptes du fichier de la banque'''
+        journal = Journal(os.path.splitext(self.fichier)[0] + EXTENSION_JOURNAL)
+        existants = FileManager.charger_comptes(self.fichier, journal)
+        journal.fermer()
+        comptes = ComptesShardes(self.dossier, self.__nombre_shards, self.__taille_cache)
+        shards = {}
+        for numero_compte, compte in existants.items():
+            shards.setdefault(comptes.indice(numero_compte), []).append(compte)
+        os.makedirs(self.dossier, exist_ok=True)
+        for indice, liste in shards.items():
+            FileManager.sauvegarder_comptes(comptes.fichier(indice), liste)
+        if existants:
+            print(f"✔ {len(existants)} compte(s) répartis en {self.__nombre_shards} shards")
+        return ComptesShardes(self.dossier, self.__nombre_shards, self.__taille_cache, len(existants))
+
+    def statistiques_sauvegardees(self):
+        return self.__statistiques
+
+    def ecrire(self, infos_comptes, suppressions, transactions=()):
+        self.ecrire_historique(suppressions, transactions)
+        self.comptes.ecrire(infos_comptes, suppressions)
+
+    def synchroniser(self):
+        self.comptes.synchroniser()
+
+    def compacter(self, comptes):
+        return self.comptes.compacter()
+
+    def replier(self):
+        return self.comptes.compacter()
+
+    def figer(self):
+        return self.comptes.figer()
+
+    def fermer(self, comptes, statistiques):
+        if self.comptes.compacter():
+            self.__ecrire_index(propre=True, statistiques=statistiques)
+        self.comptes.fermer()
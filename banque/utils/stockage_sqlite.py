@@ -0,0 +1,184 @@
+import os
+import sqlite3
+import threading
+from models.compte_bancaire import CompteBancaire
+from models.transaction import Transaction
+from utils.file_manager import FileManager
+from utils.historique import HistoriqueTransactions
+from utils.journal import Journal
+from utils.stockage import Stockage
+from config.constants import (
+    EXTENSION_JOURNAL, EXTENSION_SQLITE, DOSSIER_HISTORIQUE, TAILLE_PAGE_HISTORIQUE,
+    SYNCHRONISATION_DISQUE
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS comptes (
+    numero_compte TEXT PRIMARY KEY,
+    titulaire TEXT NOT NULL,
+    solde_centimes INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS transactions (
+    id INTEGER PRIMARY KEY,
+    numero_compte TEXT NOT NULL,
+    horodatage REAL NOT NULL,
+    code TEXT NOT NULL,
+    montant_centimes INTEGER NOT NULL,
+    solde_centimes INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS transactions_compte_date ON transactions (numero_compte, horodatage);
+"""
+
+# Requêtes constantes : sqlite3 garde leur forme préparée en cache
+SQL_MAJ_COMPTE = (
+    "INSERT INTO comptes (numero_compte, titulaire, solde_centimes) VALUES (?, ?, ?) "
+    "ON CONFLICT (numero_compte) DO UPDATE SET "
+    "titulaire = excluded.titulaire, solde_centimes = excluded.solde_centimes"
+)
+SQL_SUPPRIMER_COMPTE = "DELETE FROM comptes WHERE numero_compte = ?"
+SQL_SUPPRIMER_HISTORIQUE = "DELETE FROM transactions WHERE numero_compte = ?"
+SQL_AJOUTER_TRANSACTION = (
+    "INSERT INTO transactions (numero_compte, horodatage, code, montant_centimes, solde_centimes) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+SQL_LIRE_COMPTES = "SELECT titulaire, numero_compte, solde_centimes FROM comptes ORDER BY rowid"
+SQL_LIRE_HISTORIQUE = (
+    "SELECT id, code, montant_centimes, horodatage, solde_centimes FROM transactions "
+    "WHERE numero_compte = ? AND horodatage BETWEEN ? AND ? AND (horodatage, id) > (?, ?) "
+    "AND code != '" + Transaction.OUVERTURE + "' ORDER BY horodatage, id LIMIT ?"
+)
+SQL_SOLDE_AU = (
+    "SELECT solde_centimes FROM transactions WHERE numero_compte = ? AND horodatage <= ? "
+    "ORDER BY horodatage DESC, id DESC LIMIT 1"
+)
+SQL_PREMIERE_TRANSACTION = (
+    "SELECT code, montant_centimes, horodatage, solde_centimes FROM transactions "
+    "WHERE numero_compte = ? ORDER BY horodatage, id LIMIT 1"
+)
+
+
+class HistoriqueSqlite:
+    '''Historique des transactions dans la table transactions (même interface que HistoriqueTransactions)'''
+
+    def __init__(self, connexion, verrou):
+        self.__connexion = connexion
+        self.__verrou = verrou
+
+    def parcourir(self, numero_compte, debut=None, fin=None, taille_page=TAILLE_PAGE_HISTORIQUE):
+        '''Parcourt les transactions du compte, éventuellement entre deux dates (datetime).
+        Lecture par pages sur l'index (numéro, date) : la mémoire reste bornée.'''
+        debut = debut.timestamp() if debut else float('-inf')
+        fin = fin.timestamp() if fin else float('inf')
+        dernier = (float('-inf'), 0)
+        while True:
+            with self.__verrou:
+                lignes = self.__connexion.execute(
+                    SQL_LIRE_HISTORIQUE, (numero_compte, debut, fin, *dernier, taille_page)
+                ).fetchall()
+            for identifiant, code, montant, horodatage, solde in lignes:
+                yield Transaction(code, montant, horodatage, solde)
+            if len(lignes) < taille_page:
+                return
+            dernier = (lignes[-1][3], lignes[-1][0])
+
+    def solde_au(self, numero_compte, date):
+        '''Solde du compte à la date (datetime) : une seule descente dans l'index (numéro, date).
+        Avant la première transaction : le solde qui la précède (0 avant l'ouverture).
+        None si le compte n'a aucune transaction.'''
+        with self.__verrou:
+            ligne = self.__connexion.execute(SQL_SOLDE_AU, (numero_compte, date.timestamp())).fetchone()
+            if ligne is not None:
+                return ligne[0]
+            premiere = self.__connexion.execute(SQL_PREMIERE_TRANSACTION, (numero_compte,)).fetchone()
+        return Transaction(*premiere).solde_avant() if premiere else None
+
+    def pages(self, numero_compte, taille_page=TAILLE_PAGE_HISTORIQUE, debut=None, fin=None):
+        '''Parcourt l'historique par pages de taille_page transactions'''
+        page = []
+        for transaction in self.parcourir(numero_compte, debut, fin, taille_page):
+            page.append(transaction)
+            if len(page) == taille_page:
+                yield page
+                page = []
+        if page:
+            yield page
+
+
+class StockageSqlite(Stockage):
+    '''Comptes et transactions dans une base SQLite (mode WAL) à côté du fichier de la banque.
+
+    Chaque écriture est une transaction SQL qui ne touche que les lignes
+    modifiées. Au premier démarrage, le fichier JSON et l'historique
+    existants sont importés dans la base.
+    '''
+
+    def __init__(self, fichier, durable=SYNCHRONISATION_DISQUE):
+        self.fichier = fichier
+        self.base = os.path.splitext(fichier)[0] + EXTENSION_SQLITE
+        dossier = os.path.dirname(self.base)
+        if dossier:
+            os.makedirs(dossier, exist_ok=True)
+        nouvelle = not os.path.exists(self.base)
+        # La connexion est partagée entre threads, sous self.__verrou
+        self.__verrou = threading.Lock()
+        self.__connexion = sqlite3.connect(self.base, check_same_thread=False)
+        self.__connexion.execute("PRAGMA journal_mode=WAL")
+        # FULL : chaque transaction validée survit aussi à une coupure de courant
+        self.__connexion.execute(f"PRAGMA synchronous={'FULL' if durable else 'NORMAL'}")
+        self.__connexion.executescript(SCHEMA)
+        self.historique = HistoriqueSqlite(self.__connexion, self.__verrou)
+        if nouvelle and os.path.exists(fichier):
+            self.__importer()
+
+    def __importer(self):
+        '''Copie dans la base les comptes du fichier JSON et leur historique'''
+        journal = Journal(os.path.splitext(self.fichier)[0] + EXTENSION_JOURNAL)
+        comptes = FileManager.charger_comptes(self.fichier, journal)
+        journal.fermer()
+        historique = HistoriqueTransactions(os.path.join(os.path.dirname(self.fichier), DOSSIER_HISTORIQUE))
+        transactions = (
+            (numero_compte, transaction)
+            for numero_compte in comptes
+            for transaction in historique.parcourir(numero_compte)
+        )
+        self.ecrire([compte.to_dict() for compte in comptes.values()], (), transactions)
+        print(f"✔ {len(comptes)} compte(s) importé(s) dans {self.base}")
+
+    def charger(self):
+        with self.__verrou:
+            lignes = self.__connexion.execute(SQL_LIRE_COMPTES).fetchall()
+        comptes = {}
+        for titulaire, numero_compte, solde in lignes:
+            comptes[numero_compte] = CompteBancaire(titulaire, numero_compte, solde)
+        print(f"✔ {len(comptes)} compte(s) chargé(s)")
+        return comptes
+
+    def ecrire(self, infos_comptes, suppressions, transactions=()):
+        with self.__verrou, self.__connexion:
+            self.__connexion.executemany(SQL_MAJ_COMPTE, (
+                (infos['numero_compte'], infos['titulaire'], infos['solde_centimes'])
+                for infos in infos_comptes
+            ))
+            self.__connexion.executemany(SQL_AJOUTER_TRANSACTION, (
+                (numero_compte, t.horodatage, t.code, t.montant_centimes, t.solde_centimes)
+                for numero_compte, t in transactions
+            ))
+            self.__connexion.executemany(SQL_SUPPRIMER_COMPTE, ((n,) for n in suppressions))
+            self.__connexion.executemany(SQL_SUPPRIMER_HISTORIQUE, ((n,) for n in suppressions))
+
+    def compacter(self, comptes):
+        '''Reporte le WAL dans la base'''
+        with self.__verrou:
+            self.__connexion.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return True
+
+    def replier(self):
+        return self.compacter(None)
+
+    def fermer(self, comptes, statistiques):
+        with self.__verrou:
+            try:
+                self.__connexion.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                self.__connexion.close()
+            except sqlite3.ProgrammingError:
+                pass  # Déjà fermée
@@ -1,3 +1,4 @@
+from models.montant import Montant
 from config.constants import SOLDE_MINIMUM
 
 
@@ -16,18 +17,10 @@ class Validators:
 
     @staticmethod
     def valider_solde(solde):
-        '''Valide qu'un solde est suffisant'''
-        try:
-            solde_float = float(solde)
-            return solde_float >= SOLDE_MINIMUM
-        except ValueError:
-            return False
+        '''Valide qu'un solde (en centimes) est suffisant'''
+        return Montant.est_valide(solde) and solde >= Montant.depuis_fcfa(SOLDE_MINIMUM)
 
     @staticmethod
     def valider_montant(montant):
-        '''Valide qu'un montant est positif'''
-        try:
-            montant_float = float(montant)
-            return montant_float > 0
-        except ValueError:
-            return False
\ No newline at end of file
+        '''Valide qu'un montant (en centimes) est un entier positif'''
+        return Montant.est_valide(montant) and montant > 0
\ No newline at end of file
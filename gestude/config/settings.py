@@ -24,3 +24,8 @@ MSG_SUCCESS = "✅"
 MSG_ERROR = "❌"
 MSG_WARNING = "⚠️"
 MSG_INFO = "ℹ️"
+
+# Sérialisation JSON : "auto" (orjson si installé), "orjson" ou "json"
+CODEC_JSON = "auto"
+# Au-delà de cette taille (octets), le fichier de données est décodé en flux
+SEUIL_LECTURE_EN_FLUX = 64 * 1024 * 1024
@@ -8,7 +8,8 @@ import json
 import os
 from typing import Dict, List
 from models.etudiant import Etudiant
-from config.settings import DATA_PATH, DATA_DIR, ENCODING
+from utils.codec_json import decoder, ecrire_objet, iterer_objet
+from config.settings import DATA_PATH, DATA_DIR, SEUIL_LECTURE_EN_FLUX
 
 
 class DataService:
@@ -24,6 +25,7 @@ class DataService:
     def charger_etudiants() -> List[Etudiant]:
         """
         Charge les étudiants depuis le fichier JSON.
+        Les gros fichiers sont décodés en flux, sans construire le dictionnaire complet.
 
         Returns:
             List[Etudiant]: Liste des étudiants chargés
@@ -34,11 +36,14 @@ class DataService:
             return []
 
         try:
-            with open(DATA_PATH, 'r', encoding=ENCODING) as fichier:
-                data = json.load(fichier)
+            with open(DATA_PATH, 'rb') as fichier:
+                if os.path.getsize(DATA_PATH) > SEUIL_LECTURE_EN_FLUX:
+                    paires = iterer_objet(fichier)
+                else:
+                    paires = decoder(fichier.read()).items()
                 etudiants = []
 
-                for matricule, info in data.items():
+                for matricule, info in paires:
                     etudiant = Etudiant.from_dict(matricule, info)
                     etudiants.append(etudiant)
 
@@ -54,7 +59,7 @@ class DataService:
     @staticmethod
     def sauvegarder_etudiants(etudiants: List[Etudiant]) -> bool:
         """
-        Sauvegarde les étudiants dans le fichier JSON.
+        Sauvegarde les étudiants dans le fichier JSON (compact).
 
         Args:
             etudiants: Liste des étudiants à sauvegarder
@@ -65,12 +70,8 @@ class DataService:
         DataService.assurer_dossier_data()
 
         try:
-            data = {}
-            for etudiant in etudiants:
-                data[etudiant.matricule] = etudiant.to_dict()
-
-            with open(DATA_PATH, 'w', encoding=ENCODING) as fichier:
-                json.dump(data, fichier, indent=4, ensure_ascii=False)
+            with open(DATA_PATH, 'wb') as fichier:
+                ecrire_objet(fichier, ((e.matricule, e.to_dict()) for e in etudiants))
 
             return True
 
@@ -0,0 +1,58 @@
+# ============================================================================
+# tests/test_codec_json.py
+# ============================================================================
+TEST_CODEC_JSON = """
+Tests unitaires pour le codec JSON
+"""
+import io
+import json
+import unittest
+from utils.codec_json import CODECS, ecrire_objet, iterer_objet, obtenir_codec
+
+
+class TestCodecJson(unittest.TestCase):
+    """Tests pour utils.codec_json"""
+
+    def setUp(self):
+        """Initialisation avant chaque test"""
+        self.data = {
+            "E001": {"nom": "Éboa", "prenom": "Hélène", "notes": [12.5, 18, 9.75]},
+            "E002": {"nom": "Mbarga", "prenom": "Paul", "notes": []},
+        }
+
+    def test_ecriture_compacte(self):
+        """Test d'une écriture compacte relisible"""
+        flux = io.BytesIO()
+        ecrire_objet(flux, self.data.items())
+        self.assertNotIn(b'\n', flux.getvalue())
+        self.assertEqual(json.loads(flux.getvalue()), self.data)
+
+    def test_lecture_en_flux(self):
+        """Test du décodeur en flux avec des blocs minuscules"""
+        for indent in (None, 4):
+            contenu = json.dumps(self.data, indent=indent, ensure_ascii=False).encode('utf-8')
+            for taille_bloc in (1, 5, 1024):
+                self.assertEqual(dict(iterer_objet(io.BytesIO(contenu), taille_bloc)), self.data)
+
+    def test_nombre_a_cheval(self):
+        """Test d'un nombre coupé par la limite d'un bloc"""
+        contenu = b'{"a": 12.5, "b": -1.25e+3, "c": 1234567}'
+        attendu = {"a": 12.5, "b": -1250.0, "c": 1234567}
+        for decalage in range(1, len(contenu)):
+            flux = io.BytesIO(b' ' * decalage + contenu)
+            self.assertEqual(dict(iterer_objet(flux, 32)), attendu)
+
+    def test_fichier_tronque(self):
+        """Test d'un fichier tronqué"""
+        with self.assertRaises(json.JSONDecodeError):
+            list(iterer_objet(io.BytesIO(b'{"E001": {"nom": "Eb'), 4))
+
+    def test_codec_inconnu(self):
+        """Test du choix de codec"""
+        self.assertIn(obtenir_codec("auto"), CODECS.values())
+        with self.assertRaises(ValueError):
+            obtenir_codec("yaml")
+
+
+if __name__ == '__main__':
+    unittest.main()
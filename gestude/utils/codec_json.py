@@ -0,0 +1,149 @@
+# ============================================================================
+# utils/codec_json.py
+# ============================================================================
+CODEC_JSON_DOC = """
+Sérialisation JSON compacte : codec accéléré (orjson) si disponible,
+bibliothèque standard sinon, et décodeur en flux pour les gros fichiers
+"""
+import codecs
+import json
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, Tuple
+from config.settings import CODEC_JSON
+
+try:
+    import orjson
+except ImportError:  # Dépendance facultative
+    orjson = None
+
+# json.dumps avec des options recrée un encodeur à chaque appel
+_ENCODEUR = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+
+def _encoder_standard(objet: Any) -> bytes:
+    """Encode en JSON compact UTF-8 avec la bibliothèque standard"""
+    return _ENCODEUR.encode(objet).encode('utf-8')
+
+
+# Codecs disponibles : nom -> (encoder, decoder)
+CODECS: Dict[str, Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]] = {
+    "json": (_encoder_standard, json.loads),
+}
+if orjson is not None:
+    CODECS["orjson"] = (orjson.dumps, orjson.loads)
+
+
+def obtenir_codec(nom: str = CODEC_JSON) -> Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]:
+    """
+    Retourne le codec demandé.
+
+    Args:
+        nom: "auto" (le plus rapide disponible), "orjson" ou "json"
+
+    Returns:
+        Tuple: (encoder, decoder)
+
+    Raises:
+        ValueError: Si le codec n'est pas disponible
+    """
+    if nom == "auto":
+        return CODECS.get("orjson", CODECS["json"])
+    if nom not in CODECS:
+        raise ValueError(f"Codec JSON indisponible : {nom}")
+    return CODECS[nom]
+
+
+encoder, decoder = obtenir_codec()
+
+
+def ecrire_objet(flux: BinaryIO, paires: Iterable[Tuple[str, Any]]) -> None:
+    """
+    Écrit un objet JSON compact à partir de paires (clé, valeur),
+    sans construire le dictionnaire complet.
+
+    Args:
+        flux: Fichier ouvert en écriture binaire
+        paires: Paires (clé, valeur) de l'objet
+    """
+    flux.write(b'{')
+    separateur = b''
+    for cle, valeur in paires:
+        flux.write(separateur + encoder(cle) + b':' + encoder(valeur))
+        separateur = b','
+    flux.write(b'}')
+
+
+def iterer_objet(flux: BinaryIO, taille_bloc: int = 1 << 16) -> Iterator[Tuple[str, Any]]:
+    """
+    Décodeur en flux : parcourt les paires (clé, valeur) de l'objet JSON
+    de premier niveau sans charger tout le fichier en mémoire.
+
+    Args:
+        flux: Fichier ouvert en lecture binaire
+        taille_bloc: Nombre d'octets lus à la fois
+
+    Yields:
+        Tuple[str, Any]: (clé, valeur décodée)
+
+    Raises:
+        json.JSONDecodeError: Si le fichier est mal formé ou tronqué
+    """
+    decodeur = json.JSONDecoder()
+    lecteur = codecs.getincrementaldecoder('utf-8')()
+    tampon = ''
+    position = 0
+    fin_fichier = False
+
+    def completer() -> None:
+        nonlocal tampon, position, fin_fichier
+        donnees = flux.read(taille_bloc)
+        fin_fichier = not donnees
+        tampon = tampon[position:] + lecteur.decode(donnees, final=fin_fichier)
+        position = 0
+
+    def sauter_blancs() -> None:
+        nonlocal position
+        while True:
+            while position < len(tampon) and tampon[position] in ' \t\r\n':
+                position += 1
+            if position < len(tampon) or fin_fichier:
+                return
+            completer()
+
+    def attendre(caracteres: str) -> str:
+        nonlocal position
+        sauter_blancs()
+        if position >= len(tampon) or tampon[position] not in caracteres:
+            raise json.JSONDecodeError(f"'{caracteres}' attendu", tampon, position)
+        position += 1
+        return tampon[position - 1]
+
+    def valeur() -> Any:
+        nonlocal position
+        sauter_blancs()
+        while True:
+            try:
+                objet, fin = decodeur.raw_decode(tampon, position)
+            except json.JSONDecodeError:
+                if fin_fichier:
+                    raise
+                completer()
+                continue
+            # Un nombre en fin de tampon peut continuer dans le bloc suivant,
+            # même décodé avant la fin : raw_decode("1.") ou ("1e+") donne 1
+            if len(tampon) - fin < 3 and not fin_fichier:
+                completer()
+                continue
+            position = fin
+            return objet
+
+    completer()
+    attendre('{')
+    sauter_blancs()
+    if position < len(tampon) and tampon[position] == '}':
+        return
+    while True:
+        cle = valeur()
+        attendre(':')
+        yield cle, valeur()
+        if attendre(',}') == '}':
+            return